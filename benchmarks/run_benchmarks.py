@@ -0,0 +1,380 @@
+"""
+Benchmarks of the scanner, the dependency tree parser, the git and update flows and the
+logging pipeline on a generated workspace, compared against stored baselines.
+
+    python -m benchmarks.run_benchmarks                   # default size, compare with the baseline
+    python -m benchmarks.run_benchmarks --size small --only scan_workspace parse_dependency_tree
+    python -m benchmarks.run_benchmarks --save-baseline   # after an intended change
+
+Exit code 1 when a benchmark's median is more than --tolerance slower than its baseline.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+from benchmarks.synthetic_workspace import (
+    add_git_repos, dependency_tree, dependency_tree_output, generate_workspace, write_stub_mvn,
+)
+from src.config import settings_reader
+from src.core.startup_history import startup_stats
+from src.utils.logger_setup import LoggerSetup, logger_setup
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.25
+
+SIZES = {
+    "small": {
+        "projects": 40, "modules": 2, "depth": 1, "git_repos": 2, "tree_breadth": 5, "tree_depth": 3,
+        "log_records": 5000, "mvn_latency": 0.0, "mvn_output_lines": 200, "runs": 3,
+    },
+    "default": {
+        "projects": 300, "modules": 2, "depth": 2, "git_repos": 8, "tree_breadth": 8, "tree_depth": 4,
+        "log_records": 50000, "mvn_latency": 0.05, "mvn_output_lines": 2000, "runs": 5,
+    },
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    runs: int
+    median: float
+    p95: float
+    min: float
+    max: float
+    detail: str = ""
+
+
+@contextmanager
+def override_config(**values):
+    """Runs the block with settings.toml values replaced, e.g. base_path of the synthetic workspace."""
+    previous = settings_reader._commands_cache
+    settings_reader._commands_cache = {**settings_reader._load_settings(), **values}
+    try:
+        yield
+    finally:
+        settings_reader._commands_cache = previous
+
+
+@contextmanager
+def stub_mvn_on_path(bin_dir):
+    previous = os.environ.get("PATH", "")
+    os.environ["PATH"] = bin_dir + os.pathsep + previous
+    try:
+        yield
+    finally:
+        os.environ["PATH"] = previous
+
+
+def measure(name, func, runs, reset=None, detail=None) -> BenchmarkResult:
+    """
+    Times runs calls of func; reset runs untimed before every call.
+    detail(last_result, median) describes the result, e.g. as a throughput.
+    """
+    durations, result = [], None
+    for _ in range(runs):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - started)
+    stats = startup_stats(durations)
+    return BenchmarkResult(
+        name, stats["count"], stats["median"], stats["p95"], stats["min"], stats["max"],
+        detail(result, stats["median"]) if detail else "",
+    )
+
+
+class BenchmarkSuite:
+    """
+    Generates the workspace of one size in work_dir and runs the benchmarks on it.
+    Every benchmark is a bench_<name> method returning a BenchmarkResult.
+    """
+
+    def __init__(self, work_dir, size="default", runs=None):
+        self.work_dir = work_dir
+        self.size = size
+        self.options = dict(SIZES[size])
+        self.runs = runs or self.options["runs"]
+        self.workspace = None
+
+    @classmethod
+    def benchmark_names(cls) -> list[str]:
+        return [name[len("bench_"):] for name in dir(cls) if name.startswith("bench_")]
+
+    def prepare(self):
+        options = self.options
+        self.workspace = generate_workspace(
+            os.path.join(self.work_dir, "workspace"), options["projects"], options["modules"], options["depth"],
+        )
+        add_git_repos(self.workspace, options["git_repos"], os.path.join(self.work_dir, "remotes"))
+        # Each library appears at one version only, so the update flow finds no conflicts and runs to the end
+        self.clean_tree_file = os.path.join(self.work_dir, "clean-tree.json")
+        with open(self.clean_tree_file, "w", encoding="utf-8") as f:
+            json.dump(dependency_tree(breadth=1, depth=1), f)
+        self.tree = dependency_tree(breadth=options["tree_breadth"], depth=options["tree_depth"])
+        self.tree_output = dependency_tree_output(self.tree)
+        self.bin_dir = os.path.join(self.work_dir, "bin")
+        write_stub_mvn(self.bin_dir, options["mvn_latency"], options["mvn_output_lines"], self.clean_tree_file)
+
+    def run(self, names=None) -> list[BenchmarkResult]:
+        if self.workspace is None:
+            self.prepare()
+        return [getattr(self, f"bench_{name}")() for name in names or self.benchmark_names()]
+
+    # ------------------ Benchmarks ------------------
+
+    def bench_scan_workspace(self) -> BenchmarkResult:
+        from src.core.project_scanner import find_spring_projects
+
+        def _scan():
+            with override_config(base_path=self.workspace.root, project_prefix=""):
+                return find_spring_projects()
+
+        def _detail(projects, median):
+            if projects != self.workspace.projects:
+                raise AssertionError(f"Scanner found {len(projects)} projects, expected {len(self.workspace.projects)}")
+            return f"{len(projects)} projects in {self.workspace.directories} directories"
+
+        return measure("scan_workspace", _scan, self.runs, detail=_detail)
+
+    def bench_scan_workspace_modules(self) -> BenchmarkResult:
+        from src.core.project_scanner import find_spring_projects
+
+        def _scan():
+            with override_config(base_path=self.workspace.root, project_prefix="", scan_stop_at_project_root=False):
+                return find_spring_projects()
+
+        return measure("scan_workspace_modules", _scan, self.runs,
+                       detail=lambda projects, median: f"{len(projects)} projects and modules")
+
+    def bench_parse_dependency_tree(self) -> BenchmarkResult:
+        from src.integration.maven.maven_conflict_checker import parse_dependency_tree
+        size_mb = len(self.tree_output) / 1024 / 1024
+        return measure(
+            "parse_dependency_tree", lambda: parse_dependency_tree(self.tree_output), self.runs,
+            detail=lambda conflicts, median: f"{size_mb:.1f} MB output, {len(conflicts)} conflicts, {size_mb / median:.1f} MB/s",
+        )
+
+    def bench_dependency_tree_stream(self) -> BenchmarkResult:
+        from src.integration.maven.dependency_tree_parser import find_dependency_conflicts
+        text = json.dumps(self.tree, indent=2)
+        return measure(
+            "dependency_tree_stream", lambda: find_dependency_conflicts(io.StringIO(text)), self.runs,
+            detail=lambda tree, median: f"{tree.nodes} nodes, {tree.nodes / median:.0f} nodes/s",
+        )
+
+    def bench_git_flows(self) -> BenchmarkResult:
+        from src.integration.git.git_flows import git_flow_finish, git_flow_start
+
+        def _flows():
+            for repo in self.workspace.git_repos:
+                if not git_flow_start(repo):
+                    raise AssertionError(f"git_flow_start failed for {repo}")
+                with open(os.path.join(repo, "pom.xml"), "a", encoding="utf-8") as f:
+                    f.write(f"<!-- bench {time.time_ns()} -->\n")
+                if not git_flow_finish(repo):
+                    raise AssertionError(f"git_flow_finish failed for {repo}")
+            return len(self.workspace.git_repos)
+
+        with override_config(send_to_remote=True):
+            return measure("git_flows", _flows, self.runs, reset=self._reset_branches,
+                           detail=lambda repos, median: f"start + finish with push, {repos} repositories")
+
+    def bench_quick_update_flow(self) -> BenchmarkResult:
+        from src.processor.process import quick_update_flow
+
+        def _update():
+            for repo in self.workspace.git_repos:
+                if not quick_update_flow(repo):
+                    raise AssertionError(f"quick_update_flow failed for {repo}")
+            return len(self.workspace.git_repos)
+
+        options = self.options
+        with override_config(send_to_remote=True, maven_mode="mvn", dependency_resolver="maven",
+                             conflict_cache_max_entries=0), stub_mvn_on_path(self.bin_dir):
+            return measure(
+                "quick_update_flow", _update, self.runs, reset=self._reset_branches,
+                detail=lambda repos, median: (
+                    f"{repos} repositories, stub mvn {options['mvn_latency']}s / {options['mvn_output_lines']} lines"
+                ),
+            )
+
+    def bench_quick_update_flow_replay(self) -> BenchmarkResult:
+        """The update flow on commands recorded once and replayed without their timing, i.e. its own overhead."""
+        from src.integration.command_recorder import command_recorder
+        from src.processor.process import quick_update_flow
+
+        trace_path = os.path.join(self.work_dir, "quick-update.jsonl.gz")
+
+        def _update():
+            for repo in self.workspace.git_repos:
+                if not quick_update_flow(repo):
+                    raise AssertionError(f"quick_update_flow failed for {repo}")
+            return len(self.workspace.git_repos)
+
+        with override_config(send_to_remote=True, maven_mode="mvn", dependency_resolver="maven",
+                             conflict_cache_max_entries=0), stub_mvn_on_path(self.bin_dir):
+            self._reset_branches()
+            command_recorder.record(trace_path)
+            try:
+                _update()
+            finally:
+                command_recorder.stop()
+
+            def _replay():
+                # Every replay serves the trace from its start
+                command_recorder.replay(trace_path, timing="none")
+
+            try:
+                return measure("quick_update_flow_replay", _update, self.runs, reset=_replay,
+                               detail=lambda repos, median: f"{repos} repositories, recorded commands without timing")
+            finally:
+                command_recorder.stop()
+
+    def bench_logging_throughput(self) -> BenchmarkResult:
+        records = self.options["log_records"]
+        log_dir = os.path.join(self.work_dir, "logging")
+
+        def _log():
+            setup = LoggerSetup(log_dir=log_dir)
+            for i in range(records):
+                setup.log_with_project(f"Downloaded artifact {i}", f"/ws/project-{i % 50}")
+            setup.stop()  # Includes writing out the queue
+            return records
+
+        return measure("logging_throughput", _log, self.runs,
+                       detail=lambda count, median: f"{count} records to 50 projects, {count / median:.0f} records/s")
+
+    # ------------------ Helper methods ------------------
+
+    def _reset_branches(self):
+        """
+        Deletes the update branches of the previous run, locally and on the remote. A new run
+        in the same minute creates the same name and git_flow_start never resets a branch.
+        """
+        for repo in self.workspace.git_repos:
+            subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, capture_output=True, check=True)
+            local_branches = subprocess.run(
+                ["git", "for-each-ref", "--format=%(refname:strip=2)", "refs/heads/automated"],
+                cwd=repo, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            if local_branches:
+                subprocess.run(["git", "branch", "-q", "-D", *local_branches], cwd=repo, capture_output=True, check=True)
+            branches = subprocess.run(
+                ["git", "for-each-ref", "--format=%(refname:strip=3)", "refs/remotes/origin/automated"],
+                cwd=repo, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            for branch in branches:
+                subprocess.run(["git", "push", "-q", "origin", "--delete", branch],
+                               cwd=repo, capture_output=True, check=True)
+
+
+def load_baseline(path=BASELINE_PATH) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results, size, path=BASELINE_PATH):
+    baseline = load_baseline(path)
+    sizes = baseline.setdefault("sizes", {})
+    entry = sizes.setdefault(size, {})
+    entry.update({
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "recorded_at": time.strftime("%Y-%m-%d"),
+    })
+    # A run of some benchmarks (--only) keeps the baselines of the others
+    entry.setdefault("results", {}).update({result.name: asdict(result) for result in results})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline_results, tolerance=DEFAULT_TOLERANCE) -> list[tuple]:
+    """
+    Compares medians with the baseline.
+
+    Returns:
+        list[tuple]: (name, baseline median, median, relative change) of every result that
+        is more than tolerance slower than its baseline.
+    """
+    regressions = []
+    for result in results:
+        baseline = baseline_results.get(result.name)
+        if not baseline or not baseline["median"]:
+            continue
+        change = result.median / baseline["median"] - 1
+        if change > tolerance:
+            regressions.append((result.name, baseline["median"], result.median, change))
+    return regressions
+
+
+def format_results(results, baseline_results) -> str:
+    lines = [f"{'benchmark':<26} {'median':>10} {'p95':>10} {'baseline':>10} {'change':>8}  detail"]
+    for result in results:
+        baseline = baseline_results.get(result.name)
+        baseline_text, change_text = "-", "-"
+        if baseline and baseline["median"]:
+            baseline_text = f"{baseline['median'] * 1000:.1f}ms"
+            change_text = f"{(result.median / baseline['median'] - 1) * 100:+.0f}%"
+        lines.append(
+            f"{result.name:<26} {result.median * 1000:>8.1f}ms {result.p95 * 1000:>8.1f}ms "
+            f"{baseline_text:>10} {change_text:>8}  {result.detail}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run_benchmarks", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--size", choices=sorted(SIZES), default="default")
+    parser.add_argument("--runs", type=int, help="Timed runs per benchmark, the size's default otherwise")
+    parser.add_argument("--only", nargs="+", choices=BenchmarkSuite.benchmark_names(), metavar="NAME",
+                        help=f"Benchmarks to run: {', '.join(BenchmarkSuite.benchmark_names())}")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown of a median against its baseline, 0.25 = 25%%")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline of the size")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="reporanger-bench-") as work_dir:
+        # Keeps the flows' project logs out of logs/
+        previous_log_dir = logger_setup.use_log_dir(os.path.join(work_dir, "logs"))
+        try:
+            suite = BenchmarkSuite(work_dir, args.size, args.runs)
+            print(f"Generating the {args.size} workspace in {work_dir}...", flush=True)
+            suite.prepare()
+            results = suite.run(args.only)
+        finally:
+            logger_setup.use_log_dir(previous_log_dir)
+
+    baseline_results = load_baseline().get("sizes", {}).get(args.size, {}).get("results", {})
+    print(format_results(results, baseline_results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"size": args.size, "results": [asdict(result) for result in results]}, f, indent=2)
+    if args.save_baseline:
+        save_baseline(results, args.size)
+        print(f"Baseline of size {args.size} saved to {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baseline_results, args.tolerance)
+    for name, baseline_median, median, change in regressions:
+        print(f"REGRESSION {name}: {baseline_median * 1000:.1f}ms -> {median * 1000:.1f}ms ({change * 100:+.0f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
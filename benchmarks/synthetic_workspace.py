@@ -0,0 +1,217 @@
+import json
+import os
+import random
+import stat
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+
+GROUP_ID = "com.example.bench"
+PROJECT_PREFIX = "svc-"
+# Every generated project and module depends on some of these, at different versions
+LIBRARIES = [(f"org.bench.lib{i}", f"lib-{i}") for i in range(40)]
+
+POM_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+{parent}  <groupId>{group_id}</groupId>
+  <artifactId>{artifact_id}</artifactId>
+  <version>1.0.0</version>
+  <packaging>{packaging}</packaging>
+  <properties>
+    <java.version>17</java.version>
+  </properties>
+{modules}  <dependencies>
+{dependencies}  </dependencies>
+</project>
+"""
+
+# Stand-in for mvn: sleeps, prints output lines, writes a dependency tree for
+# -DoutputFile and touches pom.xml for versions:* goals so git flows have a change to commit
+STUB_MVN_TEMPLATE = """#!{python}
+import os, sys, time
+LATENCY = {latency!r}
+OUTPUT_LINES = {output_lines!r}
+TREE_FILE = {tree_file!r}
+EXIT_CODE = {exit_code!r}
+
+time.sleep(LATENCY)
+args = sys.argv[1:]
+for arg in args:
+    if arg.startswith("-DoutputFile=") and TREE_FILE:
+        with open(TREE_FILE, "r", encoding="utf-8") as src, open(arg.split("=", 1)[1], "a", encoding="utf-8") as dst:
+            dst.write(src.read())
+if any(arg.startswith("versions:") for arg in args) and os.path.exists("pom.xml"):
+    with open("pom.xml", "a", encoding="utf-8") as f:
+        f.write("<!-- stub mvn update %d -->\\n" % time.time_ns())
+out = sys.stdout
+for i in range(OUTPUT_LINES):
+    out.write("[INFO] Downloaded from central: https://repo.maven.apache.org/maven2/org/bench/lib/%d/lib-%d.jar\\n" % (i, i))
+out.write("[INFO] BUILD SUCCESS\\n" if EXIT_CODE == 0 else "[ERROR] BUILD FAILURE\\n")
+sys.exit(EXIT_CODE)
+"""
+
+
+@dataclass
+class SyntheticWorkspace:
+    root: str
+    projects: dict = field(default_factory=dict)  # folder name -> path, what the scanner should find
+    directories: int = 0
+    git_repos: list = field(default_factory=list)
+
+
+def _dependencies_xml(rng, count, indent="    ") -> str:
+    lines = []
+    for group_id, artifact_id in rng.sample(LIBRARIES, count):
+        lines.append(
+            f"{indent}<dependency><groupId>{group_id}</groupId><artifactId>{artifact_id}</artifactId>"
+            f"<version>1.{rng.randrange(5)}.0</version></dependency>\n"
+        )
+    return "".join(lines)
+
+
+def write_pom(path, artifact_id, module_names=(), parent_artifact_id=None, dependencies=""):
+    parent = ""
+    if parent_artifact_id:
+        parent = (
+            f"  <parent>\n    <groupId>{GROUP_ID}</groupId>\n    <artifactId>{parent_artifact_id}</artifactId>\n"
+            f"    <version>1.0.0</version>\n  </parent>\n"
+        )
+    modules = ""
+    if module_names:
+        modules = "  <modules>\n" + "".join(f"    <module>{name}</module>\n" for name in module_names) + "  </modules>\n"
+    with open(os.path.join(path, "pom.xml"), "w", encoding="utf-8") as f:
+        f.write(POM_TEMPLATE.format(
+            parent=parent, group_id=GROUP_ID, artifact_id=artifact_id,
+            packaging="pom" if module_names else "jar", modules=modules, dependencies=dependencies,
+        ))
+
+
+def _write_module_tree(path, artifact_id, rng, modules, depth, clutter_files) -> int:
+    """Writes a project or module with its nested modules, returns the number of directories created."""
+    os.makedirs(path, exist_ok=True)
+    created = 1
+    module_names = [f"{artifact_id}-m{i}" for i in range(modules)] if depth > 0 else []
+    write_pom(path, artifact_id, module_names, dependencies=_dependencies_xml(rng, rng.randrange(3, 8)))
+    for name in module_names:
+        created += _write_module_tree(os.path.join(path, name), name, rng, modules, depth - 1, clutter_files)
+
+    # Build output the scanner has to skip
+    classes = os.path.join(path, "target", "classes", *GROUP_ID.split("."))
+    os.makedirs(classes, exist_ok=True)
+    created += 2 + len(GROUP_ID.split("."))
+    for i in range(clutter_files):
+        with open(os.path.join(classes, f"Generated{i}.class"), "wb") as f:
+            f.write(b"\xca\xfe\xba\xbe" + bytes(64))
+    return created
+
+
+def generate_workspace(root, projects=200, modules=3, depth=2, clutter_files=5, groups=10, seed=1) -> SyntheticWorkspace:
+    """
+    Writes a workspace of Maven projects below root, spread over groups folders. Every
+    project is a multi-module build modules wide and depth levels deep with target/
+    folders, next to folders without a pom.xml (docs/, node_modules/) the scanner skips.
+
+    Returns:
+        SyntheticWorkspace: The projects the scanner should find and the number of directories.
+    """
+    rng = random.Random(seed)
+    workspace = SyntheticWorkspace(os.path.normpath(root))
+    for i in range(projects):
+        group = os.path.join(workspace.root, f"group-{i % groups}")
+        name = f"{PROJECT_PREFIX}{i:05d}"
+        project_path = os.path.join(group, name)
+        workspace.directories += _write_module_tree(project_path, name, rng, modules, depth, clutter_files)
+        workspace.projects[name] = project_path
+        if i % 10 == 0:
+            node_modules = os.path.join(group, f"frontend-{i}", "node_modules", "left-pad", "lib")
+            os.makedirs(node_modules, exist_ok=True)
+            workspace.directories += 4
+    os.makedirs(os.path.join(workspace.root, "docs", "adr"), exist_ok=True)
+    workspace.directories += 2
+    return workspace
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=bench@example.com", "-c", "user.name=bench", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
+
+
+def init_git_repo(project_path, remotes_dir) -> str:
+    """
+    Turns a generated project into a git repository on main with a bare "origin" remote
+    in remotes_dir that has the initial commit, like a fresh clone.
+
+    Returns:
+        str: Path of the bare remote.
+    """
+    origin = os.path.join(remotes_dir, os.path.basename(project_path) + ".git")
+    _git(remotes_dir, "init", "-q", "--bare", "-b", "main", origin)
+    _git(project_path, "init", "-q", "-b", "main")
+    with open(os.path.join(project_path, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write("target/\n")
+    _git(project_path, "add", "-A")
+    _git(project_path, "commit", "-q", "-m", "init")
+    _git(project_path, "remote", "add", "origin", origin)
+    _git(project_path, "push", "-q", "-u", "origin", "main")
+    _git(project_path, "config", "user.email", "bench@example.com")
+    _git(project_path, "config", "user.name", "bench")
+    return origin
+
+
+def add_git_repos(workspace, count, remotes_dir) -> list[str]:
+    """Makes the first count projects of the workspace git repositories with bare remotes."""
+    os.makedirs(remotes_dir, exist_ok=True)
+    for project_path in list(workspace.projects.values())[:count]:
+        init_git_repo(project_path, remotes_dir)
+        workspace.git_repos.append(project_path)
+    return workspace.git_repos
+
+
+def dependency_tree(artifact_id="svc", breadth=8, depth=4, seed=1) -> dict:
+    """
+    A dependency tree in the format of 'mvn dependency:tree -DoutputType=json'. Libraries
+    repeat across branches at different versions, so the tree contains conflicts.
+    """
+    rng = random.Random(seed)
+
+    def node(group_id, artifact, version, level):
+        children = []
+        if level < depth:
+            for group, child in rng.sample(LIBRARIES, breadth):
+                children.append(node(group, child, f"1.{rng.randrange(3)}.0", level + 1))
+        return {
+            "groupId": group_id, "artifactId": artifact, "version": version, "type": "jar",
+            "scope": "compile", "classifier": "", "optional": "false", "children": children,
+        }
+
+    return node(GROUP_ID, artifact_id, "1.0.0", 0)
+
+
+def dependency_tree_output(tree) -> str:
+    """The tree as Maven prints it to the console, every line prefixed with [INFO]."""
+    lines = ["[INFO] Scanning for projects...", "[INFO] --- dependency:3.6.1:tree (default-cli) ---"]
+    lines += [f"[INFO] {line}" for line in json.dumps(tree, indent=2).splitlines()]
+    lines.append("[INFO] BUILD SUCCESS")
+    return "\n".join(lines) + "\n"
+
+
+def write_stub_mvn(bin_dir, latency=0.0, output_lines=0, tree_file=None, exit_code=0) -> str:
+    """
+    Writes an executable 'mvn' into bin_dir that waits latency seconds and prints
+    output_lines lines. Put bin_dir first on PATH to have the Maven flows run it.
+
+    Returns:
+        str: Path of the stub.
+    """
+    os.makedirs(bin_dir, exist_ok=True)
+    path = os.path.join(bin_dir, "mvn")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(STUB_MVN_TEMPLATE.format(
+            python=sys.executable, latency=latency, output_lines=output_lines, tree_file=tree_file, exit_code=exit_code,
+        ))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
-from src.ui.main_app import Main
+import sys
+
+from src.cli import main
 
 
 if __name__ == "__main__":
-    Main().run()
+    sys.exit(main())
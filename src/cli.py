@@ -0,0 +1,191 @@
+import argparse
+import sys
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="reporanger",
+        description="Runs the RepoRanger UI, or a headless command when one is given.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    deps = subparsers.add_parser(
+        "deps",
+        help="Find projects declaring a dependency",
+        description="Queries the dependency index, e.g. 'spring-boot-starter-parent:3.1' or 'jackson-databind<2.15'.",
+    )
+    deps.add_argument("query", help="artifactId or groupId:artifactId pattern, optionally with :version or <, <=, >, >=, ==, !=")
+    deps.set_defaults(handler=_run_deps)
+
+    logs = subparsers.add_parser(
+        "logs",
+        help="Search the log files",
+        description="Searches logs/*.log, rotated files included, e.g. 'Command failed' --level ERROR.",
+    )
+    logs.add_argument("query", help="Text to look for, a regular expression with --regex")
+    logs.add_argument("--project", help="Only the log of this project, all logs by default")
+    logs.add_argument("--level", help="Only lines of this level or a more severe one, e.g. WARNING")
+    logs.add_argument("--regex", action="store_true", help="Treat the query as a regular expression")
+    logs.add_argument("-i", "--ignore-case", action="store_true", help="Case-insensitive matching")
+    logs.add_argument("--limit", type=int, default=1000, help="Maximum number of matches (default: 1000)")
+    logs.set_defaults(handler=_run_logs)
+
+    benchmark = subparsers.add_parser(
+        "benchmark-start",
+        help="Measure the startup time of a Spring Boot project",
+        description="Starts a project several times and reports the median and p95 time until it is ready.",
+    )
+    benchmark.add_argument("project", help="Project name, as listed in the UI")
+    benchmark.add_argument("--runs", type=int, help="Number of starts (default: benchmark_runs in settings.toml)")
+    benchmark.add_argument("--timeout", type=float, help="Seconds a start may take before it counts as failed")
+    benchmark.set_defaults(handler=_run_benchmark_start)
+
+    update = subparsers.add_parser(
+        "update",
+        help="Run the quick update flow without the UI",
+        description="Runs git flow start, Maven update, dependency check and git flow finish for the given projects.",
+    )
+    update.add_argument("projects", nargs="*", help="Project names, as listed in the UI")
+    update.add_argument("--all", action="store_true", help="Update every project found below base_path")
+    update.add_argument("--jobs", type=int, help="Projects updated at once (default: max_parallel_updates in settings.toml)")
+    update.add_argument("--reactor", action=argparse.BooleanOptionalAction, default=None,
+                        help="Run the Maven steps as one reactor build (default: maven_reactor_mode in settings.toml)")
+    update.add_argument("--report", help="Write a JSON report with per-project and per-step durations to this file")
+    trace = update.add_mutually_exclusive_group()
+    trace.add_argument("--record", metavar="TRACE", help="Record every git and Maven command of the run to this trace file")
+    trace.add_argument("--replay", metavar="TRACE", help="Serve git and Maven commands from a recorded trace instead of running them")
+    update.add_argument("--replay-timing", choices=["original", "none"], default="original",
+                        help="Replayed commands take their recorded time (original) or return at once (none)")
+    update.set_defaults(handler=_run_update)
+    return parser
+
+
+def _run_deps(args) -> int:
+    from src.core.dependency_index import dependency_index, format_usages
+    from src.core.project_index import project_index
+
+    project_index.refresh()
+    dependency_index.refresh(project_index.load())
+    try:
+        usages = dependency_index.query(args.query)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(format_usages(usages))
+    return 0 if usages else 1
+
+
+def _run_logs(args) -> int:
+    import re
+    from src.core.log_search import format_matches, search_logs
+
+    try:
+        matches = search_logs(args.query, args.project, args.level, args.regex, args.ignore_case, args.limit)
+    except (ValueError, re.error) as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(format_matches(matches, args.limit))
+    return 0 if matches else 1
+
+
+def _run_benchmark_start(args) -> int:
+    from src.core.project_index import project_index
+    from src.core.startup_history import format_startup_stats, startup_history
+    from src.processor.startup_benchmark import benchmark_start
+
+    project_index.refresh()
+    project_path = project_index.load().get(args.project)
+    if not project_path:
+        print(f"Unknown project: {args.project}", file=sys.stderr)
+        return 2
+    try:
+        benchmark = benchmark_start(project_path, args.runs, args.timeout, on_progress=print)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(benchmark.format())
+    print(format_startup_stats(args.project, startup_history.stats(args.project)))
+    return 0 if not benchmark.failures else 1
+
+
+def _run_update(args) -> int:
+    import json
+    import threading
+    import time
+    from src.config.settings_reader import get_config
+    from src.core.project_scanner import find_spring_projects
+    from src.processor.update_all import (
+        build_report, get_max_parallel_updates, run_update_all, run_update_all_reactor, summarize_results,
+    )
+
+    if args.all == bool(args.projects):
+        print("Give either project names or --all", file=sys.stderr)
+        return 2
+    found = find_spring_projects()
+    if args.all:
+        projects_map = found
+    else:
+        unknown = [name for name in args.projects if name not in found]
+        if unknown:
+            print(f"Unknown project(s): {', '.join(unknown)}", file=sys.stderr)
+            return 2
+        projects_map = {name: found[name] for name in args.projects}
+    if not projects_map:
+        print("No projects found, check base_path in config/settings.toml", file=sys.stderr)
+        return 2
+
+    reactor = get_config("maven_reactor_mode", False) if args.reactor is None else args.reactor
+    workers = args.jobs or get_max_parallel_updates()
+    run = run_update_all_reactor if reactor else run_update_all
+    stop_event = threading.Event()
+    outcome = {}
+
+    def _print_result(result):
+        line = f"{result.status:<8} {result.project_name} ({result.duration:.1f}s)"
+        print(line + (f": {result.error}" if result.error else ""), flush=True)
+
+    def _update():
+        outcome["results"] = run(projects_map, workers, stop_event, on_result=_print_result)
+
+    if args.record or args.replay:
+        from src.integration.command_recorder import command_recorder
+        if args.record:
+            command_recorder.record(args.record)
+        else:
+            try:
+                command_recorder.replay(args.replay, args.replay_timing)
+            except (OSError, ValueError) as e:
+                print(f"Trace could not be read: {e}", file=sys.stderr)
+                return 2
+
+    print(f"Updating {len(projects_map)} project(s) with {workers} job(s)", flush=True)
+    started_at = time.time()
+    worker = threading.Thread(target=_update, name="update-cli")
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.5)
+    except KeyboardInterrupt:
+        print("Interrupted, waiting for the running projects to finish...", file=sys.stderr, flush=True)
+        stop_event.set()
+        worker.join()
+    results = outcome.get("results", [])
+    if args.record or args.replay:
+        command_recorder.stop()
+
+    summary = summarize_results(results)
+    print(", ".join(f"{count} {status}" for status, count in summary.items()))
+    if args.report:
+        report = build_report(results, started_at, time.time(), "reactor" if reactor else "per-project", workers)
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0 if results and summary["success"] == len(results) else 1
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        from src.ui.main_app import Main
+        Main().run()
+        return 0
+    return args.handler(args)
@@ -0,0 +1,204 @@
+import fnmatch
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, asdict
+
+from src.core.project_index import CACHE_DIR, hash_file
+from src.integration.maven.local_repository import compare_versions
+from src.integration.maven.pom_reader import interpolate, walk_project_poms
+from src.utils.logger_setup import global_logger as logger
+
+
+INDEX_VERSION = 1
+DEPENDENCY_INDEX_PATH = os.path.join(CACHE_DIR, "dependency_index.json")
+# "pattern", "pattern:version", "pattern<version", "pattern >= version", ...
+QUERY = re.compile(r"^\s*(?P<pattern>[^<>=!\s]+?)(?:\s*(?P<operator><=|>=|==|!=|<|>|=)\s*(?P<version>\S+))?\s*$")
+OPERATORS = {
+    "<": lambda c: c < 0, "<=": lambda c: c <= 0,
+    ">": lambda c: c > 0, ">=": lambda c: c >= 0,
+    "==": lambda c: c == 0, "!=": lambda c: c != 0,
+}
+
+
+@dataclass
+class DependencyUsage:
+    project_name: str
+    kind: str  # "project", "parent", "dependency" or "managed"
+    group_id: str
+    artifact_id: str
+    version: str | None
+    pom_path: str
+
+    @property
+    def coordinates(self) -> str:
+        return f"{self.group_id}:{self.artifact_id}:{self.version or '?'}"
+
+
+def _pom_artifacts(project_name, pom_path, model, properties) -> list[dict]:
+    """Every groupId:artifactId:version a pom.xml declares, versions interpolated where possible."""
+    def _usage(kind, group_id, artifact_id, version):
+        return asdict(DependencyUsage(
+            project_name, kind,
+            interpolate(group_id, properties, model),
+            interpolate(artifact_id, properties, model),
+            interpolate(version, properties, model),
+            pom_path,
+        ))
+
+    artifacts = [_usage("project", model["groupId"], model["artifactId"], model["version"])]
+    parent = model["parent"]
+    if parent:
+        artifacts.append(_usage("parent", parent["groupId"], parent["artifactId"], parent["version"]))
+    for kind, dependencies in (("managed", model["dependencyManagement"]), ("dependency", model["dependencies"])):
+        for dependency in dependencies:
+            artifacts.append(_usage(kind, dependency["groupId"], dependency["artifactId"], dependency["version"]))
+    return artifacts
+
+
+def parse_query(text) -> tuple[str, str | None, str | None]:
+    """
+    Splits a query into (pattern, operator, version).
+
+    'jackson-databind<2.15' -> ('jackson-databind', '<', '2.15')
+    'org.springframework.boot:spring-boot-starter-parent:3.1' and 'spring-boot-starter-parent:3.1'
+    -> (..., '=', '3.1'), a version prefix matching 3.1.0 and 3.1.5 but not 3.10.0.
+    """
+    match = QUERY.match(text or "")
+    if not match:
+        raise ValueError(f"Invalid dependency query: {text!r}")
+    pattern, operator, version = match.group("pattern", "operator", "version")
+    if operator is None and (pattern.count(":") == 2 or re.search(r":\d[^:]*$", pattern)):
+        pattern, version = pattern.rsplit(":", 1)
+        operator = "="
+    return pattern, operator, version
+
+
+def _matches_pattern(usage, pattern) -> bool:
+    group_artifact = f"{usage['group_id']}:{usage['artifact_id']}"
+    if ":" in pattern:
+        return fnmatch.fnmatchcase(group_artifact, pattern)
+    return fnmatch.fnmatchcase(usage["artifact_id"] or "", pattern)
+
+
+def _matches_version(version, operator, wanted) -> bool:
+    if operator is None:
+        return True
+    if not version or "${" in version:
+        return False  # Unknown versions only match plain artifact queries
+    if operator == "=":
+        return version == wanted or version.startswith((wanted + ".", wanted + "-"))
+    return OPERATORS[operator](compare_versions(version, wanted))
+
+
+class DependencyIndex:
+    """
+    Persisted groupId:artifactId:version declarations of every project (parent, dependencies,
+    dependencyManagement, modules included), kept in cache/dependency_index.json.
+
+    A project is parsed again only when the hash of one of its pom.xml files changed.
+    """
+
+    def __init__(self, index_path=DEPENDENCY_INDEX_PATH):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.projects = {}
+        self.loaded = False
+
+    def refresh(self, projects_map) -> int:
+        """
+        Brings the index in line with projects_map (project name -> path).
+
+        Returns:
+            int: Number of projects that were (re)indexed or removed.
+        """
+        with self.lock:
+            if not self.loaded:
+                self._read()
+                self.loaded = True
+
+            changed = 0
+            for project_name in list(self.projects):
+                if project_name not in projects_map:
+                    del self.projects[project_name]
+                    changed += 1
+
+            for project_name, project_path in projects_map.items():
+                entry = self.projects.get(project_name)
+                if entry and entry["path"] == project_path and self._hashes_match(entry["poms"]):
+                    continue
+                self.projects[project_name] = self._index_project(project_name, project_path)
+                changed += 1
+
+            if changed or not os.path.exists(self.index_path):
+                self._write()
+            if changed:
+                logger.debug(f"Dependency index updated {changed} projects")
+            return changed
+
+    def query(self, text) -> list[DependencyUsage]:
+        """
+        Finds declarations matching a query such as 'spring-boot-starter-parent:3.1',
+        'com.fasterxml.jackson.core:jackson-databind<2.15' or 'jackson-*'.
+        A pattern without ':' matches the artifactId, fnmatch wildcards are allowed.
+        """
+        pattern, operator, version = parse_query(text)
+        with self.lock:
+            usages = [
+                usage
+                for entry in self.projects.values()
+                for usage in entry["artifacts"]
+                if _matches_pattern(usage, pattern) and _matches_version(usage["version"], operator, version)
+            ]
+        return [DependencyUsage(**usage) for usage in sorted(usages, key=lambda u: (u["project_name"], u["pom_path"]))]
+
+    # ------------------ Helper methods ------------------
+
+    def _hashes_match(self, poms) -> bool:
+        return all(hash_file(pom_path) == pom_hash for pom_path, pom_hash in poms.items())
+
+    def _index_project(self, project_name, project_path) -> dict:
+        root_pom = os.path.join(project_path, "pom.xml")
+        # The root pom is always tracked, so a project becomes readable again once it is fixed
+        poms = {root_pom: hash_file(root_pom)}
+        artifacts = []
+        for pom_path, model, properties in walk_project_poms(root_pom):
+            poms[pom_path] = hash_file(pom_path)
+            artifacts.extend(_pom_artifacts(project_name, pom_path, model, properties))
+        return {"path": project_path, "poms": poms, "artifacts": artifacts}
+
+    def _read(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dependency index could not be read, it will be rebuilt: {e}")
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.projects = data.get("projects", {})
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "projects": self.projects}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Dependency index could not be written: {e}")
+
+
+def format_usages(usages) -> str:
+    if not usages:
+        return "No matching dependencies."
+    projects = {usage.project_name for usage in usages}
+    lines = [f"{len(usages)} match(es) in {len(projects)} project(s)"]
+    for usage in usages:
+        lines.append(f"  {usage.project_name:<30} {usage.kind:<10} {usage.coordinates}")
+    return "\n".join(lines)
+
+
+dependency_index = DependencyIndex()
@@ -0,0 +1,243 @@
+import glob
+import json
+import mmap
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+from src.core.project_index import CACHE_DIR
+from src.utils.logger_setup import global_logger as logger, logger_setup
+
+
+INDEX_VERSION = 1
+LOG_INDEX_PATH = os.path.join(CACHE_DIR, "log_index.json")
+# Lines are indexed in blocks of about this many bytes, each with the levels it contains
+INDEX_BLOCK_SIZE = 1024 * 1024
+LEVELS = {"DEBUG": 1, "INFO": 2, "WARNING": 4, "ERROR": 8, "CRITICAL": 16}
+# "2024-01-01 10:00:00,123 [ERROR] ...", see LOG_FORMAT in logger_setup
+LEVEL_HEADER = re.compile(rb"^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} \[([A-Z]+)\] ", re.MULTILINE)
+
+
+@dataclass
+class LogMatch:
+    path: str
+    line_number: int
+    offset: int
+    level: str | None
+    text: str
+
+    def __str__(self):
+        return f"{os.path.basename(self.path)}:{self.line_number}: {self.text}"
+
+
+def levels_from(level) -> int | None:
+    """Bit mask of the given level and every more severe one, None (no filter) for no level."""
+    if not level:
+        return None
+    level = level.upper()
+    if level not in LEVELS:
+        raise ValueError(f"Unknown log level: {level}, expected one of {', '.join(LEVELS)}")
+    return sum(bit for bit in LEVELS.values() if bit >= LEVELS[level])
+
+
+def _level_name(mask):
+    return next((name for name, bit in LEVELS.items() if bit == mask), None)
+
+
+def log_files(log_dir=None, project_name=None) -> list[str]:
+    """
+    Log files of a project, or of all projects, rotated ones (name.log.1 ...) included.
+    Oldest first, so matches come out in the order they were written.
+    """
+    log_dir = log_dir or logger_setup.log_dir
+    name = f"{glob.escape(project_name)}.log" if project_name else "*.log"
+
+    def _age(path):
+        suffix = path.rsplit(".log", 1)[1].lstrip(".")
+        return -int(suffix) if suffix.isdigit() else 0
+
+    paths = glob.glob(os.path.join(log_dir, name)) + glob.glob(os.path.join(log_dir, name + ".[0-9]*"))
+    return sorted(paths, key=lambda path: (os.path.basename(path).rsplit(".log", 1)[0], _age(path)))
+
+
+class LogSearchIndex:
+    """
+    Line-offset and level index of log files, kept in cache/log_index.json.
+
+    A file is split into blocks of about INDEX_BLOCK_SIZE bytes, starting on a line, stored as
+    [offset, first line number, mask of the levels logged in it]. Only the bytes appended since
+    the last refresh are scanned, so the index grows with the logs; a file that was rotated
+    (another inode) or truncated is indexed again. Searches skip blocks without a wanted level
+    and scan the others through mmap, a file is never read into memory as a whole.
+    """
+
+    def __init__(self, index_path=LOG_INDEX_PATH):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.files = {}
+        self.loaded = False
+
+    def refresh(self, paths) -> int:
+        """
+        Indexes the unindexed part of the given files and forgets files that are gone.
+
+        Returns:
+            int: Number of bytes scanned.
+        """
+        with self.lock:
+            if not self.loaded:
+                self._read()
+                self.loaded = True
+            scanned = 0
+            for path in list(self.files):
+                if not os.path.exists(path):
+                    del self.files[path]
+            for path in paths:
+                try:
+                    scanned += self._index_file(os.path.abspath(path))
+                except OSError as e:
+                    logger.warning(f"Log file could not be indexed: {path}: {e}")
+            if scanned:
+                self._write()
+            return scanned
+
+    def search(self, query, paths, level=None, regex=False, ignore_case=False, max_results=1000) -> list[LogMatch]:
+        """
+        Finds the lines of the given files containing query, oldest first.
+
+        Args:
+            query (str): Text to look for, a regular expression when regex is set.
+            paths (list[str]): Log files, see log_files().
+            level (str): Only lines of this level or a more severe one, e.g. "WARNING".
+                Continuation lines, such as tracebacks, have the level of the line they belong to.
+            max_results (int): The search stops after this many matches.
+        """
+        wanted = levels_from(level)
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        pattern = re.compile(query.encode() if regex else re.escape(query.encode()), flags)
+        self.refresh(paths)
+
+        matches = []
+        for path in paths:
+            entry = self.files.get(os.path.abspath(path))
+            if not entry or not entry["size"]:
+                continue
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                blocks = entry["blocks"]
+                for i, (start, first_line, mask) in enumerate(blocks):
+                    if wanted and not mask & wanted:
+                        continue
+                    end = blocks[i + 1][0] if i + 1 < len(blocks) else entry["size"]
+                    matches.extend(self._search_block(mm, path, pattern, wanted, start, end, first_line,
+                                                      max_results - len(matches)))
+                    if len(matches) >= max_results:
+                        return matches
+        return matches
+
+    # ------------------ Helper methods ------------------
+
+    def _index_file(self, path) -> int:
+        stat = os.stat(path)
+        identity = [stat.st_dev, stat.st_ino]
+        entry = self.files.get(path)
+        if not entry or entry["identity"] != identity or stat.st_size < entry["size"]:
+            entry = {"identity": identity, "size": 0, "lines": 0, "level": 0, "blocks": []}
+            self.files[path] = entry
+        if stat.st_size == entry["size"] or not stat.st_size:
+            return 0
+
+        start = entry["size"]
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Only complete lines are indexed, a line still being written is picked up next time
+            end = mm.rfind(b"\n", start) + 1
+            if end <= start:
+                return 0
+            blocks = entry["blocks"]
+            position = start
+            while position < end:
+                block_end = mm.find(b"\n", min(position + INDEX_BLOCK_SIZE, end) - 1) + 1 or end
+                data = mm[position:block_end]
+                if not blocks or position - blocks[-1][0] >= INDEX_BLOCK_SIZE:
+                    # Lines before the first header belong to the record of the previous block
+                    blocks.append([position, entry["lines"], entry["level"]])
+                for header in LEVEL_HEADER.finditer(data):
+                    entry["level"] = LEVELS.get(header.group(1).decode(), 0)
+                    blocks[-1][2] |= entry["level"]
+                entry["lines"] += data.count(b"\n")
+                position = block_end
+        entry["size"] = end
+        return end - start
+
+    def _search_block(self, mm, path, pattern, wanted, start, end, first_line, limit) -> list[LogMatch]:
+        matches = []
+        line_number, counted_to = first_line, start
+        position = start
+        while len(matches) < limit:
+            found = pattern.search(mm, position, end)
+            if not found:
+                break
+            line_start = mm.rfind(b"\n", start, found.start()) + 1 or start
+            line_end = mm.find(b"\n", found.start(), end)
+            line_end = end if line_end < 0 else line_end
+            line_number += mm[counted_to:line_start].count(b"\n")
+            counted_to = line_start
+            level = self._line_level(mm, line_start)
+            if not wanted or level & wanted:
+                text = mm[line_start:line_end].decode("utf-8", errors="replace").rstrip("\r")
+                matches.append(LogMatch(path, line_number + 1, line_start, _level_name(level), text))
+            position = line_end + 1
+        return matches
+
+    def _line_level(self, mm, line_start) -> int:
+        """Level of the record a line belongs to, continuation lines look back for its header."""
+        position = line_start
+        for _ in range(1000):
+            header = LEVEL_HEADER.match(mm, position)
+            if header:
+                return LEVELS.get(header.group(1).decode(), 0)
+            if position == 0:
+                break
+            position = mm.rfind(b"\n", 0, position - 1) + 1
+        return 0
+
+    def _read(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Log index could not be read, it will be rebuilt: {e}")
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.files = data.get("files", {})
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "files": self.files}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Log index could not be written: {e}")
+
+
+def search_logs(query, project_name=None, level=None, regex=False, ignore_case=False,
+                max_results=1000, log_dir=None) -> list[LogMatch]:
+    """Searches the log files of a project, or of all projects when project_name is None."""
+    return log_search_index.search(query, log_files(log_dir, project_name), level, regex, ignore_case, max_results)
+
+
+def format_matches(matches, max_results=None) -> str:
+    if not matches:
+        return "No matching log lines."
+    files = {match.path for match in matches}
+    more = " (limit reached)" if max_results and len(matches) >= max_results else ""
+    lines = [f"{len(matches)} match(es) in {len(files)} file(s){more}"]
+    lines.extend(str(match) for match in matches)
+    return "\n".join(lines)
+
+
+log_search_index = LogSearchIndex()
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from src.core.project_scanner import get_scan_options, scan_subtree
+from src.utils.logger_setup import global_logger as logger
+
+
+INDEX_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "cache")
+INDEX_PATH = os.path.join(CACHE_DIR, "project_index.json")
+# Coarsest directory mtime resolution we expect (FAT uses 2 seconds)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def hash_file(path) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _mtime_ns(path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_under(path, root) -> bool:
+    return path == root or path.startswith(root + os.sep)
+
+
+class ProjectIndex:
+    """
+    Persisted list of discovered projects (name, path, pom.xml mtime and hash).
+
+    The mtime of every directory the scanner listed is stored as well. A directory
+    mtime only changes when entries are added, removed or renamed inside it, so on
+    refresh only the subtrees below changed directories are scanned again.
+    """
+
+    def __init__(self, index_path=INDEX_PATH):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.options = None
+        self.dirs = {}
+        self.projects = {}
+        self.loaded = False
+
+    def load(self, options=None) -> dict:
+        """
+        Reads the index file and returns project name -> path without touching the workspace.
+        Returns an empty map when the index was built with different scan options.
+        """
+        options = options or get_scan_options()
+        with self.lock:
+            if not self.loaded:
+                self._read()
+                self.loaded = True
+            if options != self.options:
+                # Stale index, refresh() will run a full scan
+                self.dirs, self.projects = {}, {}
+                return {}
+            return self.projects_map()
+
+    def projects_map(self) -> dict:
+        return {name: entry["path"] for name, entry in self.projects.items()}
+
+    def snapshot(self) -> dict:
+        """Returns a copy of project name -> {path, pom_mtime, pom_hash}."""
+        with self.lock:
+            return dict(self.projects)
+
+    def directories(self) -> list[str]:
+        """Returns every directory the last scans listed."""
+        with self.lock:
+            return list(self.dirs)
+
+    def refresh(self, options=None) -> bool:
+        """
+        Validates the index against the file system and rescans changed subtrees.
+
+        Returns:
+            bool: True when the project list or any pom.xml changed.
+        """
+        options = options or get_scan_options()
+        with self.lock:
+            if not self.loaded:
+                self._read()
+                self.loaded = True
+
+            base_path = options.get("base_path")
+            if not base_path or not os.path.isdir(base_path):
+                changed = bool(self.projects)
+                self.options, self.dirs, self.projects = options, {}, {}
+            elif options != self.options:
+                logger.info("Project index missing or scan options changed, running full scan")
+                changed = self._full_scan(options)
+            else:
+                changed = self._rescan_changed_dirs()
+                changed = self._refresh_poms() or changed
+
+            if changed or not os.path.exists(self.index_path):
+                self._write()
+            return changed
+
+    # ------------------ Helper methods ------------------
+
+    def _full_scan(self, options) -> bool:
+        old_projects = self.projects
+        self.options, self.dirs, self.projects = options, {}, {}
+        self._scan(os.path.normpath(options["base_path"]), "", 0, old_projects)
+        return self.projects != old_projects
+
+    def _rescan_changed_dirs(self) -> bool:
+        changed_dirs = [
+            path for path, (mtime, _, _) in self.dirs.items()
+            if _mtime_ns(path) != mtime
+        ]
+        if not changed_dirs:
+            return False
+
+        # Only rescan the outermost changed directories, nested ones are covered by them.
+        # Sorted, parents come first, but not always right before their children: "/a/b-c"
+        # sorts between "/a/b" and "/a/b/x", so every root is checked
+        changed_dirs.sort()
+        roots = []
+        for path in changed_dirs:
+            if not any(_is_under(path, root) for root in roots):
+                roots.append(path)
+
+        old_projects = dict(self.projects)
+        for root in roots:
+            _, rel_path, depth = self.dirs[root]
+            self.dirs = {path: info for path, info in self.dirs.items() if not _is_under(path, root)}
+            self.projects = {
+                name: entry for name, entry in self.projects.items()
+                if not _is_under(entry["path"], root)
+            }
+            if os.path.isdir(root):
+                self._scan(root, rel_path, depth, old_projects)
+        logger.debug(f"Project index rescanned {len(roots)} changed subtrees")
+        return self.projects != old_projects
+
+    def _scan(self, path, rel_path, depth, old_projects):
+        visited = {}
+        found = scan_subtree(
+            path, rel_path, depth,
+            prefix=self.options["prefix"],
+            exclude=self.options["exclude"],
+            max_depth=self.options["max_depth"],
+            stop_at_project_root=self.options["stop_at_project_root"],
+            visited=visited,
+        )
+        # A directory changed within the timestamp granularity of this scan could change
+        # again without a new mtime, so it is treated as changed on the next refresh
+        racy_after = time.time_ns() - RACY_WINDOW_NS
+        for dir_path, (mtime, dir_rel_path, dir_depth) in visited.items():
+            if mtime >= racy_after:
+                visited[dir_path] = (None, dir_rel_path, dir_depth)
+        self.dirs.update(visited)
+        for name, project_path in found.items():
+            old_entry = old_projects.get(name)
+            if old_entry and old_entry["path"] == project_path:
+                self.projects[name] = old_entry
+            else:
+                self.projects[name] = self._project_entry(project_path)
+
+    def _refresh_poms(self) -> bool:
+        changed = False
+        for name, entry in self.projects.items():
+            pom_path = os.path.join(entry["path"], "pom.xml")
+            pom_mtime = _mtime_ns(pom_path)
+            if pom_mtime != entry["pom_mtime"]:
+                self.projects[name] = dict(entry, pom_mtime=pom_mtime, pom_hash=hash_file(pom_path))
+                changed = True
+        return changed
+
+    def _project_entry(self, project_path) -> dict:
+        pom_path = os.path.join(project_path, "pom.xml")
+        return {
+            "path": project_path,
+            "pom_mtime": _mtime_ns(pom_path),
+            "pom_hash": hash_file(pom_path),
+        }
+
+    def _read(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Project index could not be read, it will be rebuilt: {e}")
+            return
+
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.options = data.get("options")
+        self.dirs = {path: tuple(info) for path, info in data.get("dirs", {}).items()}
+        self.projects = data.get("projects", {})
+
+    def _write(self):
+        data = {
+            "version": INDEX_VERSION,
+            "options": self.options,
+            "dirs": self.dirs,
+            "projects": self.projects,
+        }
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Project index could not be written: {e}")
+
+
+project_index = ProjectIndex()
@@ -1,20 +1,99 @@
 import os
-import json
+import fnmatch
 
 from src.config.settings_reader import get_config
 
 
+# Directory name globs that never contain a project worth listing
+DEFAULT_SCAN_EXCLUDE = [".*", "target", "node_modules", "__pycache__", "build", "out"]
+
+
+def get_scan_options() -> dict:
+    return {
+        "base_path": get_config("base_path"),
+        "prefix": get_config("project_prefix") or "",
+        "exclude": get_config("scan_exclude", DEFAULT_SCAN_EXCLUDE),
+        "max_depth": get_config("scan_max_depth", 0),
+        "stop_at_project_root": get_config("scan_stop_at_project_root", True),
+    }
+
+
 def find_spring_projects() -> dict:
-    dev_path = get_config("base_path")
-    prefix = get_config("project_prefix") or ""
+    return scan_projects(**get_scan_options())
+
+
+def scan_projects(base_path, prefix="", exclude=None, max_depth=0, stop_at_project_root=True) -> dict:
+    """
+    Finds Maven projects (folders with a pom.xml) below base_path using os.scandir.
+
+    Args:
+        base_path (str): Folder to scan.
+        prefix (str): Only folders whose name starts with this prefix are listed.
+        exclude (list[str]): Globs matched against a directory name or its path relative to base_path.
+        max_depth (int): Deepest directory level to visit, 0 means unlimited.
+        stop_at_project_root (bool): Do not descend into a listed project (skips its modules).
 
+    Returns:
+        dict: folder name -> normalized project path.
+    """
+    if not base_path or not os.path.isdir(base_path):
+        return {}
+    return scan_subtree(os.path.normpath(base_path), "", 0, prefix, exclude, max_depth, stop_at_project_root)
+
+
+def scan_subtree(path, rel_path, depth, prefix="", exclude=None, max_depth=0, stop_at_project_root=True, visited=None) -> dict:
+    """
+    Scans the subtree rooted at path, which sits at rel_path/depth below the scan base.
+    When a visited dict is given it is filled with path -> (mtime_ns, rel_path, depth)
+    for every directory that was listed, so callers can detect changes later.
+    """
+    exclude = DEFAULT_SCAN_EXCLUDE if exclude is None else exclude
     projects_map = {}
-    for root, dirs, files in os.walk(dev_path):
-        if "pom.xml" in files:
-            folder_name = os.path.basename(root)
-            if folder_name.startswith(prefix):
-                normalized_root = os.path.normpath(root)
-                projects_map[folder_name] = normalized_root
+
+    stack = [(path, rel_path, depth)]
+    while stack:
+        path, rel_path, depth = stack.pop()
+        if visited is not None:
+            try:
+                visited[path] = (os.stat(path).st_mtime_ns, rel_path, depth)
+            except OSError:
+                continue
+        has_pom, subdirs = _scan_dir(path)
+
+        folder_name = os.path.basename(path)
+        if has_pom and folder_name.startswith(prefix):
+            projects_map[folder_name] = path
+            if stop_at_project_root:
+                continue
+
+        if max_depth and depth >= max_depth:
+            continue
+        for name in sorted(subdirs, reverse=True):
+            child_rel_path = f"{rel_path}/{name}" if rel_path else name
+            if _is_excluded(name, child_rel_path, exclude):
+                continue
+            stack.append((os.path.join(path, name), child_rel_path, depth + 1))
     return projects_map
 
 
+def _scan_dir(path):
+    has_pom = False
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name == "pom.xml" and entry.is_file():
+                        has_pom = True
+                except OSError:
+                    continue
+    except OSError:
+        # Unreadable folders are skipped like os.walk does
+        pass
+    return has_pom, subdirs
+
+
+def _is_excluded(name, rel_path, exclude):
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(rel_path, pattern) for pattern in exclude)
@@ -0,0 +1,102 @@
+import json
+import os
+import statistics
+import threading
+import time
+
+from src.core.project_index import CACHE_DIR
+from src.utils.logger_setup import global_logger as logger
+
+
+STARTUP_HISTORY_PATH = os.path.join(CACHE_DIR, "startup_history.json")
+MAX_RUNS = 100
+
+
+def startup_stats(durations) -> dict:
+    """Count, median, p95 (nearest rank), min and max of startup durations in seconds."""
+    durations = sorted(durations)
+    if not durations:
+        return {"count": 0, "median": None, "p95": None, "min": None, "max": None}
+    p95_rank = max(1, -(-95 * len(durations) // 100))
+    return {
+        "count": len(durations),
+        "median": statistics.median(durations),
+        "p95": durations[p95_rank - 1],
+        "min": durations[0],
+        "max": durations[-1],
+    }
+
+
+class StartupHistory:
+    """
+    Startup durations of every service, newest last, kept in cache/startup_history.json.
+
+    A run records the wall time from spawning 'mvn spring-boot:run' until the service was
+    ready, and the seconds Spring Boot itself reported, so a regression after a dependency
+    bump shows up next to the runs before it.
+    """
+
+    def __init__(self, history_path=STARTUP_HISTORY_PATH, max_runs=MAX_RUNS):
+        self.history_path = history_path
+        self.max_runs = max_runs
+        self.lock = threading.Lock()
+        self.services = {}
+        self.loaded = False
+
+    def record(self, service_name, seconds, reported_seconds=None):
+        with self.lock:
+            self._load()
+            runs = self.services.setdefault(service_name, [])
+            runs.append({"timestamp": time.time(), "seconds": round(seconds, 3), "reported_seconds": reported_seconds})
+            del runs[:-self.max_runs]
+            self._write()
+
+    def record_service(self, service):
+        """on_ready callback for the ServiceSupervisor."""
+        readiness = service.readiness
+        self.record(service.name, service.startup_seconds, readiness.reported_seconds if readiness else None)
+
+    def runs(self, service_name) -> list[dict]:
+        with self.lock:
+            self._load()
+            return list(self.services.get(service_name, []))
+
+    def stats(self, service_name, last=None) -> dict:
+        runs = self.runs(service_name)
+        return startup_stats(run["seconds"] for run in runs[-last if last else 0:])
+
+    # ------------------ Helper methods ------------------
+
+    def _load(self):
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                self.services = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Startup history could not be read, starting a new one: {e}")
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+        tmp_path = self.history_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.services, f)
+            os.replace(tmp_path, self.history_path)
+        except OSError as e:
+            logger.warning(f"Startup history could not be written: {e}")
+
+
+def format_startup_stats(service_name, stats) -> str:
+    if not stats["count"]:
+        return f"No recorded startups of {service_name}."
+    return (
+        f"{service_name}: {stats['count']} startup(s), median {stats['median']:.1f}s, "
+        f"p95 {stats['p95']:.1f}s, min {stats['min']:.1f}s, max {stats['max']:.1f}s"
+    )
+
+
+startup_history = StartupHistory()
@@ -0,0 +1,118 @@
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+from src.config.settings_reader import get_config
+from src.core.project_index import project_index
+from src.utils.inotify import IN_Q_OVERFLOW, TREE_EVENTS, Inotify
+from src.utils.logger_setup import global_logger as logger
+
+
+@dataclass
+class ProjectEvent:
+    kind: str  # "added", "removed" or "modified"
+    name: str
+    path: str
+
+
+def diff_projects(old: dict, new: dict) -> list[ProjectEvent]:
+    """Compares two ProjectIndex snapshots (name -> entry) and returns the project events."""
+    events = []
+    for name, entry in old.items():
+        new_entry = new.get(name)
+        if new_entry is None or new_entry["path"] != entry["path"]:
+            events.append(ProjectEvent("removed", name, entry["path"]))
+    for name, entry in new.items():
+        old_entry = old.get(name)
+        if old_entry is None or old_entry["path"] != entry["path"]:
+            events.append(ProjectEvent("added", name, entry["path"]))
+        elif old_entry.get("pom_hash") != entry.get("pom_hash"):
+            events.append(ProjectEvent("modified", name, entry["path"]))
+    return events
+
+
+def _is_tree_event(mask, name) -> bool:
+    return bool(mask & (TREE_EVENTS | IN_Q_OVERFLOW)) or name == "pom.xml"
+
+
+class WorkspaceWatcher:
+    """
+    Background watcher that reports added, removed and modified projects below base_path.
+
+    Events only trigger project_index.refresh(), which rescans the changed subtrees.
+    On Linux the directories known to the index are watched with inotify, elsewhere
+    (or when inotify is unavailable) the index is refreshed every poll_interval seconds.
+    """
+
+    def __init__(self, callback, index=project_index, options=None, poll_interval=None, debounce=0.3):
+        self.callback = callback
+        self.index = index
+        self.options = options
+        self.poll_interval = poll_interval or float(get_config("watch_poll_interval", 2.0))
+        self.debounce = debounce
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.known = {}
+
+    def start(self):
+        self.known = self.index.snapshot()
+        self.thread = threading.Thread(target=self._run, name="workspace-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def check(self):
+        """Refreshes the index and sends the project events since the last check to the callback."""
+        self.index.refresh(self.options)
+        current = self.index.snapshot()
+        events = diff_projects(self.known, current)
+        self.known = current
+        if events:
+            logger.debug(f"Workspace watcher detected {len(events)} project changes")
+            self.callback(events)
+
+    def _run(self):
+        try:
+            self.check()
+        except Exception as e:
+            logger.error(f"Workspace watcher initial check failed: {e}")
+
+        inotify = None
+        if sys.platform.startswith("linux"):
+            try:
+                inotify = Inotify()
+                inotify.sync_watches(self.index.directories())
+                # Catch changes made before the watches were in place
+                self.check()
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify unavailable, watching workspace by polling: {e}")
+                if inotify:
+                    inotify.close()
+                inotify = None
+
+        try:
+            while not self.stop_event.is_set():
+                if inotify:
+                    if not inotify.wait(self.poll_interval, _is_tree_event):
+                        continue
+                    # Let bursts (git checkout, mvn clean) settle before rescanning
+                    time.sleep(self.debounce)
+                    while inotify.wait(0, _is_tree_event):
+                        pass
+                elif self.stop_event.wait(self.poll_interval):
+                    break
+                self.check()
+                if inotify:
+                    try:
+                        inotify.sync_watches(self.index.directories())
+                    except OSError as e:
+                        logger.warning(f"inotify watches could not be updated, falling back to polling: {e}")
+                        inotify.close()
+                        inotify = None
+        except Exception as e:
+            logger.error(f"Workspace watcher stopped: {e}")
+        finally:
+            if inotify:
+                inotify.close()
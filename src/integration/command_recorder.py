@@ -0,0 +1,205 @@
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from src.config.settings_reader import get_config
+from src.integration.command_runner import CommandResult
+from src.utils.logger_setup import global_logger as logger
+
+
+TRACE_VERSION = 1
+TRACE_MODES = ("off", "record", "replay")
+REPLAY_TIMINGS = ("original", "none")
+# Placeholder of the n-th output file in recorded arguments, the real paths are temporary
+OUTPUT_FILE_PLACEHOLDER = "<output{}>"
+NOT_RECORDED_CODE = 127
+
+
+def _trace_args(args, output_files) -> list[str]:
+    """args with the output file paths replaced by placeholders, so a replay matches other temp paths."""
+    trace_args = []
+    for arg in args:
+        for index, path in enumerate(output_files):
+            if path in arg:
+                arg = arg.replace(path, OUTPUT_FILE_PLACEHOLDER.format(index))
+        trace_args.append(arg)
+    return trace_args
+
+
+def _command_name(args) -> tuple:
+    """Executable and first argument, e.g. ('git', 'checkout'), used when the exact arguments differ."""
+    return (os.path.basename(args[0]) if args else "", args[1] if len(args) > 1 else "")
+
+
+class CommandRecorder:
+    """
+    Records the git and Maven commands of a run to a trace file and serves them back later,
+    without the repositories, Maven or the network.
+
+    A trace is gzip-compressed JSON lines: a header, then one entry per command with its
+    arguments, cwd, exit code, stdout, stderr, wall time, start offset in the run and the
+    files it wrote (the dependency tree of 'mvn dependency:tree -DoutputFile=...').
+
+    A replay serves the entries of every cwd in recorded order, so parallel runs replay
+    deterministically. An entry matches when the arguments are equal, or when only they
+    differ in generated values (e.g. the timestamp of an update branch name) but the
+    command is the same. With timing "original" a replayed command takes as long as the
+    recorded one, with "none" it returns at once.
+
+    Mode, trace file and timing come from command_trace_mode, command_trace_file and
+    command_trace_timing in settings.toml, or from record() / replay().
+    """
+
+    def __init__(self):
+        self.mode = None  # Read from settings.toml on first use
+        self.path = None
+        self.timing = "original"
+        self.lock = threading.Lock()
+        self.trace_file = None
+        self.started = None
+        self.entries = {}  # cwd -> deque of recorded entries, while replaying
+        self.recorded = 0
+        self.replayed = 0
+
+    def record(self, path):
+        """Starts writing every command to the trace file at path."""
+        with self.lock:
+            self._close()
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.trace_file = gzip.open(path, "wt", encoding="utf-8")
+            self.trace_file.write(json.dumps({"version": TRACE_VERSION, "created": time.time()}) + "\n")
+            self.mode, self.path, self.started, self.recorded = "record", path, time.monotonic(), 0
+        atexit.register(self.stop)  # gzip writes its trailer on close, an unclosed trace is unreadable
+        logger.info(f"Recording git and Maven commands to {path}")
+
+    def replay(self, path, timing="original"):
+        """Serves the commands recorded in the trace file at path instead of running them."""
+        if timing not in REPLAY_TIMINGS:
+            raise ValueError(f"Unknown replay timing: {timing}, expected one of {', '.join(REPLAY_TIMINGS)}")
+        entries = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != TRACE_VERSION:
+                raise ValueError(f"Unsupported trace version {header.get('version')} in {path}")
+            for line in f:
+                entry = json.loads(line)
+                entries.setdefault(entry["cwd"], deque()).append(entry)
+        with self.lock:
+            self._close()
+            self.mode, self.path, self.timing, self.entries, self.replayed = "replay", path, timing, entries, 0
+        logger.info(f"Replaying {sum(len(e) for e in entries.values())} recorded commands from {path} (timing: {timing})")
+
+    def stop(self):
+        """Finishes the trace being recorded, or the replay. Commands run for real afterwards."""
+        with self.lock:
+            self._close()
+            self.mode = "off"
+
+    def run(self, runner, args, cwd=None, output_files=(), trace_cwd=None) -> CommandResult:
+        """
+        Runs args with runner (e.g. run_command_sync), records the result, or replays it.
+
+        Args:
+            runner (callable): Called as runner(args, cwd=cwd) when the command really runs.
+            args (list[str]): The command.
+            cwd (str): Working directory, replayed entries are looked up by it.
+            output_files (list[str]): Files the command writes, recorded and restored on replay.
+            trace_cwd (str): Recorded in place of cwd when cwd is temporary, e.g. "<reactor>".
+
+        Returns:
+            CommandResult: The result of the command, or the recorded one.
+        """
+        if self.mode is None:
+            self._configure()
+        if self.mode == "replay":
+            return self._replay(args, trace_cwd or cwd, output_files)
+        result = runner(args, cwd=cwd)
+        if self.mode == "record":
+            self._record(args, trace_cwd or cwd, output_files, result)
+        return result
+
+    # ------------------ Helper methods ------------------
+
+    def _configure(self):
+        mode = get_config("command_trace_mode", "off")
+        path = get_config("command_trace_file", "")
+        if mode not in TRACE_MODES:
+            logger.warning(f"Unknown command_trace_mode {mode}, commands are not recorded")
+            mode = "off"
+        if mode != "off" and not path:
+            logger.warning(f"command_trace_mode is {mode} but command_trace_file is empty, commands are not recorded")
+            mode = "off"
+        if mode == "record":
+            self.record(path)
+        elif mode == "replay":
+            self.replay(path, get_config("command_trace_timing", "original"))
+        else:
+            self.mode = "off"
+
+    def _record(self, args, cwd, output_files, result):
+        files = {}
+        for index, path in enumerate(output_files):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    files[str(index)] = f.read()
+            except OSError:
+                continue  # Not written, e.g. the command failed
+        entry = {
+            "args": _trace_args(args, output_files),
+            "cwd": os.path.normpath(cwd) if cwd else cwd,
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "duration": round(result.duration, 4),
+            "files": files,
+        }
+        with self.lock:
+            if self.trace_file is None:
+                return
+            entry["at"] = round(time.monotonic() - self.started - result.duration, 4)
+            self.trace_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self.recorded += 1
+
+    def _replay(self, args, cwd, output_files) -> CommandResult:
+        trace_args = _trace_args(args, output_files)
+        with self.lock:
+            entry = self._take_entry(cwd, trace_args)
+            self.replayed += entry is not None
+        if entry is None:
+            logger.warning(f"No recorded result for '{' '.join(args)}' in {cwd}")
+            return CommandResult(NOT_RECORDED_CODE, "", f"No recorded result for '{' '.join(args)}' in the trace {self.path}")
+
+        for index, content in entry["files"].items():
+            os.makedirs(os.path.dirname(os.path.abspath(output_files[int(index)])), exist_ok=True)  # e.g. a clean target/
+            with open(output_files[int(index)], "w", encoding="utf-8") as f:
+                f.write(content)
+        if self.timing == "original":
+            time.sleep(entry["duration"])
+        return CommandResult(entry["returncode"], entry["stdout"], entry["stderr"], entry["duration"])
+
+    def _take_entry(self, cwd, trace_args):
+        queue = self.entries.get(os.path.normpath(cwd) if cwd else cwd)
+        if not queue:
+            return None
+        for candidate in (lambda entry: entry["args"] == trace_args,
+                          lambda entry: _command_name(entry["args"]) == _command_name(trace_args)):
+            for entry in queue:
+                if candidate(entry):
+                    queue.remove(entry)
+                    return entry
+        return None
+
+    def _close(self):
+        if self.trace_file is not None:
+            self.trace_file.close()
+            self.trace_file = None
+            logger.info(f"Recorded {self.recorded} commands to {self.path}")
+        self.entries = {}
+
+
+command_recorder = CommandRecorder()
+run_recorded = command_recorder.run
@@ -0,0 +1,100 @@
+import asyncio
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+from src.config.settings_reader import get_config
+
+
+DEFAULT_MAX_CONCURRENT_COMMANDS = 16
+
+
+@dataclass
+class CommandResult:
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float = 0.0
+
+
+class CommandRunner:
+    """
+    Runs external commands with asyncio.create_subprocess_exec on one shared event loop.
+
+    The loop lives in a daemon thread and is started on first use. A semaphore limits how
+    many commands run at once (`max_concurrent_commands` in settings.toml), so any number
+    of callers can queue git or Maven commands without holding an OS thread per command
+    while the child process runs.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None):
+        self.max_concurrent = max_concurrent
+        self.loop = None
+        self.thread = None
+        self.semaphore = None
+        self.lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            if self.loop is None:
+                limit = self.max_concurrent or get_config("max_concurrent_commands", DEFAULT_MAX_CONCURRENT_COMMANDS)
+                self.loop = asyncio.new_event_loop()
+                self.semaphore = asyncio.Semaphore(max(1, int(limit)))
+                self.thread = threading.Thread(target=self.loop.run_forever, name="command-runner", daemon=True)
+                self.thread.start()
+            return self.loop
+
+    def submit(self, args: list[str], cwd=None, timeout=None) -> Future:
+        """Schedules a command on the runner loop and returns a concurrent.futures.Future."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._run(args, cwd, timeout), loop)
+
+    def run_sync(self, args: list[str], cwd=None, timeout=None) -> CommandResult:
+        """Blocking wrapper for the existing thread-based call sites."""
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("run_sync cannot be called from the command runner loop, use run_async")
+        return self.submit(args, cwd, timeout).result()
+
+    async def run_async(self, args: list[str], cwd=None, timeout=None) -> CommandResult:
+        """Awaitable from any event loop, including the runner loop itself."""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._run(args, cwd, timeout)
+        return await asyncio.wrap_future(self.submit(args, cwd, timeout))
+
+    async def _run(self, args, cwd, timeout) -> CommandResult:
+        async with self.semaphore:
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                _resolve_executable(args[0]),
+                *args[1:],
+                cwd=cwd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                stdout, stderr = await process.communicate()
+                stderr += f"\nCommand timed out after {timeout} seconds".encode()
+                return CommandResult(-9, _decode(stdout), _decode(stderr), time.monotonic() - started)
+            return CommandResult(process.returncode, _decode(stdout), _decode(stderr), time.monotonic() - started)
+
+
+def _resolve_executable(name: str) -> str:
+    # create_subprocess_exec does not use the shell, so mvn.cmd / git.exe are looked up here
+    return shutil.which(name) or name
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+command_runner = CommandRunner()
+run_command_sync = command_runner.run_sync
+run_command_async = command_runner.run_async
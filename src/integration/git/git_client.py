@@ -1,11 +1,54 @@
 import shlex
-import subprocess
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from src.integration.command_recorder import run_recorded
+from src.integration.command_runner import run_command_sync
+from src.integration.git import git_refs
 from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 
 
 
+class GitCommandCounter:
+    """Counts the git processes spawned while it is active, see count_git_commands."""
+
+    def __init__(self):
+        self.count = 0
+        self.commands = []
+
+    def record(self, git_command):
+        self.count += 1
+        self.commands.append(git_command)
+
+
+_active_counter: ContextVar = ContextVar("git_command_counter", default=None)
+
+
+@contextmanager
+def count_git_commands():
+    """
+    Counts every run_git_command call made in the current thread / task while the block runs.
+
+    Example:
+        with count_git_commands() as counter:
+            git_flow_start(repo_path)
+        print(counter.count, counter.commands)
+    """
+    counter = GitCommandCounter()
+    token = _active_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _active_counter.reset(token)
+
+
+def _record_git_command(git_command):
+    counter = _active_counter.get()
+    if counter is not None:
+        counter.record(git_command)
+
+
 def run_git_command(repo_path: str, git_command: str) -> tuple[int, str]:
     """
     Executes a Git command within the given Git repository and returns the result.
@@ -17,25 +60,42 @@ def run_git_command(repo_path: str, git_command: str) -> tuple[int, str]:
     Returns:
         tuple[int, str]: Returns (exit_code, output).
     """
+    _record_git_command(git_command)
     try:
-        command = ["git"] + git_command.split()
-        result = subprocess.run(
-            command,
-            cwd=repo_path,
-            capture_output=True, 
-            text=True, 
-            check=False
-        )
-
-        exit_code = result.returncode
-        output = result.stdout.strip() if result.stdout else result.stderr.strip()
-
-        return exit_code, output
+        result = run_recorded(run_command_sync, ["git"] + git_command.split(), cwd=repo_path)
+        return _git_result(result)
 
     except Exception as e:
         return 1, f"❌ Error executing Git command: {str(e)}"
 
 
+def _git_result(result) -> tuple[int, str]:
+    output = result.stdout.strip() if result.stdout else result.stderr.strip()
+    return result.returncode, output
+
+
+
+def get_status(repo_path) -> tuple[bool, str]:
+    """Runs 'git status --porcelain' once so a flow can reuse the result."""
+    project_logger("Checking git status for changes...", repo_path)
+    ret_code, status_output = run_git_command(repo_path, "status --porcelain")
+    if ret_code != 0:
+        project_logger(f"Error running git status: {status_output}", repo_path, level="error")
+        return False, status_output
+    return True, status_output
+
+
+def changed_paths(status_output) -> dict[str, str]:
+    """Parses 'git status --porcelain' output into path -> status code (e.g. 'M', '??')."""
+    paths = {}
+    for line in status_output.splitlines():
+        parts = line.strip().split(maxsplit=1)
+        if len(parts) != 2:
+            continue
+        code, path = parts
+        paths[path.rsplit(" -> ", 1)[-1].strip('"')] = code
+    return paths
+
 
 def stash_uncommitted_changes(repo_path):
      # 1. Check for changes using 'git status --porcelain'
@@ -60,15 +120,31 @@ def stash_uncommitted_changes(repo_path):
         project_logger("No changes detected. No need to stash.", repo_path)
     return True    
     
-def checkout_main_branch(repo_path):
+def find_main_branch(repo_path) -> tuple[str | None, bool]:
+    """Returns (main branch name, whether origin/<main branch> exists)."""
     project_logger("Determining the main branch name...", repo_path)
+    try:
+        main_branch, has_remote = git_refs.default_branch(repo_path)
+        project_logger(f"Main branch determined to be '{main_branch}'", repo_path)
+        return main_branch, has_remote
+    except (git_refs.GitRefsUnavailable, OSError) as e:
+        project_logger(f"Reading refs directly failed, asking git: {e}", repo_path, level="debug")
+
     ret_code, branch_output = run_git_command(repo_path, "branch -r")
     if ret_code != 0:
         project_logger(f"Error listing remote branches: {branch_output}",repo_path, level="error")
-        return False, None
+        return None, False
 
     main_branch = "master" if "origin/master" in branch_output else "main"
     project_logger(f"Main branch determined to be '{main_branch}'", repo_path)
+    return main_branch, f"origin/{main_branch}" in branch_output
+
+
+def checkout_main_branch(repo_path):
+    main_branch, _ = find_main_branch(repo_path)
+    if not main_branch:
+        return False, None
+
     ret_code, checkout_output = run_git_command(repo_path, f"checkout {main_branch}")
     if ret_code != 0:
         project_logger(f"Error checking out {main_branch} branch: {checkout_output}", repo_path, level="error")
@@ -77,10 +153,13 @@ def checkout_main_branch(repo_path):
     return True, main_branch
 
 
-def create_and_checkout_new_branch(repo_path):
+def new_update_branch_name():
     timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M")
+    return f"automated/library_update_{timestamp}"
 
-    new_branch_name = f"automated/library_update_{timestamp}"
+
+def create_and_checkout_new_branch(repo_path):
+    new_branch_name = new_update_branch_name()
     project_logger(f"Creating new branch '{new_branch_name}' from master...", repo_path)
     ret_code, branch_output = run_git_command(repo_path, f"checkout -b {new_branch_name}")
     if ret_code != 0:
@@ -90,6 +169,20 @@ def create_and_checkout_new_branch(repo_path):
     return True
 
 
+def checkout_new_branch_from(repo_path, new_branch_name, start_point):
+    """
+    Creates new_branch_name at start_point and checks it out with a single git call.
+    Fails when the branch already exists, its commits are never reset.
+    """
+    project_logger(f"Creating new branch '{new_branch_name}' from {start_point}...", repo_path)
+    ret_code, branch_output = run_git_command(repo_path, f"checkout --no-track -b {new_branch_name} {start_point}")
+    if ret_code != 0:
+        project_logger(f"Error creating new branch: {branch_output}", repo_path, level="error")
+        return False
+    project_logger(f"New branch '{new_branch_name}' created successfully.", repo_path)
+    return True
+
+
 def has_changes(repo_path):
     if not repo_path:
         project_logger("Error: repo_path is empty in has_changes", repo_path, level="error")
@@ -141,19 +234,47 @@ def git_add_and_commit(repo_path):
     return True
 
 
-def git_push_changes(repo_path):
+def git_commit_paths(repo_path, paths, commit_message="automated_library_updating"):
+    """Commits only the given paths with one 'git commit -- <paths>' call, no separate add."""
     if not repo_path:
-        project_logger("Error: repo_path is empty in git_push_changes", repo_path, level="error")
+        project_logger("Error: repo_path is empty in git_commit_paths", repo_path, level="error")
         return False
 
+    project_logger(f"Committing {', '.join(paths)} with message: '{commit_message}'", repo_path)
+    ret_code, commit_output = run_git_command(repo_path, f"commit -m {commit_message} -- {' '.join(paths)}")
+    if ret_code != 0:
+        project_logger(f"Error committing changes: {commit_output}", repo_path, level="error")
+        return False
+
+    project_logger("Changes committed successfully.", repo_path)
+    return True
+
+
+def get_current_branch(repo_path) -> str | None:
+    """Reads the current branch from .git/HEAD, running 'git rev-parse' only for unusual layouts."""
+    try:
+        return git_refs.current_branch(repo_path)
+    except (git_refs.GitRefsUnavailable, OSError) as e:
+        project_logger(f"Reading HEAD directly failed, asking git: {e}", repo_path, level="debug")
+
     # Get the current branch name
     project_logger("Getting current branch name...", repo_path)
     ret_code, branch_output = run_git_command(repo_path, "rev-parse --abbrev-ref HEAD")
     if ret_code != 0:
         project_logger(f"Error getting current branch name: {branch_output}", repo_path, level="error")
+        return None
+    return branch_output.strip()
+
+
+def git_push_changes(repo_path, current_branch=None):
+    if not repo_path:
+        project_logger("Error: repo_path is empty in git_push_changes", repo_path, level="error")
         return False
 
-    current_branch = branch_output.strip()
+    if not current_branch:
+        current_branch = get_current_branch(repo_path)
+        if not current_branch:
+            return False
     project_logger(f"Current branch is '{current_branch}'", repo_path)
 
     # Push changes to remote repository with upstream
@@ -1,49 +1,143 @@
-from src.integration.git.git_client import checkout_main_branch, create_and_checkout_new_branch, has_changes, stash_uncommitted_changes, git_add_and_commit, git_push_changes, has_changes
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from src.integration.git.git_client import changed_paths, checkout_new_branch_from, count_git_commands, find_main_branch, get_status, git_add_and_commit, git_commit_paths, git_push_changes, new_update_branch_name, run_git_command
 from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 from src.config.settings_reader import get_config
 
 
+@dataclass
+class GitFlowState:
+    repo_path: str
+    main_branch: Optional[str] = None
+    branch: Optional[str] = None
+    git_commands: int = 0  # git processes spawned by this flow so far
+
+
+# repo_path -> state of the flow started by git_flow_start, consumed by git_flow_finish
+_active_flows = {}
+_active_flows_lock = threading.Lock()
+
+
+def get_flow_state(repo_path) -> Optional[GitFlowState]:
+    with _active_flows_lock:
+        return _active_flows.get(repo_path)
+
+
+def discard_flow_state(repo_path):
+    """Forgets the flow of repo_path, for flows that stop between git_flow_start and git_flow_finish."""
+    with _active_flows_lock:
+        _active_flows.pop(repo_path, None)
+
 
 def git_flow_start(repo_path):
-    # Path to the git repository; update this to your actual repository path
+    """
+    Stashes local changes and creates the update branch from the main branch.
+    Plan: status, [stash], checkout --no-track -b <new> origin/<main>. The main branch
+    is read from .git (git_refs), 'branch -r' only runs for unusual repository layouts.
+
+    Returns:
+        GitFlowState on success, None otherwise.
+    """
     project_logger("Git Flow Starts", repo_path)
     if not repo_path:
         project_logger("Error: repo_path is empty", repo_path, level="error")
         return
-    # 1. Clean up existing changes
-    changes_cleaned_up = stash_uncommitted_changes(repo_path)
-    if not changes_cleaned_up:
+
+    state = GitFlowState(repo_path)
+    with count_git_commands() as counter:
+        started = _start_branch(state)
+    state.git_commands += counter.count
+    project_logger(f"Git flow start used {counter.count} git commands", repo_path, level="debug")
+    if not started:
         return
 
-    # 2. Checkout main branch
-    success, main_branch = checkout_main_branch(repo_path)
+    with _active_flows_lock:
+        _active_flows[repo_path] = state
+    return state
+
+
+def _start_branch(state):
+    repo_path = state.repo_path
+
+    # 1. Clean up existing changes
+    success, status_output = get_status(repo_path)
     if not success:
-        return
-    
-    # 3. Create a new branch from master
-    return create_and_checkout_new_branch(repo_path)
+        return False
+    if status_output:
+        project_logger("Changes detected in repository. Stashing changes...", repo_path)
+        ret_code, stash_output = run_git_command(repo_path, "stash")
+        if ret_code != 0:
+            project_logger(f"Error stashing changes: {stash_output}", repo_path, level="error")
+            return False
+    else:
+        project_logger("No changes detected. No need to stash.", repo_path)
+
+    # 2. Find main branch (read from .git, no git process for normal layouts)
+    main_branch, has_remote = find_main_branch(repo_path)
+    if not main_branch:
+        return False
+    state.main_branch = main_branch
+
+    # 3. Create the new branch directly from main, without checking main out first
+    new_branch = new_update_branch_name()
+    start_point = f"origin/{main_branch}" if has_remote else main_branch
+    if not checkout_new_branch_from(repo_path, new_branch, start_point):
+        return False
+    state.branch = new_branch
+    return True
 
 
 def git_flow_finish(repo_path):
+    """
+    Commits the pom.xml changes of the flow and pushes them when send_to_remote is enabled.
+    Plan: status, commit -- pom.xml, [push]. The branch created by git_flow_start is reused.
+    """
     if not repo_path:
         project_logger("Error: repo_path is empty", repo_path, level="error")
         return
 
+    with _active_flows_lock:
+        state = _active_flows.pop(repo_path, None) or GitFlowState(repo_path)
+
+    with count_git_commands() as counter:
+        finished = _commit_and_push(state)
+    state.git_commands += counter.count
+    project_logger(f"Git flow finish used {counter.count} git commands ({state.git_commands} in total)", repo_path, level="debug")
+    if finished:
+        project_logger("Git flow finish completed successfully", repo_path)
+    return finished
+
+
+def _commit_and_push(state):
+    repo_path = state.repo_path
+
     # Check if there are uncommitted changes
-    if has_changes(repo_path):
-        if not git_add_and_commit(repo_path):
-            project_logger("Error: Failed to add and commit changes", repo_path, level="error")
-            return
-
-        # Check if pushing to remote is enabled in settings
-        send_to_remote = get_config("send_to_remote", False)
-        if send_to_remote:
-            # Push changes to the remote repository
-            if not git_push_changes(repo_path):
-                project_logger("Error: Failed to push changes", repo_path, level="error")
-                return
-    else:
+    success, status_output = get_status(repo_path)
+    if not success:
+        return False
+    if not status_output:
         project_logger("There are no changes", repo_path)
+        return True
+
+    pom_status = changed_paths(status_output).get("pom.xml")
+    if not pom_status:
+        project_logger("No changes detected in pom.xml. Nothing to commit.", repo_path, level="warning")
+        return True
+
+    # Untracked pom.xml cannot be committed by pathspec, it is added first
+    committed = git_add_and_commit(repo_path) if pom_status == "??" else git_commit_paths(repo_path, ["pom.xml"])
+    if not committed:
+        project_logger("Error: Failed to add and commit changes", repo_path, level="error")
+        return False
 
-    project_logger("Git flow finish completed successfully", repo_path)
\ No newline at end of file
+    # Check if pushing to remote is enabled in settings
+    send_to_remote = get_config("send_to_remote", False)
+    if send_to_remote:
+        # Push changes to the remote repository
+        if not git_push_changes(repo_path, state.branch):
+            project_logger("Error: Failed to push changes", repo_path, level="error")
+            return False
+    return True
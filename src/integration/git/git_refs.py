@@ -0,0 +1,105 @@
+import os
+
+
+class GitRefsUnavailable(Exception):
+    """Raised when a repository layout cannot be read without git (callers fall back to git)."""
+
+
+def resolve_git_dirs(repo_path) -> tuple[str, str]:
+    """
+    Finds the git directories of a work tree without running git.
+
+    Returns:
+        tuple[str, str]: (git_dir, common_dir). git_dir holds HEAD, common_dir holds
+        refs/ and packed-refs. They differ for linked worktrees.
+    """
+    dot_git = os.path.join(repo_path, ".git")
+    if os.path.isdir(dot_git):
+        git_dir = dot_git
+    elif os.path.isfile(dot_git):
+        # Linked worktrees and submodules use a "gitdir: <path>" file
+        content = _read_text(dot_git)
+        if not content.startswith("gitdir:"):
+            raise GitRefsUnavailable(f"Unexpected .git file in {repo_path}")
+        git_dir = content[len("gitdir:"):].strip()
+        if not os.path.isabs(git_dir):
+            git_dir = os.path.join(repo_path, git_dir)
+    else:
+        raise GitRefsUnavailable(f"No .git found in {repo_path}")
+
+    common_dir = git_dir
+    commondir_file = os.path.join(git_dir, "commondir")
+    if os.path.isfile(commondir_file):
+        common_dir = _read_text(commondir_file).strip()
+        if not os.path.isabs(common_dir):
+            common_dir = os.path.join(git_dir, common_dir)
+
+    git_dir, common_dir = os.path.normpath(git_dir), os.path.normpath(common_dir)
+    if os.path.isdir(os.path.join(common_dir, "reftable")):
+        raise GitRefsUnavailable(f"reftable ref storage is not supported in {repo_path}")
+    return git_dir, common_dir
+
+
+def read_head(repo_path) -> str:
+    """Returns the symbolic ref HEAD points to (e.g. 'refs/heads/main') or the commit id when detached."""
+    git_dir, _ = resolve_git_dirs(repo_path)
+    try:
+        content = _read_text(os.path.join(git_dir, "HEAD")).strip()
+    except OSError as e:
+        raise GitRefsUnavailable(f"HEAD could not be read: {e}")
+    if content.startswith("ref:"):
+        return content[len("ref:"):].strip()
+    return content
+
+
+def current_branch(repo_path) -> str:
+    """Same answer as 'git rev-parse --abbrev-ref HEAD': the branch name, or 'HEAD' when detached."""
+    head = read_head(repo_path)
+    if head.startswith("refs/heads/"):
+        return head[len("refs/heads/"):]
+    return "HEAD"
+
+
+def ref_exists(repo_path, ref_name) -> bool:
+    """Checks a full ref name (e.g. 'refs/remotes/origin/main') in loose refs and packed-refs."""
+    _, common_dir = resolve_git_dirs(repo_path)
+    if os.path.isfile(os.path.join(common_dir, *ref_name.split("/"))):
+        return True
+    return ref_name in _packed_refs(common_dir)
+
+
+def remote_ref_exists(repo_path, branch, remote="origin") -> bool:
+    return ref_exists(repo_path, f"refs/remotes/{remote}/{branch}")
+
+
+def default_branch(repo_path, remote="origin") -> tuple[str, bool]:
+    """
+    Returns (main branch name, whether <remote>/<main branch> exists).
+    Same rule as the 'git branch -r' fallback in git_client: master when <remote>/master
+    exists, main otherwise. <remote>/HEAD is not consulted.
+    """
+    if remote_ref_exists(repo_path, "master", remote):
+        return "master", True
+    return "main", remote_ref_exists(repo_path, "main", remote)
+
+
+def _packed_refs(common_dir) -> set[str]:
+    refs = set()
+    try:
+        with open(os.path.join(common_dir, "packed-refs"), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                parts = line.split()
+                if len(parts) == 2:
+                    refs.add(parts[1])
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        raise GitRefsUnavailable(f"packed-refs could not be read: {e}")
+    return refs
+
+
+def _read_text(path) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
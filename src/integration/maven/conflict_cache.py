@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from src.config.settings_reader import get_config
+from src.core.project_index import CACHE_DIR
+from src.integration.maven.pom_reader import read_pom_model, walk_project_poms
+from src.utils.logger_setup import global_logger as logger
+
+
+CONFLICT_CACHE_DIR = os.path.join(CACHE_DIR, "conflict_results")
+DEFAULT_MAX_ENTRIES = 512
+# Bump when the meaning of a cached result changes
+CACHE_VERSION = "1"
+# Settings that change which dependencies Maven resolves, or how the check runs
+MAVEN_ENVIRONMENT = ("MAVEN_OPTS", "MAVEN_ARGS", "M2_HOME", "MAVEN_HOME")
+MAVEN_SETTINGS_KEYS = ("dependency_resolver", "maven_mode", "maven_local_repository")
+
+
+def _file_digest(path) -> str:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return "-"
+
+
+def project_pom_files(project_path) -> list[str]:
+    """
+    Every pom.xml the dependency tree of a project depends on: the project, its modules
+    and the local parents reached through <relativePath> (../pom.xml by default).
+    """
+    poms = set()
+    for pom_path, model, _ in walk_project_poms(os.path.join(project_path, "pom.xml")):
+        poms.add(os.path.abspath(pom_path))
+        poms.update(_local_parents(pom_path, model["parent"], poms))
+    return sorted(poms)
+
+
+def _local_parents(pom_path, parent, seen):
+    """Yields the parents of a pom that are found on disk, parents from the repository end the chain."""
+    while parent:
+        relative_path = parent["relativePath"] if parent["relativePath"] is not None else "../pom.xml"
+        if not relative_path:
+            return
+        parent_path = os.path.join(os.path.dirname(pom_path), relative_path)
+        if os.path.isdir(parent_path):
+            parent_path = os.path.join(parent_path, "pom.xml")
+        parent_path = os.path.abspath(parent_path)
+        if parent_path in seen or not os.path.isfile(parent_path):
+            return
+        try:
+            model = read_pom_model(parent_path)
+        except (OSError, ValueError):
+            return
+        if model["artifactId"] != parent["artifactId"]:
+            return
+        yield parent_path
+        pom_path, parent = parent_path, model["parent"]
+
+
+def maven_settings_fingerprint(project_path) -> str:
+    """Hash of the Maven configuration that can change resolution results for a project."""
+    digest = hashlib.sha256()
+    settings_files = [
+        os.path.join(os.path.expanduser("~"), ".m2", "settings.xml"),
+        os.path.join(project_path, ".mvn", "maven.config"),
+        os.path.join(project_path, ".mvn", "extensions.xml"),
+    ]
+    for variable in ("M2_HOME", "MAVEN_HOME"):
+        if os.environ.get(variable):
+            settings_files.append(os.path.join(os.environ[variable], "conf", "settings.xml"))
+    for path in settings_files:
+        digest.update(f"{path}={_file_digest(path)}\n".encode())
+    for variable in MAVEN_ENVIRONMENT:
+        digest.update(f"{variable}={os.environ.get(variable, '')}\n".encode())
+    for key in MAVEN_SETTINGS_KEYS:
+        digest.update(f"{key}={get_config(key, '')}\n".encode())
+    return digest.hexdigest()
+
+
+class ConflictResultCache:
+    """
+    On-disk cache of has_dependency_conflict results, one small file per key.
+
+    The key is content-addressed: a hash of every pom.xml the project's dependency tree
+    depends on plus the Maven settings fingerprint, so edits invalidate entries without any
+    bookkeeping. A hit refreshes the entry's mtime and the least recently used entries are
+    evicted once more than max_entries are stored.
+    """
+
+    def __init__(self, cache_dir=CONFLICT_CACHE_DIR, max_entries=None):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+
+    def _max_entries(self) -> int:
+        value = self.max_entries if self.max_entries is not None else get_config("conflict_cache_max_entries", DEFAULT_MAX_ENTRIES)
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return DEFAULT_MAX_ENTRIES
+
+    def key_for(self, project_path) -> str | None:
+        """Cache key of a project, None when caching is disabled or the pom.xml cannot be read."""
+        if not self._max_entries():
+            return None
+        poms = project_pom_files(project_path)
+        if not poms:
+            return None
+        digest = hashlib.sha256(f"v{CACHE_VERSION}\n".encode())
+        for pom_path in poms:
+            digest.update(f"{os.path.relpath(pom_path, project_path)}={_file_digest(pom_path)}\n".encode())
+        digest.update(maven_settings_fingerprint(project_path).encode())
+        return digest.hexdigest()
+
+    def get(self, key) -> bool | None:
+        if not key:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)["no_conflict"]
+            os.utime(path)
+            return bool(result)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable conflict cache entry {path}: {e}")
+            return None
+
+    def put(self, key, no_conflict):
+        if not key:
+            return
+        with self.lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{self._entry_path(key)}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"no_conflict": bool(no_conflict), "stored_at": time.time()}, f)
+                os.replace(tmp_path, self._entry_path(key))
+                self._evict()
+            except OSError as e:
+                logger.warning(f"Conflict result could not be cached: {e}")
+
+    def clear(self):
+        with self.lock:
+            for entry in self._entries():
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _entry_path(self, key) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _entries(self) -> list:
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return [entry for entry in entries if entry.name.endswith(".json")]
+        except OSError:
+            return []
+
+    def _evict(self):
+        entries = self._entries()
+        excess = len(entries) - self._max_entries()
+        if excess <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+conflict_cache = ConflictResultCache()
@@ -0,0 +1,295 @@
+import os
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.integration.maven.dependency_tree_parser import DependencyConflicts
+from src.integration.maven.local_repository import local_repository_path
+from src.integration.maven.pom_reader import read_pom_model
+from src.utils.logger_setup import global_logger as logger
+
+
+PROPERTY = re.compile(r"\$\{([^}]+)\}")
+# Scopes whose dependencies are not inherited transitively
+NON_TRANSITIVE_SCOPES = {"test", "provided", "system"}
+MAX_INTERPOLATION_PASSES = 10
+
+# (repository, groupId, artifactId, version) -> EffectiveModel, shared by every project of the session
+_repository_models = {}
+_repository_models_lock = threading.Lock()
+
+
+class ArtifactNotAvailable(Exception):
+    """A POM needed for resolution is not in the local repository, or a version cannot be determined."""
+
+
+@dataclass
+class EffectiveModel:
+    group_id: str
+    artifact_id: str
+    version: str
+    packaging: str
+    modules: list
+    # Uninterpolated, inheritance already applied, so they are interpolated in the child's context
+    properties: dict
+    raw_dependencies: list
+    raw_managed: list
+    repository: str
+    _managed: dict = field(default=None, repr=False)
+    _dependencies: list = field(default=None, repr=False)
+
+    @property
+    def label(self) -> str:
+        return f"{self.group_id}:{self.artifact_id}:{self.version}"
+
+    def interpolate(self, value):
+        if not value or "${" not in value:
+            return value
+        for _ in range(MAX_INTERPOLATION_PASSES):
+            interpolated = PROPERTY.sub(lambda m: self.properties.get(m.group(1), m.group(0)), value)
+            if interpolated == value:
+                break
+            value = interpolated
+        return value
+
+    def managed(self) -> dict:
+        """dependencyManagement with BOM imports expanded: (groupId, artifactId, type, classifier) -> dependency."""
+        if self._managed is None:
+            managed, imports = {}, []
+            for raw in self.raw_managed:
+                dependency = self._interpolate_dependency(raw)
+                if dependency["scope"] == "import" and dependency["type"] == "pom":
+                    imports.append(dependency)
+                else:
+                    managed[_dependency_key(dependency)] = dependency
+            # Declared entries win over imported ones, the first import wins among imports
+            for dependency in imports:
+                bom = repository_model(dependency["groupId"], dependency["artifactId"], dependency["version"], self.repository)
+                for key, managed_dependency in bom.managed().items():
+                    managed.setdefault(key, managed_dependency)
+            self._managed = managed
+        return self._managed
+
+    def dependencies(self) -> list:
+        """Declared dependencies with versions, scopes and exclusions from dependencyManagement applied."""
+        if self._dependencies is None:
+            managed = self.managed()
+            dependencies = []
+            for raw in self.raw_dependencies:
+                dependency = self._interpolate_dependency(raw)
+                management = managed.get(_dependency_key(dependency))
+                if management:
+                    dependency["version"] = dependency["version"] or management["version"]
+                    dependency["scope"] = dependency["scope"] or management["scope"]
+                    dependency["exclusions"] = dependency["exclusions"] + management["exclusions"]
+                dependency["scope"] = dependency["scope"] or "compile"
+                dependencies.append(dependency)
+            self._dependencies = dependencies
+        return self._dependencies
+
+    def _interpolate_dependency(self, raw) -> dict:
+        dependency = dict(raw)
+        for key in ("groupId", "artifactId", "version", "type", "classifier", "scope"):
+            dependency[key] = self.interpolate(raw[key])
+        dependency["exclusions"] = [(self.interpolate(g), self.interpolate(a)) for g, a in raw["exclusions"]]
+        return dependency
+
+
+def _dependency_key(dependency) -> tuple:
+    return dependency["groupId"], dependency["artifactId"], dependency["type"] or "jar", dependency["classifier"] or ""
+
+
+def _raw_key(dependency) -> tuple:
+    return dependency["groupId"], dependency["artifactId"], dependency["type"], dependency["classifier"]
+
+
+def repository_pom_path(group_id, artifact_id, version, repository) -> str:
+    return os.path.join(repository, *group_id.split("."), artifact_id, version, f"{artifact_id}-{version}.pom")
+
+
+def repository_model(group_id, artifact_id, version, repository=None) -> EffectiveModel:
+    """
+    Effective model of a POM in the local repository. Released POMs never change, so every
+    model is parsed once per session and shared by all projects.
+    """
+    repository = repository or local_repository_path()
+    if not version or "${" in version or version[0] in "[(":
+        raise ArtifactNotAvailable(f"Version of {group_id}:{artifact_id} cannot be resolved offline: {version}")
+
+    key = (repository, group_id, artifact_id, version)
+    with _repository_models_lock:
+        if key in _repository_models:
+            return _repository_models[key]
+
+    pom_path = repository_pom_path(group_id, artifact_id, version, repository)
+    if not os.path.isfile(pom_path):
+        raise ArtifactNotAvailable(f"{group_id}:{artifact_id}:{version} is not in the local repository")
+    model = _build_model(pom_path, repository, local=False)
+
+    with _repository_models_lock:
+        _repository_models[key] = model
+    return model
+
+
+def project_model(pom_path, repository=None) -> EffectiveModel:
+    """Effective model of a pom.xml in the workspace, parents are looked up by relativePath first. Not cached."""
+    return _build_model(pom_path, repository or local_repository_path(), local=True)
+
+
+def clear_model_cache():
+    with _repository_models_lock:
+        _repository_models.clear()
+
+
+def _build_model(pom_path, repository, local) -> EffectiveModel:
+    try:
+        raw = read_pom_model(pom_path)
+    except (OSError, ValueError) as e:
+        raise ArtifactNotAvailable(f"{pom_path} could not be read: {e}")
+
+    parent = None
+    if raw["parent"]:
+        parent = _parent_model(pom_path, raw["parent"], repository, local)
+
+    properties = dict(parent.properties) if parent else {}
+    properties.update(raw["properties"])
+    group_id, artifact_id, version = raw["groupId"], raw["artifactId"], raw["version"]
+    built_in = {
+        "project.groupId": group_id, "project.artifactId": artifact_id, "project.version": version,
+        "pom.groupId": group_id, "pom.artifactId": artifact_id, "pom.version": version,
+        "groupId": group_id, "artifactId": artifact_id, "version": version,
+        "project.basedir": os.path.dirname(os.path.abspath(pom_path)),
+    }
+    if parent:
+        built_in.update({
+            "project.parent.groupId": parent.group_id,
+            "project.parent.artifactId": parent.artifact_id,
+            "project.parent.version": parent.version,
+        })
+    properties.update({key: value for key, value in built_in.items() if value is not None})
+
+    return EffectiveModel(
+        group_id=group_id,
+        artifact_id=artifact_id,
+        version=version,
+        packaging=raw["packaging"],
+        modules=raw["modules"],
+        properties=properties,
+        raw_dependencies=_inherit(parent.raw_dependencies if parent else [], raw["dependencies"]),
+        raw_managed=_inherit(parent.raw_managed if parent else [], raw["dependencyManagement"]),
+        repository=repository,
+    )
+
+
+def _inherit(parent_entries, own_entries) -> list:
+    own_keys = {_raw_key(dependency) for dependency in own_entries}
+    return [dependency for dependency in parent_entries if _raw_key(dependency) not in own_keys] + own_entries
+
+
+def _parent_model(pom_path, parent, repository, local) -> EffectiveModel:
+    if local:
+        relative_path = parent["relativePath"] if parent["relativePath"] is not None else "../pom.xml"
+        if relative_path:
+            parent_path = os.path.join(os.path.dirname(pom_path), relative_path)
+            if os.path.isdir(parent_path):
+                parent_path = os.path.join(parent_path, "pom.xml")
+            if os.path.isfile(parent_path):
+                candidate = _build_model(parent_path, repository, local=True)
+                if (candidate.group_id, candidate.artifact_id) == (parent["groupId"], parent["artifactId"]):
+                    return candidate
+    return repository_model(parent["groupId"], parent["artifactId"], parent["version"], repository)
+
+
+def _project_modules(pom_path, repository, seen=None) -> list[EffectiveModel]:
+    """The project model followed by the models of all its modules, recursively."""
+    seen = seen if seen is not None else set()
+    real_path = os.path.realpath(pom_path)
+    if real_path in seen:
+        return []
+    seen.add(real_path)
+
+    model = project_model(pom_path, repository)
+    models = [model]
+    for module in model.modules:
+        module_path = os.path.join(os.path.dirname(pom_path), module)
+        if os.path.isdir(module_path):
+            module_path = os.path.join(module_path, "pom.xml")
+        models.extend(_project_modules(module_path, repository, seen))
+    return models
+
+
+def _transitive_scope(parent_scope, child_scope) -> str:
+    if parent_scope == "compile":
+        return child_scope
+    return parent_scope
+
+
+def _excluded(dependency, exclusions) -> bool:
+    group_id, artifact_id = dependency["groupId"], dependency["artifactId"]
+    return any(
+        g in ("*", group_id) and a in ("*", artifact_id)
+        for g, a in exclusions
+    )
+
+
+def resolve_module(model, modules_by_ga, result):
+    """
+    Resolves the dependency tree of one module the way Maven mediates it (nearest wins, the
+    first declaration wins at equal depth, the module's dependencyManagement applies to
+    transitive dependencies) and adds every resolved node to result.
+    """
+    root_managed = model.managed()
+    resolved = {}  # groupId:artifactId -> version
+    queue = deque((dependency, [model.label], (), None) for dependency in model.dependencies())
+    result.nodes += 1
+
+    while queue:
+        dependency, path, exclusions, parent_scope = queue.popleft()
+        group_artifact = f"{dependency['groupId']}:{dependency['artifactId']}"
+        if group_artifact in resolved:
+            continue  # Omitted for a nearer or earlier declaration, like dependency:tree does
+
+        version, scope = dependency["version"], dependency["scope"] or "compile"
+        if parent_scope is not None:
+            management = root_managed.get(_dependency_key(dependency))
+            if management:
+                version = management["version"] or version
+                scope = management["scope"] or scope
+            scope = _transitive_scope(parent_scope, scope)
+        if not version:
+            raise ArtifactNotAvailable(f"No version for {group_artifact} in {model.label}")
+
+        resolved[group_artifact] = version
+        label = f"{group_artifact}:{version}"
+        result.add(group_artifact, version, " > ".join(path + [label]))
+        result.nodes += 1
+
+        child_model = modules_by_ga.get((dependency["groupId"], dependency["artifactId"]))
+        if child_model is None:
+            child_model = repository_model(dependency["groupId"], dependency["artifactId"], version, model.repository)
+        child_exclusions = tuple(exclusions) + tuple(dependency["exclusions"])
+        for child in child_model.dependencies():
+            if child["scope"] in NON_TRANSITIVE_SCOPES or child["optional"] or _excluded(child, child_exclusions):
+                continue
+            queue.append((child, path + [label], child_exclusions, scope))
+    return resolved
+
+
+def resolve_dependency_conflicts(project_path, repository=None) -> DependencyConflicts:
+    """
+    Resolves the dependency trees of a project and all its modules from the POMs in the local
+    repository, without running Maven. The result has the same shape as the one
+    find_dependency_conflicts reads from 'mvn dependency:tree' output.
+
+    Raises:
+        ArtifactNotAvailable: A POM is missing locally or a version needs Maven (ranges,
+            unresolvable properties). Callers fall back to Maven.
+    """
+    models = _project_modules(os.path.join(project_path, "pom.xml"), repository)
+    modules_by_ga = {(model.group_id, model.artifact_id): model for model in models}
+    result = DependencyConflicts()
+    for model in models:
+        resolve_module(model, modules_by_ga, result)
+    logger.debug(f"Resolved {result.nodes} dependency nodes offline for {project_path}")
+    return result
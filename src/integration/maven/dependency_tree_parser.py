@@ -0,0 +1,124 @@
+import json
+import re
+from dataclasses import dataclass, field
+
+
+CHUNK_SIZE = 64 * 1024
+# Paths kept per conflicting version, enough to explain a conflict without growing with the tree
+MAX_PATHS_PER_VERSION = 3
+
+# Punctuation, a complete string, or a bare literal (number, true, false, null)
+TOKEN = re.compile(r'[{}\[\]:,]|"(?:[^"\\]|\\.)*"|[^\s{}\[\]:,"]+')
+PUNCTUATION = "{}[]:,"
+
+
+def iter_json_tokens(stream, chunk_size=CHUNK_SIZE):
+    """
+    Tokenizes one or more concatenated JSON documents from a text stream, reading chunk_size
+    characters at a time. Yields (kind, value) with kind "punct", "string" or "literal".
+    """
+    buffer = ""
+    eof = False
+    while not eof:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            buffer += chunk
+        else:
+            eof = True
+
+        position = 0
+        for match in TOKEN.finditer(buffer):
+            start, end = match.span()
+            if start != position and buffer[position:start].strip():
+                if not eof:
+                    break  # Unterminated string, it continues in the next chunk
+                raise ValueError(f"Invalid JSON near: {buffer[position:position + 40]!r}")
+            if end == len(buffer) and not eof:
+                break  # The token may continue in the next chunk
+            position = end
+
+            token = match.group()
+            first = token[0]
+            if first in PUNCTUATION:
+                yield "punct", token
+            elif first == '"':
+                yield "string", json.loads(token) if "\\" in token else token[1:-1]
+            else:
+                yield "literal", json.loads(token)
+
+        if eof and buffer[position:].strip():
+            raise ValueError(f"Invalid JSON near: {buffer[position:position + 40]!r}")
+        buffer = buffer[position:]
+
+
+@dataclass
+class DependencyConflicts:
+    # "groupId:artifactId" -> version -> up to MAX_PATHS_PER_VERSION paths from the root
+    versions: dict = field(default_factory=dict)
+    nodes: int = 0
+
+    def add(self, group_artifact, version, path):
+        paths = self.versions.setdefault(group_artifact, {}).setdefault(version, [])
+        if len(paths) < MAX_PATHS_PER_VERSION:
+            paths.append(path)
+
+    def conflicts(self) -> dict:
+        return {ga: versions for ga, versions in self.versions.items() if len(versions) > 1}
+
+
+def find_dependency_conflicts(stream, chunk_size=CHUNK_SIZE) -> DependencyConflicts:
+    """
+    Walks the nested 'children' graph written by 'mvn dependency:tree -DoutputType=json'
+    and collects every version of every groupId:artifactId together with the path that
+    pulled it in. Several concatenated trees (-DappendOutput for multi-module projects)
+    are read one after another. Memory depends on the tree depth and the number of
+    distinct artifacts, not on the file size.
+    """
+    result = DependencyConflicts()
+    # One frame per open JSON container: [is_map, scalar fields, pending key]
+    stack = []
+    for kind, value in iter_json_tokens(stream, chunk_size):
+        if kind == "punct":
+            if value == "{":
+                stack.append([True, {}, None])
+            elif value == "[":
+                stack.append([False, None, None])
+            elif value in "}]":
+                if not stack or stack[-1][0] != (value == "}"):
+                    raise ValueError(f"Unexpected '{value}' in dependency tree")
+                frame = stack.pop()
+                if frame[0]:
+                    _finish_node(frame[1], stack, result)
+                # The closed container was the value of the enclosing map's key
+                if stack and stack[-1][0]:
+                    stack[-1][2] = None
+            continue
+
+        if not stack:
+            raise ValueError(f"Unexpected value outside of a JSON document: {value!r}")
+        frame = stack[-1]
+        if frame[0]:
+            if frame[2] is None:
+                frame[2] = value
+            else:
+                frame[1][frame[2]] = value
+                frame[2] = None
+
+    if stack:
+        raise ValueError("Dependency tree ended unexpectedly")
+    return result
+
+
+def _finish_node(fields, stack, result):
+    if "artifactId" not in fields:
+        return
+    result.nodes += 1
+    parents = [_label(frame[1]) for frame in stack if frame[0]]
+    if not parents:
+        return  # The project itself
+    group_artifact = f"{fields.get('groupId')}:{fields['artifactId']}"
+    result.add(group_artifact, str(fields.get("version")), " > ".join(parents + [_label(fields)]))
+
+
+def _label(fields) -> str:
+    return f"{fields.get('groupId')}:{fields.get('artifactId')}:{fields.get('version')}"
@@ -0,0 +1,133 @@
+import functools
+import glob
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+
+from src.config.settings_reader import get_config
+from src.utils.logger_setup import global_logger as logger
+
+
+# Qualifier order used by Maven's ComparableVersion, "" is a plain release
+QUALIFIER_RANKS = {
+    "alpha": 1, "a": 1,
+    "beta": 2, "b": 2,
+    "milestone": 3, "m": 3,
+    "rc": 4, "cr": 4,
+    "snapshot": 5,
+    "": 6, "ga": 6, "final": 6, "release": 6,
+    "sp": 7,
+}
+PRE_RELEASE_QUALIFIERS = {"alpha", "a", "beta", "b", "milestone", "m", "rc", "cr", "snapshot", "preview", "pre", "ea", "dev"}
+RELEASE_ITEM = (1, QUALIFIER_RANKS[""], "")
+
+_versions_cache = {}
+_versions_cache_lock = threading.Lock()
+
+
+def local_repository_path() -> str:
+    """
+    Location of the local Maven repository: maven_local_repository from settings.toml,
+    then <localRepository> in ~/.m2/settings.xml, then ~/.m2/repository.
+    """
+    configured = get_config("maven_local_repository")
+    if configured:
+        return os.path.expanduser(configured)
+
+    m2_dir = os.path.join(os.path.expanduser("~"), ".m2")
+    settings_path = os.path.join(m2_dir, "settings.xml")
+    if os.path.isfile(settings_path):
+        try:
+            for element in ET.parse(settings_path).getroot().iter():
+                if element.tag.endswith("localRepository") and element.text and "${" not in element.text:
+                    return os.path.expanduser(element.text.strip())
+        except ET.ParseError as e:
+            logger.warning(f"~/.m2/settings.xml could not be parsed: {e}")
+    return os.path.join(m2_dir, "repository")
+
+
+def artifact_directory(group_id, artifact_id, repository=None) -> str:
+    repository = repository or local_repository_path()
+    return os.path.join(repository, *group_id.split("."), artifact_id)
+
+
+def available_versions(group_id, artifact_id, repository=None) -> list[str]:
+    """
+    Versions listed in the cached maven-metadata*.xml files of an artifact, sorted oldest first.
+    Results are memoized for the session, the files only change when Maven runs.
+    """
+    directory = artifact_directory(group_id, artifact_id, repository)
+    with _versions_cache_lock:
+        if directory in _versions_cache:
+            return _versions_cache[directory]
+
+    versions = set()
+    for metadata_path in glob.glob(os.path.join(glob.escape(directory), "maven-metadata*.xml")):
+        try:
+            root = ET.parse(metadata_path).getroot()
+        except (ET.ParseError, OSError) as e:
+            logger.debug(f"Skipping unreadable metadata {metadata_path}: {e}")
+            continue
+        for element in root.iter("version"):
+            if element.text and element.text.strip():
+                versions.add(element.text.strip())
+        for tag in ("release", "latest"):
+            for element in root.iter(tag):
+                if element.text and element.text.strip():
+                    versions.add(element.text.strip())
+
+    result = sorted(versions, key=version_sort_key)
+    with _versions_cache_lock:
+        _versions_cache[directory] = result
+    return result
+
+
+def clear_versions_cache():
+    with _versions_cache_lock:
+        _versions_cache.clear()
+
+
+def _version_items(version) -> list[tuple]:
+    items = []
+    for part in re.findall(r"\d+|[a-zA-Z]+", version):
+        if part.isdigit():
+            items.append((2, int(part), ""))
+        else:
+            qualifier = part.lower()
+            rank = QUALIFIER_RANKS.get(qualifier)
+            # Zeros before a qualifier do not count, 1.0-RC1 is 1-RC1
+            while items and items[-1] == (2, 0, ""):
+                items.pop()
+            # Unknown qualifiers sort after the known ones, alphabetically
+            items.append((1, rank, "") if rank is not None else (1, 8, qualifier))
+    while items and items[-1] in ((2, 0, ""), RELEASE_ITEM):
+        items.pop()
+    return items
+
+
+def compare_versions(left, right) -> int:
+    """Compares two Maven versions, 1.0 == 1.0.0, 1.0-RC1 < 1.0 < 1.0.1 < 1.1-SNAPSHOT < 1.1."""
+    left_items, right_items = _version_items(left), _version_items(right)
+    for index in range(max(len(left_items), len(right_items))):
+        # A missing item counts as a plain release
+        left_item = left_items[index] if index < len(left_items) else RELEASE_ITEM
+        right_item = right_items[index] if index < len(right_items) else RELEASE_ITEM
+        if left_item != right_item:
+            return -1 if left_item < right_item else 1
+    return 0
+
+
+version_sort_key = functools.cmp_to_key(compare_versions)
+
+
+def is_release_version(version) -> bool:
+    return not any(part.lower() in PRE_RELEASE_QUALIFIERS for part in re.findall(r"[a-zA-Z]+", version))
+
+
+def newer_releases(group_id, artifact_id, current_version, repository=None) -> list[str]:
+    """Release versions newer than current_version known to the local repository, oldest first."""
+    return [
+        version for version in available_versions(group_id, artifact_id, repository)
+        if is_release_version(version) and compare_versions(version, current_version) > 0
+    ]
@@ -1,11 +1,37 @@
+import os
 import shlex
-import subprocess
+from contextlib import nullcontext
 from typing import Tuple
 from src.config.settings_reader import get_config
+from src.integration.command_recorder import run_recorded
+from src.integration.command_runner import run_command_sync
+from src.core.startup_history import startup_history
+from src.integration.maven.maven_daemon import daemon_manager, is_daemon_mode
+from src.integration.maven.spring_readiness import SpringBootReadiness
+from src.integration.service_supervisor import service_supervisor
 from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 
 
+def maven_command_args(command) -> list[str]:
+    """
+    Splits a "mvn ..." command line. With maven_mode = "mvnd" in settings.toml the
+    command is sent to the warm Maven daemon instead of starting a fresh JVM.
+    """
+    command_args = shlex.split(command)
+    if command_args and command_args[0] == "mvn" and is_daemon_mode():
+        # Raw streams keep the output line by line like stock Maven, the parsers rely on it
+        return [daemon_manager.executable(), "-Dmvnd.rawStreams=true"] + command_args[1:]
+    return command_args
+
+
+def maven_build(command_args, cwd):
+    """Context manager that counts daemon builds so MavenDaemonManager can recycle daemons."""
+    if command_args and command_args[0] == daemon_manager.executable():
+        return daemon_manager.build(cwd)
+    return nullcontext()
+
+
 def run_command(command, cwd)-> Tuple[bool, str]:
     """
     Function to safely run a subprocess.
@@ -14,16 +40,11 @@ def run_command(command, cwd)-> Tuple[bool, str]:
     return: (bool, str) -> (Success, stdout/stderr)
     """
     try:
-        command_args = shlex.split(command)
-        project_logger(f"Running command: {command}", cwd,level="debug")
+        command_args = maven_command_args(command)
+        project_logger(f"Running command: {' '.join(command_args)}", cwd,level="debug")
 
-        result = subprocess.run(
-            command_args, 
-            cwd=cwd, 
-            capture_output=True, 
-            shell=True,
-            text=True
-        )
+        with maven_build(command_args, cwd):
+            result = run_recorded(run_command_sync, command_args, cwd=cwd)
 
         if result.returncode != 0:
             project_logger(
@@ -44,43 +65,26 @@ def run_command(command, cwd)-> Tuple[bool, str]:
         return False, str(e)
 
 
-def mvn_springboot_start(tui_app, project_path):
-    project_logger(f"Starting Spring Boot application...", project_path)
+def springboot_run_command() -> list[str]:
     profile = get_config("spring_profile", "local")
+    return shlex.split(f"mvn spring-boot:run -Dspring-boot.run.arguments=--spring.profiles.active={profile}")
 
-    # Process başlatılıyor
-    process = subprocess.Popen(
-        shlex.split(f"mvn spring-boot:run -Dspring-boot.run.arguments=--spring.profiles.active={profile}"),
-        cwd=project_path,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        shell=True
-    )
 
-    # Process referansını ve PID’yi kaydet
-    tui_app.process = process
-    
-    tui_app._project_started(project_path, process.pid)
-    project_name = None
-
-    # Logları UI'ya yazdır
-    for line in iter(process.stdout.readline, ''):
-        if tui_app.process is None:
-            break
-        tui_app.call_from_thread(tui_app._append_log_line, line)
-
-    # Process bittiğinde dictionary'den kaldır
-    if project_name:
-        del tui_app.running_projects[project_name]
-
-    tui_app.call_from_thread(
-        tui_app._append_log_line,
-        "\n--- Spring Boot process finished ---\n"
-    )
+def mvn_springboot_start(project_path, restart_policy=None):
+    """
+    Starts the Spring Boot application of a project under the service supervisor,
+    next to any other services already running. The service is "starting" until
+    Spring Boot logged its startup and the readiness probe passed, every startup
+    duration is added to the startup history.
 
-    tui_app.process = None
+    Returns:
+        ManagedService: The service, its output is kept in its ring buffer.
+    """
+    project_logger(f"Starting Spring Boot application...", project_path)
+    return service_supervisor.start(
+        os.path.basename(os.path.normpath(project_path)), project_path, springboot_run_command(), restart_policy,
+        readiness=SpringBootReadiness(), on_ready=startup_history.record_service,
+    )
 
 
 def mvn_update_plugins(project_path) -> Tuple[bool, str]:
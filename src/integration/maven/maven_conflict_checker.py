@@ -1,9 +1,15 @@
-import json
-import shlex
-import subprocess
+import io
 import os
 import re
-from collections import defaultdict
+import shutil
+import tempfile
+from src.config.settings_reader import get_config
+from src.integration.command_recorder import run_recorded
+from src.integration.command_runner import run_command_sync
+from src.integration.maven.conflict_cache import conflict_cache
+from src.integration.maven.dependency_resolver import ArtifactNotAvailable, resolve_dependency_conflicts
+from src.integration.maven.dependency_tree_parser import find_dependency_conflicts
+from src.integration.maven.maven_client import maven_build, maven_command_args
 from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 
@@ -13,6 +19,12 @@ from src.utils.logger_setup import log_with_project as project_logger
 def has_dependency_conflict(project_path):
     """
     Checks for dependency conflicts in the specified Maven project.
+    Maven writes the tree of every module into one temporary file which is then
+    stream-parsed, the tree is never held in memory as a whole.
+    With dependency_resolver = "offline" in settings.toml the trees are resolved in-process
+    from the local repository first, Maven only runs when an artifact is missing there.
+    Results are cached by the content of the project's pom.xml files and the Maven
+    settings, an unchanged project does not run Maven again.
     
     Args:
         project_path (str): The directory where the Maven project is located.
@@ -22,87 +34,138 @@ def has_dependency_conflict(project_path):
     """
     project_logger(f"⏳ Checking dependencies in project: {project_path}", project_path)
 
+    cache_key = conflict_cache.key_for(project_path)
+    cached = conflict_cache.get(cache_key)
+    if cached is not None:
+        outcome = "No dependency conflicts" if cached else "Dependency conflicts"
+        project_logger(f"{'✅' if cached else '🚨'} {outcome} (cached, pom.xml files unchanged).", project_path)
+        return cached
+
+    if get_config("dependency_resolver", "maven") == "offline":
+        try:
+            no_conflict = _report_conflicts(project_path, resolve_dependency_conflicts(project_path))
+            conflict_cache.put(cache_key, no_conflict)
+            return no_conflict
+        except ArtifactNotAvailable as e:
+            project_logger(f"Offline resolution not possible, running Maven: {e}", project_path, level="debug")
+
+    tree_dir = tempfile.mkdtemp(prefix="reporanger-tree-")
+    tree_file = os.path.join(tree_dir, "dependency-tree.json")
     try:
-        command_args = shlex.split("mvn dependency:tree -DoutputType=json")
+        command_args = maven_command_args("mvn dependency:tree -DoutputType=json -DappendOutput=true")
+        command_args.append(f"-DoutputFile={tree_file}")
         project_logger(f"Running command: {command_args}", project_path,level="debug")
 
-        result = subprocess.run(
-            command_args, 
-            cwd=project_path, 
-            capture_output=True, 
-            shell=True,
-            text=True
-        )
+        with maven_build(command_args, project_path):
+            result = run_recorded(run_command_sync, command_args, cwd=project_path, output_files=[tree_file])
 
         if result.returncode != 0:
             project_logger(
-                f"Command failed (code={result.returncode}): {result.stderr}",
+                f"Command failed (code={result.returncode}): {result.stderr or result.stdout[-2000:]}",
                 project_path,
                 level="error"
             )   
-            return False, result.stderr
+            return False
+
+        return check_dependency_tree_file(project_path, tree_file, cache_key)
 
     except FileNotFoundError as e:
         project_logger(f"command not found: {e}", project_path, level="error")
-        return False, str(e)
+        return False
     except Exception as e:
         project_logger(f"Unexpected error while running command: {e}", project_path, level="error")
-        return False, str(e)
+        return False
+    finally:
+        shutil.rmtree(tree_dir, ignore_errors=True)
+
+
+class _ChainedFiles:
+    """Reads several text files one after another as one stream, e.g. the tree files of all modules."""
+
+    def __init__(self, paths):
+        self.paths = iter(paths)
+        self.current = None
+
+    def read(self, size=-1):
+        while True:
+            if self.current is None:
+                path = next(self.paths, None)
+                if path is None:
+                    return ""
+                self.current = open(path, "r", encoding="utf-8")
+            data = self.current.read(size)
+            if data:
+                return data
+            self.close()
+
+    def close(self):
+        if self.current is not None:
+            self.current.close()
+            self.current = None
 
-    try:
-        project_logger(f"⏳ Loading json data: {project_path}", project_path, level="debug")
-        conflicts = parse_dependency_tree(result.stdout)
-        project_logger(f"⏳ Loaded json data", project_path, level="debug")
 
+def check_dependency_tree_file(project_path, tree_file, cache_key=None):
+    """
+    Stream-parses a tree Maven wrote with -DoutputType=json -DoutputFile and reports
+    conflicting versions together with the dependency paths that pulled them in.
+    tree_file may also be a list of files, one per module, read as one tree; every
+    one of them has to exist. The result is stored under cache_key when the tree could be read.
+
+    Returns:
+        bool: Returns True if there are no conflicts, False otherwise.
+    """
+    try:
+        tree_files = [tree_file] if isinstance(tree_file, str) else list(tree_file)
+        if not tree_files:
+            raise FileNotFoundError(f"No dependency tree files for {project_path}")
+        project_logger(f"⏳ Parsing dependency tree: {', '.join(tree_files)}", project_path, level="debug")
+        stream = _ChainedFiles(tree_files)
+        try:
+            tree = find_dependency_conflicts(stream)
+        finally:
+            stream.close()
+        project_logger(f"⏳ Parsed {tree.nodes} dependency nodes", project_path, level="debug")
+
+    except OSError as e:
+        project_logger(f"❌ Dependency tree could not be read: {e}", project_path, level="error")
+        return False
     except ValueError as e:
-        project_logger(f"❌ {e}",project_path, level="error")
+        project_logger(f"❌ Error parsing dependency tree: {e}",project_path, level="error")
         return False
 
+    no_conflict = _report_conflicts(project_path, tree)
+    conflict_cache.put(cache_key, no_conflict)
+    return no_conflict
+
+
+def _report_conflicts(project_path, tree):
+    conflicts = tree.conflicts()
     if conflicts:
         project_logger("🚨 Dependency version conflicts detected!",project_path)
         for dep, versions in conflicts.items():
             project_logger(f"🔴 {dep} has multiple versions: {', '.join(versions)}", project_path)
+            for version, paths in versions.items():
+                for path in paths:
+                    project_logger(f"   {version} via {path}", project_path)
         return False
 
     project_logger("✅ No dependency conflicts detected.", project_path)
     return True
 
 
-
 def parse_dependency_tree(output):
+    """
+    Returns groupId:artifactId -> set of versions for the conflicting dependencies in a JSON
+    dependency tree given as a string (console output with [INFO] prefixes is accepted).
+    """
+    json_start = output.find('{')
+    if json_start < 0:
+        raise ValueError("No JSON dependency tree found in Maven output")
+    json_output = re.sub(r'^\[INFO\] ?', '', output[json_start:], flags=re.MULTILINE)
+    json_end = json_output.rfind('}') + 1
     try:
-        # Extract JSON part from the output
-        json_start = output.find('{')
-        json_end = output.rfind('}') + 1
-        json_output = output[json_start:json_end]
-
-        logger.debug(f"Extracted JSON: {json_output}")
-
-        # Remove [INFO] prefixes
-        json_output = re.sub(r'\[INFO\]\s*', '', json_output)
-
-        logger.debug(f"Preprocessed JSON: {json_output}")
-
-        # Preprocess the JSON output to ensure all keys are properly quoted
-        json_output = re.sub(r'([a-zA-Z_][a-zA-Z0-9_-]*)\s*:', r'"\1":', json_output)
-
-        logger.debug(f"Preprocessed JSON: {json_output}")
-
-        dependency_data = json.loads(json_output)
-        dependency_versions = defaultdict(set)
-
-        for dependency in dependency_data.get("dependencies", []):
-            group_artifact = f"{dependency['groupId']}:{dependency['artifactId']}"
-            version = dependency["version"]
-            dependency_versions[group_artifact].add(version)
-
-        conflicts = {dep: versions for dep, versions in dependency_versions.items() if len(versions) > 1}
-
-        return conflicts
-    except json.JSONDecodeError as e:
+        tree = find_dependency_conflicts(io.StringIO(json_output[:json_end]))
+    except ValueError as e:
         logger.error(f"Error parsing Maven output as JSON: {e}")
         raise ValueError(f"Error parsing Maven output as JSON: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        raise ValueError(f"Unexpected error: {e}")
-
+    return {dep: set(versions) for dep, versions in tree.conflicts().items()}
@@ -0,0 +1,110 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from src.config.settings_reader import get_config
+from src.integration.command_runner import run_command_sync
+from src.utils.logger_setup import global_logger as logger
+
+try:
+    import psutil
+except ImportError:  # Memory based recycling is skipped without psutil
+    psutil = None
+
+
+DAEMON_MAIN_CLASS = "org.mvndaemon.mvnd"
+# Seconds between two RSS checks, each one scans every process
+RSS_CHECK_INTERVAL = 30.0
+
+
+def is_daemon_mode() -> bool:
+    return get_config("maven_mode", "mvn") == "mvnd"
+
+
+class MavenDaemonManager:
+    """
+    Keeps track of builds sent to the Maven daemon (mvnd) and recycles the daemons.
+
+    mvnd keeps warm JVMs with loaded plugins between builds. Long-lived daemons grow,
+    so after `mvnd_max_builds` builds, or when a daemon's RSS exceeds
+    `mvnd_max_rss_mb`, all daemons are stopped with 'mvnd --stop'. Once a recycle is
+    due new builds wait, so the running ones drain even under parallel load; the next
+    build starts a fresh daemon after 'mvnd --stop' returned.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.recycled = threading.Condition(self.lock)
+        self.in_flight = 0
+        self.builds = 0
+        self.recycle_pending = False
+        self.recycling = False
+        self.rss_checked_at = None
+
+    def executable(self) -> str:
+        return get_config("mvnd_executable", "mvnd")
+
+    @contextmanager
+    def build(self, cwd=None):
+        with self.lock:
+            while self.recycling or self.recycle_pending:
+                self.recycled.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            over_rss = self._over_rss_limit()
+            with self.lock:
+                self.in_flight -= 1
+                self.builds += 1
+                if over_rss or self._over_build_limit():
+                    self.recycle_pending = True
+                recycle = self.recycle_pending and self.in_flight == 0
+                if recycle:
+                    self.recycle_pending = False
+                    self.builds = 0
+                    self.recycling = True
+            if recycle:
+                try:
+                    self.stop_daemons(cwd)
+                finally:
+                    with self.lock:
+                        self.recycling = False
+                        self.recycled.notify_all()
+
+    def stop_daemons(self, cwd=None):
+        logger.info("Recycling Maven daemons (mvnd --stop)")
+        result = run_command_sync([self.executable(), "--stop"], cwd=cwd)
+        if result.returncode != 0:
+            logger.warning(f"Stopping Maven daemons failed: {result.stderr or result.stdout}")
+
+    def _over_build_limit(self) -> bool:
+        max_builds = int(get_config("mvnd_max_builds", 50))
+        return bool(max_builds) and self.builds >= max_builds
+
+    def _over_rss_limit(self) -> bool:
+        """Checks the daemon RSS at most every RSS_CHECK_INTERVAL seconds, outside the lock."""
+        max_rss_mb = int(get_config("mvnd_max_rss_mb", 0))
+        if not max_rss_mb:
+            return False
+        now = time.monotonic()
+        with self.lock:
+            if self.rss_checked_at is not None and now - self.rss_checked_at < RSS_CHECK_INTERVAL:
+                return False
+            self.rss_checked_at = now
+        return self.daemon_rss_mb() > max_rss_mb
+
+    def daemon_rss_mb(self) -> float:
+        """Largest RSS of a running mvnd daemon in MB, 0 when psutil is not installed."""
+        if psutil is None:
+            return 0
+        largest = 0
+        for process in psutil.process_iter(["cmdline", "memory_info"]):
+            cmdline = process.info.get("cmdline") or []
+            memory_info = process.info.get("memory_info")
+            if memory_info and any(DAEMON_MAIN_CLASS in arg for arg in cmdline):
+                largest = max(largest, memory_info.rss)
+        return largest / (1024 * 1024)
+
+
+daemon_manager = MavenDaemonManager()
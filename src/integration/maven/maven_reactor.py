@@ -0,0 +1,181 @@
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+from src.config.settings_reader import get_config
+from src.integration.command_recorder import run_recorded
+from src.integration.command_runner import run_command_sync
+from src.integration.maven.maven_client import maven_build, maven_command_args
+from src.integration.maven.pom_reader import read_project_coordinates, walk_project_poms
+from src.utils.logger_setup import global_logger as logger
+from src.utils.logger_setup import log_with_project as project_logger
+
+
+UPDATE_GOALS = "versions:update-properties versions:update-parent versions:use-latest-versions versions:display-plugin-updates -Dversions.onlyReleases=true"
+# Relative outputFile values are resolved against each module's basedir
+DEPENDENCY_TREE_FILE = os.path.join("target", "reporanger-dependency-tree.json")
+DEPENDENCY_TREE_GOALS = f"dependency:tree -DoutputType=json -DoutputFile={DEPENDENCY_TREE_FILE}"
+
+SUMMARY_LINE = re.compile(r"^\[INFO\] (?P<name>.+?) \.{2,}\s*(?P<status>SUCCESS|FAILURE|SKIPPED)\b")
+GOAL_HEADER = re.compile(r"^\[INFO\] --- .* @ (?P<artifact_id>\S+) ---")
+# "[BuilderThread 2] [INFO] ..." with showThreadName, Maven 4 names the thread after the module: "[svc-a] [INFO] ..."
+THREAD_PREFIX = re.compile(r"^\[(?P<thread>[^\]]+)\] (?=\[(?:INFO|WARNING|ERROR|DEBUG)\])")
+# Parallel modules interleave their output, the thread name tells which module a line belongs to
+SHOW_THREAD_NAME = "-Dorg.slf4j.simpleLogger.showThreadName=true"
+# The aggregator folder is temporary, reactor builds are recorded and replayed under this cwd
+REACTOR_TRACE_CWD = "<reactor>"
+
+
+@dataclass
+class ReactorResult:
+    project_path: str
+    status: str  # "SUCCESS", "FAILURE", "SKIPPED" or "UNKNOWN"
+    output: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.status == "SUCCESS"
+
+
+AGGREGATOR_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>reporanger</groupId>
+  <artifactId>reporanger-aggregator</artifactId>
+  <version>1</version>
+  <packaging>pom</packaging>
+  <modules>
+{modules}
+  </modules>
+</project>
+"""
+
+
+def dependency_tree_files(project_path) -> list[str]:
+    """The files DEPENDENCY_TREE_GOALS writes for a project: one in the project and one in every module."""
+    return [
+        os.path.join(os.path.dirname(pom_path), DEPENDENCY_TREE_FILE)
+        for pom_path, _, _ in walk_project_poms(os.path.join(project_path, "pom.xml"))
+    ]
+
+
+def remove_dependency_tree_files(tree_files):
+    """Deletes the trees of an earlier build, so a module Maven skips or fails leaves no stale tree behind."""
+    for tree_file in tree_files:
+        try:
+            os.remove(tree_file)
+        except FileNotFoundError:
+            pass
+
+
+def write_aggregator_pom(project_paths, directory) -> str:
+    """Writes a pom.xml into directory that lists every project as a module."""
+    modules = []
+    for project_path in project_paths:
+        try:
+            module = os.path.relpath(project_path, directory)
+        except ValueError:
+            module = project_path  # Different drive on Windows
+        modules.append(f"    <module>{escape(module.replace(os.sep, '/'))}</module>")
+
+    pom_path = os.path.join(directory, "pom.xml")
+    with open(pom_path, "w", encoding="utf-8") as f:
+        f.write(AGGREGATOR_TEMPLATE.format(modules="\n".join(modules)))
+    return pom_path
+
+
+def run_reactor(project_paths, goals, threads=None, output_files=()) -> dict[str, ReactorResult] | None:
+    """
+    Runs goals for all projects in one Maven reactor build through a temporary aggregator POM.
+    output_files are the files the goals write, restored when the build is replayed.
+
+    Returns:
+        dict[str, ReactorResult]: project path -> outcome, or None when Maven could not set up
+        the reactor (e.g. two projects share groupId:artifactId). Callers then fall back to
+        one Maven run per project.
+    """
+    if not project_paths:
+        return {}
+
+    threads = threads or get_config("maven_reactor_threads", "1C")
+    names = {}
+    for project_path in project_paths:
+        try:
+            names[project_path] = read_project_coordinates(os.path.join(project_path, "pom.xml"))
+        except (OSError, ValueError) as e:
+            project_logger(f"pom.xml could not be read for reactor build: {e}", project_path, level="error")
+            return None
+
+    aggregator_dir = tempfile.mkdtemp(prefix="reporanger-reactor-")
+    try:
+        write_aggregator_pom(project_paths, aggregator_dir)
+        # A relative -f keeps the arguments equal between runs, so a replay matches them
+        command_args = maven_command_args(f"mvn {goals}") + ["-f", "pom.xml", "-T", str(threads), "--fail-at-end"]
+        if str(threads) != "1":
+            command_args.append(SHOW_THREAD_NAME)
+        logger.info(f"Running reactor build for {len(project_paths)} projects: {' '.join(command_args)}")
+        with maven_build(command_args, aggregator_dir):
+            result = run_recorded(
+                run_command_sync, command_args, cwd=aggregator_dir, output_files=output_files, trace_cwd=REACTOR_TRACE_CWD
+            )
+    except Exception as e:
+        logger.error(f"Reactor build could not be started: {e}")
+        return None
+    finally:
+        shutil.rmtree(aggregator_dir, ignore_errors=True)
+
+    results = split_reactor_output(result.stdout, names)
+    if results is None:
+        logger.error(f"Reactor build failed before building projects (code={result.returncode}): {result.stdout[-2000:]}{result.stderr}")
+    return results
+
+
+def split_reactor_output(output, names) -> dict[str, ReactorResult] | None:
+    """
+    Splits reactor output into per project outcomes.
+
+    Args:
+        output (str): Maven stdout.
+        names (dict): project path -> coordinates from read_project_coordinates.
+    """
+    artifact_ids = {coordinates["artifactId"] for coordinates in names.values()}
+    statuses = {}
+    lines_by_artifact = {}
+    current = {}  # thread name (None without thread names) -> artifactId of its latest goal header
+    for line in output.splitlines():
+        thread_prefix = THREAD_PREFIX.match(line)
+        thread = thread_prefix.group("thread") if thread_prefix else None
+        if thread_prefix:
+            line = line[thread_prefix.end():]
+        match = SUMMARY_LINE.match(line)
+        if match:
+            statuses.setdefault(match.group("name").strip(), match.group("status"))
+        header = GOAL_HEADER.match(line)
+        if header:
+            current[thread] = header.group("artifact_id")
+        artifact_id = thread if thread in artifact_ids else current.get(thread)
+        if artifact_id:
+            lines_by_artifact.setdefault(artifact_id, []).append(line)
+    if not statuses:
+        return None
+
+    results = {}
+    for project_path, coordinates in names.items():
+        status = _find_status(statuses, coordinates)
+        output_lines = lines_by_artifact.get(coordinates["artifactId"], [])
+        results[project_path] = ReactorResult(project_path, status, "\n".join(output_lines))
+    return results
+
+
+def _find_status(statuses, coordinates) -> str:
+    for candidate in (coordinates["name"], coordinates["artifactId"]):
+        if candidate in statuses:
+            return statuses[candidate]
+    # Maven 3.6+ may append the version to the first and last summary line
+    for name, status in statuses.items():
+        if name.startswith(f"{coordinates['name']} "):
+            return status
+    return "UNKNOWN"
@@ -0,0 +1,156 @@
+import os
+import re
+import xml.etree.ElementTree as ET
+
+from src.utils.logger_setup import global_logger as logger
+
+
+POM_NAMESPACE = "http://maven.apache.org/POM/4.0.0"
+PROPERTY_REFERENCE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _child_text(element, tag):
+    """Returns the text of a direct child, with or without the POM namespace."""
+    if element is None:
+        return None
+    child = element.find(f"{{{POM_NAMESPACE}}}{tag}")
+    if child is None:
+        child = element.find(tag)
+    if child is None or child.text is None:
+        return None
+    return child.text.strip()
+
+
+def _children(element, tag):
+    if element is None:
+        return []
+    return element.findall(f"{{{POM_NAMESPACE}}}{tag}") or element.findall(tag)
+
+
+def _first_child(element, tag):
+    children = _children(element, tag)
+    return children[0] if children else None
+
+
+def read_pom_root(pom_path):
+    """Parses a pom.xml and returns its <project> element, raising ValueError when it is not valid XML."""
+    try:
+        return ET.parse(pom_path).getroot()
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid pom.xml {pom_path}: {e}")
+
+
+def read_project_coordinates(pom_path) -> dict:
+    """
+    Reads groupId, artifactId, version and name of a pom.xml.
+    groupId and version are inherited from <parent> when the project does not declare them.
+    """
+    root = read_pom_root(pom_path)
+    parent = _first_child(root, "parent")
+
+    artifact_id = _child_text(root, "artifactId")
+    return {
+        "groupId": _child_text(root, "groupId") or _child_text(parent, "groupId"),
+        "artifactId": artifact_id,
+        "version": _child_text(root, "version") or _child_text(parent, "version"),
+        "name": _child_text(root, "name") or artifact_id,
+    }
+
+
+def _read_dependencies(container) -> list[dict]:
+    dependencies = []
+    for dependency in _children(_first_child(container, "dependencies"), "dependency"):
+        dependencies.append({
+            "groupId": _child_text(dependency, "groupId"),
+            "artifactId": _child_text(dependency, "artifactId"),
+            "version": _child_text(dependency, "version"),
+            "type": _child_text(dependency, "type") or "jar",
+            "classifier": _child_text(dependency, "classifier"),
+            "scope": _child_text(dependency, "scope"),
+            "optional": (_child_text(dependency, "optional") or "false") == "true",
+            "exclusions": [
+                (_child_text(exclusion, "groupId"), _child_text(exclusion, "artifactId"))
+                for exclusion in _children(_first_child(dependency, "exclusions"), "exclusion")
+            ],
+        })
+    return dependencies
+
+
+def read_pom_model(pom_path) -> dict:
+    """
+    Reads the parts of a pom.xml the planners and resolvers work with, without interpolation:
+    coordinates, parent, properties, modules, dependencies and dependencyManagement.
+    """
+    root = read_pom_root(pom_path)
+    parent = _first_child(root, "parent")
+    properties = {}
+    properties_element = _first_child(root, "properties")
+    for element in list(properties_element) if properties_element is not None else []:
+        if not isinstance(element.tag, str):
+            continue  # Comments
+        tag = element.tag.split("}", 1)[-1]
+        properties[tag] = (element.text or "").strip()
+
+    artifact_id = _child_text(root, "artifactId")
+    return {
+        "groupId": _child_text(root, "groupId") or _child_text(parent, "groupId"),
+        "artifactId": artifact_id,
+        "version": _child_text(root, "version") or _child_text(parent, "version"),
+        "packaging": _child_text(root, "packaging") or "jar",
+        "name": _child_text(root, "name") or artifact_id,
+        "parent": None if parent is None else {
+            "groupId": _child_text(parent, "groupId"),
+            "artifactId": _child_text(parent, "artifactId"),
+            "version": _child_text(parent, "version"),
+            "relativePath": _child_text(parent, "relativePath"),
+        },
+        "properties": properties,
+        "modules": [module.text.strip() for module in _children(_first_child(root, "modules"), "module") if module.text],
+        "dependencies": _read_dependencies(root),
+        "dependencyManagement": _read_dependencies(_first_child(root, "dependencyManagement")),
+    }
+
+
+def walk_project_poms(pom_path, inherited_properties=None, seen=None):
+    """
+    Yields (pom_path, model, properties) for a pom.xml and its modules, recursively.
+    properties are the pom's own properties on top of those of the aggregating poms.
+    Unreadable poms are logged and skipped.
+    """
+    seen = seen if seen is not None else set()
+    real_path = os.path.realpath(pom_path)
+    if real_path in seen:
+        return
+    seen.add(real_path)
+
+    try:
+        model = read_pom_model(pom_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skipping unreadable {pom_path}: {e}")
+        return
+
+    properties = {**(inherited_properties or {}), **model["properties"]}
+    yield pom_path, model, properties
+    for module in model["modules"]:
+        module_path = os.path.join(os.path.dirname(pom_path), module)
+        if os.path.isdir(module_path):
+            module_path = os.path.join(module_path, "pom.xml")
+        yield from walk_project_poms(module_path, properties, seen)
+
+
+def interpolate(value, properties, model=None):
+    """Replaces ${...} references with properties and project.* coordinates, unknown ones are kept."""
+    if not value or "${" not in value:
+        return value
+    if model:
+        properties = {
+            **properties,
+            "project.groupId": model["groupId"], "project.artifactId": model["artifactId"],
+            "project.version": model["version"],
+        }
+    for _ in range(10):
+        interpolated = PROPERTY_REFERENCE.sub(lambda m: properties.get(m.group(1)) or m.group(0), value)
+        if interpolated == value:
+            break
+        value = interpolated
+    return value
@@ -0,0 +1,92 @@
+import json
+import re
+import socket
+import time
+
+from src.config.settings_reader import get_config
+
+
+READINESS_PROBES = ("none", "port", "actuator")
+DEFAULT_PROBE_TIMEOUT = 30.0
+PROBE_INTERVAL = 0.2
+# "Started DemoApplication in 4.321 seconds (process running for 5.1)"
+STARTED_LINE = re.compile(r"\bStarted (?P<application>\S+) in (?P<seconds>\d+(?:\.\d+)?) seconds")
+# "Tomcat started on port 8080 (http)", "Tomcat started on port(s): 8080 (http)", "Netty started on port 8080"
+PORT_LINE = re.compile(r"\b(?:Tomcat|Jetty|Netty|Undertow) started on port(?:\(s\))?:?\s*(?P<port>\d+)")
+
+
+class SpringBootReadiness:
+    """
+    Readiness check of a 'mvn spring-boot:run' service for the ServiceSupervisor.
+
+    The run counts as started with the "Started ... in X seconds" line. Depending on
+    readiness_probe in settings.toml that is confirmed by connecting to the HTTP port
+    the embedded server logged ("port", the default), by GET /actuator/health answering
+    UP ("actuator"), or taken as is ("none"). readiness_port overrides the logged port,
+    e.g. for a separate management port.
+    """
+
+    def __init__(self, probe=None, port=None, host="127.0.0.1", timeout=None, actuator_path="/actuator/health"):
+        self.probe = probe or get_config("readiness_probe", "port")
+        if self.probe not in READINESS_PROBES:
+            raise ValueError(f"Unknown readiness probe: {self.probe}, expected one of {', '.join(READINESS_PROBES)}")
+        self.configured_port = port or int(get_config("readiness_port", 0)) or None
+        self.host = host
+        self.timeout = timeout or float(get_config("readiness_probe_timeout", DEFAULT_PROBE_TIMEOUT))
+        self.actuator_path = actuator_path
+        self.reset()
+
+    def reset(self):
+        self.port = self.configured_port
+        self.application = None
+        self.reported_seconds = None
+
+    def feed(self, line) -> bool:
+        """Takes one output line, returns True once the application logged its startup."""
+        if self.port is None:
+            port_match = PORT_LINE.search(line)
+            if port_match:
+                self.port = int(port_match.group("port"))
+        started = STARTED_LINE.search(line)
+        if not started:
+            return False
+        self.application = started.group("application")
+        self.reported_seconds = float(started.group("seconds"))
+        return True
+
+    def confirm(self) -> bool:
+        """Runs the probe until it passes or timeout seconds passed."""
+        if self.probe == "none" or self.port is None:
+            return True  # Without a known port there is nothing to probe, e.g. a non-web application
+        check = self._port_open if self.probe == "port" else self._actuator_up
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if check():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(PROBE_INTERVAL)
+
+    # ------------------ Helper methods ------------------
+
+    def _port_open(self) -> bool:
+        try:
+            with socket.create_connection((self.host, self.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def _actuator_up(self) -> bool:
+        import urllib.error
+        import urllib.request  # Only the actuator probe needs http.client, most runs never load it
+
+        url = f"http://{self.host}:{self.port}{self.actuator_path}"
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                body = response.read()
+        except (urllib.error.URLError, OSError):
+            return False  # Also covers 503 while the health status is DOWN or OUT_OF_SERVICE
+        try:
+            return json.loads(body).get("status", "UP") == "UP"
+        except (ValueError, AttributeError):
+            return True  # Health endpoint without a JSON body, the 200 is enough
@@ -0,0 +1,149 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from src.integration.maven.local_repository import compare_versions, newer_releases
+from src.integration.maven.pom_reader import walk_project_poms
+from src.utils.logger_setup import log_with_project as project_logger
+
+
+PROPERTY_REFERENCE = re.compile(r"^\$\{([^}]+)\}$")
+
+
+@dataclass
+class UpdateCandidate:
+    project_name: str
+    kind: str  # "parent", "dependency", "managed" or "property"
+    artifact: str  # groupId:artifactId, or the artifacts sharing a property
+    current: str
+    latest: str
+    property: Optional[str] = None
+    pom_path: Optional[str] = None
+
+
+def plan_project_updates(project_name, project_path, repository=None) -> list[UpdateCandidate]:
+    """
+    Lists the release upgrades the versions:* goals of mvn_update_project would apply, without
+    running Maven: pom.xml files are parsed in Python and compared against the maven-metadata*.xml
+    files cached in the local repository. Nothing is modified and no git branch is created.
+
+    Only versions the local repository already knows about are reported, run Maven once
+    (or any build that refreshes metadata) to see versions published since.
+
+    Args:
+        project_name (str): Name shown in the plan.
+        project_path (str): Project directory containing pom.xml, modules are followed.
+        repository (str): Local repository, defaults to local_repository_path().
+
+    Returns:
+        list[UpdateCandidate]: One entry per upgradable parent, dependency or version property.
+    """
+    candidates = []
+    for pom_path, model, properties in walk_project_poms(os.path.join(project_path, "pom.xml")):
+        candidates.extend(_plan_pom(project_name, pom_path, model, properties, repository))
+    return candidates
+
+
+def _plan_pom(project_name, pom_path, model, properties, repository) -> list[UpdateCandidate]:
+    candidates = []
+    parent = model["parent"]
+    if parent and parent["groupId"] and parent["artifactId"] and _is_literal(parent["version"]):
+        newer = newer_releases(parent["groupId"], parent["artifactId"], parent["version"], repository)
+        if newer:
+            artifact = f"{parent['groupId']}:{parent['artifactId']}"
+            candidates.append(UpdateCandidate(project_name, "parent", artifact, parent["version"], newer[-1], pom_path=pom_path))
+
+    # property name -> list of (groupId, artifactId) using it
+    property_users = {}
+    for kind, dependencies in (("managed", model["dependencyManagement"]), ("dependency", model["dependencies"])):
+        for dependency in dependencies:
+            group_id, artifact_id, version = dependency["groupId"], dependency["artifactId"], dependency["version"]
+            if not group_id or not artifact_id or not version:
+                continue  # Version comes from a parent or a BOM
+            reference = PROPERTY_REFERENCE.match(version)
+            if reference:
+                if reference.group(1) in model["properties"]:
+                    property_users.setdefault(reference.group(1), []).append((group_id, artifact_id))
+                continue  # Properties of a parent pom are updated in the parent
+            if not _is_literal(version):
+                continue
+            newer = newer_releases(group_id, artifact_id, version, repository)
+            if newer:
+                candidates.append(UpdateCandidate(project_name, kind, f"{group_id}:{artifact_id}", version, newer[-1], pom_path=pom_path))
+
+    for name, users in property_users.items():
+        current = properties.get(name)
+        if not _is_literal(current):
+            continue
+        latest = _common_newest_release(users, current, repository)
+        if latest:
+            artifacts = ", ".join(sorted({f"{group_id}:{artifact_id}" for group_id, artifact_id in users}))
+            candidates.append(UpdateCandidate(project_name, "property", artifacts, current, latest, property=name, pom_path=pom_path))
+    return candidates
+
+
+def _common_newest_release(users, current, repository) -> Optional[str]:
+    """
+    Like versions:update-properties, a property shared by several artifacts only moves to
+    a version every one of them has been released with.
+    """
+    common = None
+    for group_id, artifact_id in set(users):
+        versions = set(newer_releases(group_id, artifact_id, current, repository))
+        common = versions if common is None else common & versions
+    if not common:
+        return None
+    latest = None
+    for version in common:
+        if latest is None or compare_versions(version, latest) > 0:
+            latest = version
+    return latest
+
+
+def _is_literal(version) -> bool:
+    # Ranges, interpolated and missing versions are left alone, as the versions plugin does
+    return bool(version) and "${" not in version and version[0] not in "[("
+
+
+def plan_workspace_updates(projects_map, repository=None, max_workers=8) -> dict[str, list[UpdateCandidate]]:
+    """Plans every project in projects_map, returns project name -> candidates in projects_map order."""
+    def _plan(item):
+        project_name, project_path = item
+        try:
+            return project_name, plan_project_updates(project_name, project_path, repository)
+        except Exception as e:
+            project_logger(f"Update plan failed: {e}", project_path, level="error")
+            return project_name, []
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="update-plan") as executor:
+        plans = dict(executor.map(_plan, projects_map.items()))
+    return {project_name: plans[project_name] for project_name in projects_map}
+
+
+def format_update_plan(plans) -> str:
+    """Renders the plans of one or more projects as text tables, with a workspace summary for several."""
+    lines = []
+    for project_name, candidates in plans.items():
+        lines.append(f"{project_name}: {len(candidates)} upgrade(s) available")
+        for candidate in candidates:
+            target = f"{candidate.property} ({candidate.artifact})" if candidate.property else candidate.artifact
+            lines.append(f"  {candidate.kind:<10} {target:<60} {candidate.current} -> {candidate.latest}")
+        lines.append("")
+
+    if len(plans) > 1:
+        # artifact -> (newest target, projects using it)
+        by_artifact = {}
+        for candidates in plans.values():
+            for candidate in candidates:
+                for artifact in candidate.artifact.split(", "):
+                    latest, projects = by_artifact.setdefault(artifact, [candidate.latest, set()])
+                    if compare_versions(candidate.latest, latest) > 0:
+                        by_artifact[artifact][0] = candidate.latest
+                    projects.add(candidate.project_name)
+        lines.append(f"Workspace: {sum(len(c) for c in plans.values())} upgrade(s) in {sum(1 for c in plans.values() if c)} project(s)")
+        for artifact, (latest, projects) in sorted(by_artifact.items(), key=lambda item: (-len(item[1][1]), item[0])):
+            lines.append(f"  {artifact:<60} -> {latest:<15} {len(projects)} project(s)")
+
+    return "\n".join(lines).rstrip() or "No projects to plan."
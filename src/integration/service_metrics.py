@@ -0,0 +1,184 @@
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+
+from src.config.settings_reader import get_config
+from src.integration.service_supervisor import service_supervisor
+from src.utils.logger_setup import global_logger as logger
+
+try:
+    import psutil
+except ImportError:  # Services run without metrics when psutil is not installed
+    psutil = None
+
+
+DEFAULT_SAMPLE_INTERVAL = 2.0
+DEFAULT_HISTORY_SAMPLES = 1800
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+@dataclass
+class MetricSample:
+    service: str
+    timestamp: float
+    cpu_percent: float
+    rss_bytes: int
+    threads: int
+    open_fds: int
+    processes: int
+
+
+def sparkline(values, width=30) -> str:
+    """The last width values as block characters, scaled between their minimum and maximum."""
+    values = list(values)[-width:]
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_BLOCKS[0 if not high else len(SPARK_BLOCKS) // 2] * len(values)
+    scale = (len(SPARK_BLOCKS) - 1) / (high - low)
+    return "".join(SPARK_BLOCKS[round((value - low) * scale)] for value in values)
+
+
+def _format_bytes(size) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class ServiceMetricsSampler:
+    """
+    Samples CPU%, RSS, threads and open file descriptors of every running service every
+    interval seconds, summed over the process tree the service started (Maven and the
+    application JVM it forks), and keeps the last history_samples samples per service.
+
+    psutil needs two readings of a process for its CPU%, so the psutil.Process objects are
+    kept between samples; the first sample of a new process reports 0 CPU.
+    """
+
+    def __init__(self, supervisor=service_supervisor, interval=None, history_samples=None):
+        self.supervisor = supervisor
+        self.interval = interval or float(get_config("metrics_sample_interval", DEFAULT_SAMPLE_INTERVAL))
+        self.history_samples = history_samples or int(get_config("metrics_history_samples", DEFAULT_HISTORY_SAMPLES))
+        self.lock = threading.Lock()
+        self.history = {}
+        self.processes = {}  # pid -> psutil.Process, reused for CPU% deltas
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def available(self) -> bool:
+        return psutil is not None
+
+    def start(self):
+        if not self.available or (self.thread and self.thread.is_alive()):
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="service-metrics", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+
+    def sample(self) -> list[MetricSample]:
+        """Takes one sample of every running service and adds it to the history."""
+        if not self.available:
+            return []
+        samples, seen = [], set()
+        for service in self.supervisor.list():
+            if service.status not in ("starting", "running", "unreachable", "stopping") or not service.pid:
+                continue
+            sample = self._sample_tree(service.name, service.pid, seen)
+            if sample:
+                samples.append(sample)
+        with self.lock:
+            for sample in samples:
+                self.history.setdefault(sample.service, deque(maxlen=self.history_samples)).append(sample)
+            # Forget processes that are gone, their pids may be reused
+            for pid in set(self.processes) - seen:
+                del self.processes[pid]
+        return samples
+
+    def samples(self, service_name) -> list[MetricSample]:
+        with self.lock:
+            return list(self.history.get(service_name, ()))
+
+    def summary(self, service_name, width=30) -> str:
+        """Latest values of a service with sparklines of its recent history, for the detail panel."""
+        samples = self.samples(service_name)
+        if not samples:
+            return "" if self.available else "Metrics unavailable, install psutil."
+        latest = samples[-1]
+        return "\n".join([
+            f"CPU     {latest.cpu_percent:6.1f} %   {sparkline((s.cpu_percent for s in samples), width)}",
+            f"RSS   {_format_bytes(latest.rss_bytes):>10}   {sparkline((s.rss_bytes for s in samples), width)}",
+            f"Threads {latest.threads:6d}     {sparkline((s.threads for s in samples), width)}",
+            f"FDs     {latest.open_fds:6d}     {sparkline((s.open_fds for s in samples), width)}",
+            f"Processes {latest.processes}",
+        ])
+
+    def export(self, path) -> int:
+        """
+        Writes the history of every service to path, as JSON for a .json path, as CSV otherwise.
+
+        Returns:
+            int: Number of samples written.
+        """
+        with self.lock:
+            samples = [sample for history in self.history.values() for sample in history]
+        samples.sort(key=lambda sample: (sample.timestamp, sample.service))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if path.endswith(".json"):
+                json.dump([asdict(sample) for sample in samples], f, indent=2)
+            else:
+                writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(MetricSample)])
+                writer.writeheader()
+                writer.writerows(asdict(sample) for sample in samples)
+        return len(samples)
+
+    # ------------------ Helper methods ------------------
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"Sampling service metrics failed: {e}")
+
+    def _sample_tree(self, service_name, pid, seen) -> MetricSample | None:
+        try:
+            root = self._process(pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        cpu_percent, rss_bytes, threads, open_fds, processes = 0.0, 0, 0, 0, 0
+        for process in tree:
+            process = self._process(process.pid, process)
+            try:
+                with process.oneshot():
+                    cpu_percent += process.cpu_percent()
+                    rss_bytes += process.memory_info().rss
+                    threads += process.num_threads()
+                    open_fds += process.num_fds() if hasattr(process, "num_fds") else process.num_handles()
+            except psutil.Error:
+                continue  # Exited while sampling, or not ours to inspect
+            seen.add(process.pid)
+            processes += 1
+        return MetricSample(service_name, time.time(), round(cpu_percent, 1), rss_bytes, threads, open_fds, processes)
+
+    def _process(self, pid, process=None):
+        cached = self.processes.get(pid)
+        if cached is None:
+            cached = self.processes[pid] = process or psutil.Process(pid)
+        return cached
+
+
+service_metrics = ServiceMetricsSampler()
@@ -0,0 +1,332 @@
+import os
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+
+from src.config.settings_reader import get_config
+from src.utils.logger_setup import global_logger as logger
+from src.utils.logger_setup import log_with_project as project_logger
+
+
+RESTART_POLICIES = ("never", "on-failure", "always")
+DEFAULT_OUTPUT_LINES = 2000
+DEFAULT_MAX_RESTARTS = 3
+DEFAULT_STOP_TIMEOUT = 15.0
+RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 30.0
+# A service that ran this long before exiting starts over with its restart budget
+STABLE_UPTIME = 60.0
+
+
+class ManagedService:
+    """
+    One long-running process (e.g. 'mvn spring-boot:run') owned by the ServiceSupervisor.
+
+    status is one of "starting", "running", "unreachable", "restarting", "stopping",
+    "stopped" (by the user), "exited" (code 0) or "failed". A service with a readiness check
+    stays "starting" until the check passes, ready_event is set and startup_seconds holds
+    the time since the process was spawned; a failed check makes it "unreachable" while the
+    process keeps running. Without a check it is "running" right away. The combined stdout/stderr is kept in a ring buffer of
+    max_lines lines; output_seq counts every line ever received, so a consumer can ask
+    for just the lines it has not seen yet with output_since().
+    """
+
+    def __init__(self, name, path, command, restart_policy, max_restarts, max_lines, readiness=None, on_ready=None):
+        self.name = name
+        self.path = path
+        self.command = command
+        self.restart_policy = restart_policy
+        self.max_restarts = max_restarts
+        self.readiness = readiness
+        self.on_ready = on_ready
+        self.ready_event = threading.Event()
+        self.startup_seconds = None
+        self.run = 0
+        self.lock = threading.Lock()
+        self.output = deque(maxlen=max(1, max_lines))
+        self.output_seq = 0
+        self.status = "starting"
+        self.process = None
+        self.pid = None
+        self.exit_code = None
+        self.restarts = 0
+        self.started_at = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def alive(self) -> bool:
+        return self.status in ("starting", "running", "unreachable", "restarting", "stopping")
+
+    def append_output(self, line):
+        with self.lock:
+            self.output.append(line)
+            self.output_seq += 1
+
+    def output_since(self, seq) -> tuple[list[str], int]:
+        """
+        Lines received after the first seq lines, and the seq to pass next time.
+        Lines that already fell out of the ring buffer are skipped.
+        """
+        with self.lock:
+            missing = min(self.output_seq - seq, len(self.output))
+            lines = list(self.output)[len(self.output) - missing:] if missing > 0 else []
+            return lines, self.output_seq
+
+    def tail(self, count) -> list[str]:
+        with self.lock:
+            return list(self.output)[-count:]
+
+    def uptime(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at and self.status == "running" else 0.0
+
+    def status_line(self) -> str:
+        details = [self.status]
+        if self.pid and self.alive:
+            details.append(f"pid {self.pid}")
+        if self.status == "running":
+            details.append(f"up {int(self.uptime())}s")
+        if self.startup_seconds is not None and self.alive:
+            details.append(f"ready in {self.startup_seconds:.1f}s")
+        if self.exit_code is not None and not self.alive:
+            details.append(f"exit code {self.exit_code}")
+        if self.restarts:
+            details.append(f"{self.restarts} restart(s)")
+        return f"{self.name:<30} {', '.join(details)}"
+
+
+class ServiceSupervisor:
+    """
+    Runs any number of services at once, each in its own process group with one thread
+    pumping its output into the service's ring buffer.
+
+    When a process exits the restart policy of its service decides what happens:
+    "never", "on-failure" (non-zero exit code) or "always", at most max_restarts times in a
+    row with an exponential delay. Stopping a service terminates its whole process group,
+    so the JVM forked by 'mvn spring-boot:run' goes down with Maven.
+    """
+
+    def __init__(self, restart_delay=RESTART_DELAY):
+        self.restart_delay = restart_delay
+        self.lock = threading.Lock()
+        self.services = {}
+
+    def start(self, name, path, command, restart_policy=None, max_restarts=None, readiness=None, on_ready=None) -> ManagedService:
+        """
+        Starts command (an argument list) in path as service name.
+
+        readiness decides when a run of the service is up: readiness.reset() is called for
+        every run, readiness.feed(line) for every output line until it returns True, then
+        readiness.confirm() (e.g. a port probe) on a separate thread. on_ready(service) is
+        called once a run is confirmed ready.
+
+        Returns:
+            ManagedService: The new service, or the one already running under that name.
+        """
+        restart_policy = restart_policy or get_config("service_restart_policy", "never")
+        if restart_policy not in RESTART_POLICIES:
+            raise ValueError(f"Unknown restart policy: {restart_policy}, expected one of {', '.join(RESTART_POLICIES)}")
+        if max_restarts is None:
+            max_restarts = int(get_config("service_max_restarts", DEFAULT_MAX_RESTARTS))
+
+        with self.lock:
+            service = self.services.get(name)
+            if service and service.alive:
+                return service
+            service = ManagedService(
+                name, path, command, restart_policy, max_restarts,
+                int(get_config("service_output_lines", DEFAULT_OUTPUT_LINES)),
+                readiness, on_ready,
+            )
+            self.services[name] = service
+        service.thread = threading.Thread(target=self._supervise, args=(service,), name=f"service-{name}", daemon=True)
+        service.thread.start()
+        return service
+
+    def stop(self, name, timeout=None) -> bool:
+        """
+        Stops a service: SIGTERM to its process group, SIGKILL after timeout seconds.
+
+        Returns:
+            bool: False when no service of that name is running.
+        """
+        service = self.get(name)
+        if not service:
+            return False
+        with service.lock:
+            # Under the lock, so a readiness check finishing now cannot switch the service back to running
+            if not service.alive:
+                return False
+            service.status = "stopping"
+        if timeout is None:
+            timeout = float(get_config("service_stop_timeout", DEFAULT_STOP_TIMEOUT))
+        service.stop_event.set()
+        process = service.process
+        if process and process.poll() is None:
+            _signal_group(process, signal.SIGTERM)
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Service {name} did not stop within {timeout}s, killing it")
+                _signal_group(process, signal.SIGKILL)
+                process.wait()
+        service.thread.join(timeout=5)
+        return True
+
+    def stop_all(self, timeout=None):
+        """Stops every running service, in parallel."""
+        threads = [
+            threading.Thread(target=self.stop, args=(service.name, timeout), daemon=True)
+            for service in self.list() if service.alive
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def restart(self, name) -> ManagedService | None:
+        service = self.get(name)
+        if not service:
+            return None
+        self.stop(name)
+        return self.start(
+            name, service.path, service.command, service.restart_policy, service.max_restarts,
+            service.readiness, service.on_ready,
+        )
+
+    def get(self, name) -> ManagedService | None:
+        with self.lock:
+            return self.services.get(name)
+
+    def list(self) -> list[ManagedService]:
+        with self.lock:
+            return sorted(self.services.values(), key=lambda service: service.name)
+
+    def format_status(self) -> str:
+        services = self.list()
+        if not services:
+            return "No services started."
+        running = sum(service.alive for service in services)
+        return "\n".join([f"{running} of {len(services)} service(s) running"] + [s.status_line() for s in services])
+
+    # ------------------ Helper methods ------------------
+
+    def _supervise(self, service):
+        consecutive_restarts = 0
+        while True:
+            try:
+                service.process = subprocess.Popen(
+                    [shutil.which(service.command[0]) or service.command[0]] + service.command[1:],
+                    cwd=service.path,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    # Own process group, so stop() reaches the processes the command forks
+                    start_new_session=os.name == "posix",
+                )
+            except OSError as e:
+                project_logger(f"Service {service.name} could not be started: {e}", service.path, level="error")
+                service.append_output(f"--- Could not start {' '.join(service.command)}: {e} ---")
+                service.status, service.exit_code = "failed", None
+                return
+
+            service.pid, service.exit_code = service.process.pid, None
+            service.started_at = time.monotonic()
+            service.run += 1
+            service.ready_event.clear()
+            service.startup_seconds = None
+            readiness = service.readiness
+            if readiness:
+                readiness.reset()
+            with service.lock:
+                stopping = service.stop_event.is_set() or service.status == "stopping"
+                if not stopping:
+                    service.status = "starting" if readiness else "running"
+            if stopping:
+                _signal_group(service.process, signal.SIGTERM)  # stop() came before the process existed
+            project_logger(f"Service {service.name} started with pid {service.pid}", service.path)
+
+            waiting = readiness is not None
+            for raw in service.process.stdout:
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                service.append_output(line)
+                if waiting and readiness.feed(line):
+                    waiting = False
+                    threading.Thread(
+                        target=self._confirm_ready, args=(service, service.run), name=f"ready-{service.name}", daemon=True
+                    ).start()
+            service.process.stdout.close()
+            exit_code = service.process.wait()
+            uptime = time.monotonic() - service.started_at
+            service.exit_code = exit_code
+            service.append_output(f"--- Process finished with exit code {exit_code} ---")
+
+            if service.stop_event.is_set():
+                service.status = "stopped"
+                project_logger(f"Service {service.name} stopped", service.path)
+                return
+            if uptime >= STABLE_UPTIME:
+                consecutive_restarts = 0
+            wants_restart = service.restart_policy == "always" or (
+                service.restart_policy == "on-failure" and exit_code != 0
+            )
+            if not wants_restart or consecutive_restarts >= service.max_restarts:
+                service.status = "exited" if exit_code == 0 else "failed"
+                project_logger(
+                    f"Service {service.name} {service.status} with exit code {exit_code}",
+                    service.path,
+                    level="info" if exit_code == 0 else "error",
+                )
+                return
+
+            delay = min(MAX_RESTART_DELAY, self.restart_delay * 2 ** consecutive_restarts)
+            consecutive_restarts += 1
+            service.restarts += 1
+            service.status = "restarting"
+            project_logger(
+                f"Service {service.name} exited with code {exit_code}, restarting in {delay:.0f}s", service.path, level="warning"
+            )
+            if service.stop_event.wait(delay):
+                service.status = "stopped"
+                return
+
+    def _confirm_ready(self, service, run):
+        ready = service.readiness.confirm()
+        with service.lock:
+            if run != service.run or service.status != "starting":
+                return  # The run ended or the service is being stopped meanwhile
+            if ready:
+                service.startup_seconds = time.monotonic() - service.started_at
+                service.status = "running"
+            else:
+                service.status = "unreachable"  # Up, but waiting for it to become ready would never end
+        if not ready:
+            service.append_output("--- Readiness probe failed, the service is not reachable ---")
+            project_logger(f"Service {service.name} logged its startup but failed the readiness probe", service.path, level="warning")
+            return
+        project_logger(f"Service {service.name} ready after {service.startup_seconds:.1f}s", service.path)
+        if service.on_ready:
+            try:
+                service.on_ready(service)
+            except Exception as e:
+                logger.warning(f"Ready callback of service {service.name} failed: {e}")
+        # Set last, whoever waits for readiness (benchmark_start) also sees what on_ready recorded
+        service.ready_event.set()
+
+
+def _signal_group(process, sig):
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, sig)
+        elif sig == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass  # Already gone
+
+
+service_supervisor = ServiceSupervisor()
@@ -1,10 +1,58 @@
-from src.integration.git.git_flows import git_flow_finish, git_flow_start
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from src.integration.git.git_flows import discard_flow_state, git_flow_finish, git_flow_start
 from src.integration.maven.maven_conflict_checker import has_dependency_conflict
 from src.integration.maven.maven_flow import mvn_quick_update_flow
 from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 
 
+_step_log = threading.local()
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str  # "success", "failed" or "error"
+    duration: float
+    error: Optional[str] = None
+
+
+@contextmanager
+def recording_steps():
+    """
+    Collects the StepResult of every timed_step run on this thread inside the block,
+    e.g. the steps of one quick_update_flow. Yields the list the results are added to.
+    """
+    previous = getattr(_step_log, "steps", None)
+    _step_log.steps = []
+    try:
+        yield _step_log.steps
+    finally:
+        _step_log.steps = previous
+
+
+def timed_step(name, func, *args):
+    """Runs func(*args) as one step of a flow; a falsy result counts as a failed step."""
+    started = time.monotonic()
+    try:
+        result = func(*args)
+    except Exception as e:
+        _record_step(StepResult(name, "error", time.monotonic() - started, str(e)))
+        raise
+    _record_step(StepResult(name, "success" if result else "failed", time.monotonic() - started))
+    return result
+
+
+def _record_step(step):
+    steps = getattr(_step_log, "steps", None)
+    if steps is not None:
+        steps.append(step)
+
 
 def full_update_run_push_flow(project_path):
     
@@ -21,17 +69,26 @@ def full_update_run_push_flow(project_path):
 
 def quick_update_flow(project_path):
     project_logger("Git Flow quick update starting...", project_path)
-    if not git_flow_start(project_path):
+    if not timed_step("git_flow_start", git_flow_start, project_path):
         project_logger(f"Git Flow start failed for {project_path}", project_path)
         return False
-    project_logger("Maven Flow quick update starting...", project_path)
-    mvn_quick_update_flow(project_path)
-    isNoConflict = has_dependency_conflict(project_path)
-    if not isNoConflict:
-        project_logger(f"Conflicht Info for {project_path}", project_logger)
-        return False
-    project_logger("Git Flow quick update finishing...", project_path)
-    git_flow_finish(project_path)
-    project_logger("Git Flow quick update finishing...", project_path)
+    try:
+        project_logger("Maven Flow quick update starting...", project_path)
+        # A failed versions update fails the project, like in the reactor mode
+        if not timed_step("maven_update", mvn_quick_update_flow, project_path):
+            project_logger(f"Maven update failed for {project_path}", project_path, level="error")
+            return False
+        isNoConflict = timed_step("dependency_check", has_dependency_conflict, project_path)
+        if not isNoConflict:
+            project_logger(f"Conflicht Info for {project_path}", project_path)
+            return False
+        project_logger("Git Flow quick update finishing...", project_path)
+        if not timed_step("git_flow_finish", git_flow_finish, project_path):
+            project_logger(f"Git Flow finish failed for {project_path}", project_path, level="error")
+            return False
+        project_logger("Git Flow quick update finished", project_path)
 
-    return True
+        return True
+    finally:
+        # git_flow_finish consumes the flow state, every other exit has to drop it
+        discard_flow_state(project_path)
@@ -0,0 +1,91 @@
+import os
+import time
+from dataclasses import dataclass, field
+
+from src.config.settings_reader import get_config
+from src.core.startup_history import startup_stats
+from src.integration.maven.maven_client import mvn_springboot_start
+from src.integration.service_supervisor import service_supervisor
+from src.utils.logger_setup import log_with_project as project_logger
+
+
+DEFAULT_BENCHMARK_RUNS = 5
+DEFAULT_STARTUP_TIMEOUT = 300.0
+
+
+@dataclass
+class StartupBenchmark:
+    project_name: str
+    durations: list[float] = field(default_factory=list)
+    reported: list[float] = field(default_factory=list)
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def stats(self) -> dict:
+        return startup_stats(self.durations)
+
+    def format(self) -> str:
+        stats = self.stats
+        lines = [f"Startup benchmark of {self.project_name}: {stats['count']} successful run(s), {len(self.failures)} failed"]
+        if stats["count"]:
+            lines.append(
+                f"  median {stats['median']:.2f}s   p95 {stats['p95']:.2f}s   "
+                f"min {stats['min']:.2f}s   max {stats['max']:.2f}s"
+            )
+            if self.reported:
+                lines.append(f"  Spring Boot reported: median {startup_stats(self.reported)['median']:.2f}s")
+            lines.append("  runs: " + ", ".join(f"{duration:.2f}s" for duration in self.durations))
+        lines.extend(f"  failed: {failure}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+def benchmark_start(project_path, runs=None, timeout=None, on_progress=None) -> StartupBenchmark:
+    """
+    Starts the Spring Boot application of a project runs times in a row, each time waiting
+    until it is ready and stopping it again, and measures the startup durations.
+
+    Args:
+        project_path (str): The project, it must not be running already.
+        runs (int): Number of starts, benchmark_runs in settings.toml by default.
+        timeout (float): Seconds a run may take to become ready before it counts as failed.
+        on_progress (callable): Called with a short message after every run.
+
+    Returns:
+        StartupBenchmark: Durations of the successful runs and the reasons of the failed ones.
+    """
+    runs = runs or int(get_config("benchmark_runs", DEFAULT_BENCHMARK_RUNS))
+    timeout = timeout or float(get_config("benchmark_startup_timeout", DEFAULT_STARTUP_TIMEOUT))
+    project_name = os.path.basename(os.path.normpath(project_path))
+    running = service_supervisor.get(project_name)
+    if running and running.alive:
+        raise ValueError(f"{project_name} is already running, stop it before benchmarking its startup")
+
+    benchmark = StartupBenchmark(project_name)
+    project_logger(f"Startup benchmark with {runs} runs started", project_path)
+    for run in range(1, runs + 1):
+        service = mvn_springboot_start(project_path, restart_policy="never")
+        deadline = time.monotonic() + timeout
+        while not service.ready_event.wait(0.2):
+            # "running" before ready_event while on_ready records the run
+            if service.status not in ("starting", "running") or time.monotonic() >= deadline:
+                break
+        if service.ready_event.is_set():
+            benchmark.durations.append(service.startup_seconds)
+            if service.readiness.reported_seconds is not None:
+                benchmark.reported.append(service.readiness.reported_seconds)
+            message = f"run {run}/{runs}: ready after {service.startup_seconds:.2f}s"
+        else:
+            if not service.alive:
+                reason = f"exited with code {service.exit_code}"
+            elif service.status == "unreachable":
+                reason = "failed the readiness probe"
+            else:
+                reason = f"not ready after {timeout:.0f}s"
+            benchmark.failures.append(f"run {run}: {reason}")
+            message = f"run {run}/{runs}: {reason}"
+        service_supervisor.stop(project_name)
+        project_logger(f"Startup benchmark {message}", project_path)
+        if on_progress:
+            on_progress(message)
+    project_logger(benchmark.format(), project_path)
+    return benchmark
@@ -0,0 +1,309 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Optional
+
+from src.config.settings_reader import get_config
+from src.integration.git.git_flows import discard_flow_state, git_flow_finish, git_flow_start
+from src.integration.maven.conflict_cache import conflict_cache
+from src.integration.maven.maven_conflict_checker import check_dependency_tree_file, has_dependency_conflict
+from src.integration.maven.maven_flow import mvn_quick_update_flow
+from src.integration.maven.maven_reactor import DEPENDENCY_TREE_GOALS, UPDATE_GOALS, dependency_tree_files, remove_dependency_tree_files, run_reactor
+from src.processor.process import StepResult, quick_update_flow, recording_steps, timed_step
+from src.utils.logger_setup import global_logger as logger
+from src.utils.logger_setup import log_with_project as project_logger
+
+
+DEFAULT_MAX_PARALLEL_UPDATES = 4
+
+
+@dataclass
+class ProjectUpdateResult:
+    project_name: str
+    project_path: str
+    status: str  # "success", "failed", "error" or "skipped"
+    duration: float = 0.0
+    error: Optional[str] = None
+    steps: list[StepResult] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return self.status == "success"
+
+
+def get_max_parallel_updates() -> int:
+    """
+    Reads the worker limit for update-all runs from settings.toml.
+    Falls back to DEFAULT_MAX_PARALLEL_UPDATES when the value is missing or invalid.
+    """
+    value = get_config("max_parallel_updates", DEFAULT_MAX_PARALLEL_UPDATES)
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid max_parallel_updates value: {value!r}, using {DEFAULT_MAX_PARALLEL_UPDATES}")
+        return DEFAULT_MAX_PARALLEL_UPDATES
+
+
+def run_update_all(
+    projects_map: dict[str, str],
+    max_workers: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    on_start: Optional[Callable[[str, str], None]] = None,
+    on_result: Optional[Callable[[ProjectUpdateResult], None]] = None,
+    update_flow: Callable[[str], bool] = quick_update_flow,
+) -> list[ProjectUpdateResult]:
+    """
+    Runs the update flow for every project on a bounded thread pool.
+
+    Args:
+        projects_map (dict[str, str]): Project name -> project path.
+        max_workers (int): Concurrency limit, defaults to `max_parallel_updates` from settings.
+        stop_event (threading.Event): When set, projects that have not started yet are skipped.
+        on_start (callable): Called with (project_name, project_path) when a project starts.
+        on_result (callable): Called with a ProjectUpdateResult when a project finishes.
+        update_flow (callable): Flow executed per project path, quick_update_flow by default.
+
+    Returns:
+        list[ProjectUpdateResult]: One result per project, in projects_map order.
+    """
+    if not projects_map:
+        return []
+
+    stop_event = stop_event or threading.Event()
+    workers = max_workers or get_max_parallel_updates()
+    workers = max(1, min(workers, len(projects_map)))
+    logger.info(f"Update all starts for {len(projects_map)} projects with {workers} workers")
+
+    def _update_project(project_name, project_path):
+        if stop_event.is_set():
+            return ProjectUpdateResult(project_name, project_path, "skipped")
+        if on_start:
+            on_start(project_name, project_path)
+
+        started = time.monotonic()
+        error = None
+        with recording_steps() as steps:
+            try:
+                status = "success" if update_flow(project_path) else "failed"
+            except Exception as e:
+                project_logger(f"Unexpected error during update: {e}", project_path, level="error")
+                status, error = "error", str(e)
+        return ProjectUpdateResult(project_name, project_path, status, time.monotonic() - started, error, steps)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-all") as executor:
+        futures = [
+            executor.submit(_update_project, project_name, project_path)
+            for project_name, project_path in projects_map.items()
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.project_name] = result
+            if on_result:
+                on_result(result)
+
+    summary = summarize_results(results.values())
+    logger.info(f"Update all finished: {summary}")
+    return [results[project_name] for project_name in projects_map]
+
+
+def run_update_all_reactor(
+    projects_map: dict[str, str],
+    max_workers: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    on_start: Optional[Callable[[str, str], None]] = None,
+    on_result: Optional[Callable[[ProjectUpdateResult], None]] = None,
+) -> list[ProjectUpdateResult]:
+    """
+    Update-all variant that runs the Maven steps of every project in one reactor build.
+
+    Git steps still run per project on the worker pool. The versions goals and
+    dependency:tree each run once over a temporary aggregator POM (maven_reactor_mode
+    in settings.toml), so plugin resolution and repository metadata are fetched once.
+    When Maven cannot build the reactor the Maven steps fall back to one run per project.
+    """
+    if not projects_map:
+        return []
+
+    stop_event = stop_event or threading.Event()
+    workers = max_workers or get_max_parallel_updates()
+    workers = max(1, min(workers, len(projects_map)))
+    logger.info(f"Reactor update all starts for {len(projects_map)} projects with {workers} git workers")
+
+    started_at = {}
+    results = {}
+    steps = {project_name: [] for project_name in projects_map}
+
+    def _finish(project_name, status, error=None):
+        project_path = projects_map[project_name]
+        discard_flow_state(project_path)  # Projects that stop before git_flow_finish keep no flow state
+        duration = time.monotonic() - started_at[project_name] if project_name in started_at else 0.0
+        result = ProjectUpdateResult(project_name, project_path, status, duration, error, steps[project_name])
+        results[project_name] = result
+        if on_result:
+            on_result(result)
+
+    def _git_start(project_name, project_path):
+        if stop_event.is_set():
+            return False
+        if on_start:
+            on_start(project_name, project_path)
+        started_at[project_name] = time.monotonic()
+        with recording_steps() as recorded:
+            ok = bool(timed_step("git_flow_start", git_flow_start, project_path))
+        steps[project_name].extend(recorded)
+        return ok
+
+    def _timed(step_name, func):
+        """Wraps func(name, path) for _map_projects, recording it as a step of the project."""
+        def _run(project_name, project_path):
+            with recording_steps() as recorded:
+                try:
+                    return timed_step(step_name, func, project_name, project_path)
+                finally:
+                    steps[project_name].extend(recorded)
+        return _run
+
+    def _unless_stopped(active):
+        """The projects that go on to the next phase, all are skipped once stop_event is set."""
+        if not stop_event.is_set():
+            return active
+        for name in active:
+            _finish(name, "skipped")
+        return {}
+
+    def _shared_step(step_name, names, outcomes, started):
+        # A reactor build serves all projects at once, each gets its full duration
+        duration = time.monotonic() - started
+        for name in names:
+            steps[name].append(StepResult(step_name, "success" if outcomes[name] else "failed", duration))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-all") as executor:
+        # 1. Git flow start per project
+        started = _map_projects(executor, _git_start, projects_map)
+        for project_name, (ok, error) in started.items():
+            if not ok:
+                _finish(project_name, "skipped" if project_name not in started_at else ("error" if error else "failed"), error)
+        active = _unless_stopped({name: projects_map[name] for name, (ok, _) in started.items() if ok})
+
+        # 2. One reactor build for the versions goals
+        reactor_started = time.monotonic()
+        updated = run_reactor(list(active.values()), UPDATE_GOALS)
+        if updated is None:
+            logger.warning("Reactor update failed, running Maven per project")
+            per_project = _map_projects(executor, _timed("maven_update", lambda name, path: mvn_quick_update_flow(path)), active)
+            update_ok = {name: ok for name, (ok, _) in per_project.items()}
+        else:
+            update_ok = {name: updated[path].success for name, path in active.items()}
+            _shared_step("maven_update", active, update_ok, reactor_started)
+            for name, path in active.items():
+                level = "debug" if updated[path].success else "error"
+                project_logger(f"Reactor update {updated[path].status}: {updated[path].output}", path, level=level)
+        for name, ok in update_ok.items():
+            if not ok:
+                _finish(name, "failed", "Maven update failed")
+        active = _unless_stopped({name: path for name, path in active.items() if update_ok[name]})
+
+        # 3. One reactor build for dependency:tree over the projects without a cached result,
+        #    each module writes its own tree file, all of them are checked together
+        cache_keys = {name: conflict_cache.key_for(path) for name, path in active.items()}
+        checks = {}
+        for name, key in cache_keys.items():
+            cached = conflict_cache.get(key)
+            if cached is not None:
+                project_logger(f"Dependency check result cached: {'no conflicts' if cached else 'conflicts'}", active[name])
+                checks[name] = (cached, None)
+        pending = {name: path for name, path in active.items() if name not in checks}
+
+        for name in checks:
+            steps[name].append(StepResult("dependency_check", "success" if checks[name][0] else "failed", 0.0))
+        reactor_started = time.monotonic()
+        tree_files = {name: dependency_tree_files(path) for name, path in pending.items()}
+        for files in tree_files.values():
+            remove_dependency_tree_files(files)
+        trees = run_reactor(
+            list(pending.values()), DEPENDENCY_TREE_GOALS,
+            output_files=[tree_file for files in tree_files.values() for tree_file in files],
+        )
+        if trees is None:
+            logger.warning("Reactor dependency:tree failed, checking conflicts per project")
+            checks.update(_map_projects(
+                executor, _timed("dependency_check", lambda name, path: has_dependency_conflict(path)), pending
+            ))
+        else:
+            tree_duration = time.monotonic() - reactor_started
+            tree_checks = _map_projects(
+                executor,
+                _timed("dependency_check", lambda name, path: trees[path].success and check_dependency_tree_file(
+                    path, tree_files[name], cache_keys[name]
+                )),
+                pending,
+            )
+            for name in tree_checks:
+                steps[name][-1].duration += tree_duration
+            checks.update(tree_checks)
+        for name, (no_conflict, error) in checks.items():
+            if not no_conflict:
+                _finish(name, "error" if error else "failed", error or "Dependency conflicts detected")
+        active = _unless_stopped({name: path for name, path in active.items() if checks[name][0]})
+
+        # 4. Git flow finish per project
+        finished = _map_projects(executor, _timed("git_flow_finish", lambda name, path: git_flow_finish(path)), active)
+        for name, (ok, error) in finished.items():
+            _finish(name, "success" if ok else ("error" if error else "failed"), error)
+
+    summary = summarize_results(results.values())
+    logger.info(f"Reactor update all finished: {summary}")
+    return [results[project_name] for project_name in projects_map]
+
+
+def _map_projects(executor, func, projects_map) -> dict[str, tuple[bool, Optional[str]]]:
+    """Runs func(name, path) for every project on the executor, returns name -> (result, error)."""
+    futures = {
+        project_name: executor.submit(func, project_name, project_path)
+        for project_name, project_path in projects_map.items()
+    }
+    outcomes = {}
+    for project_name, future in futures.items():
+        try:
+            outcomes[project_name] = (bool(future.result()), None)
+        except Exception as e:
+            project_logger(f"Unexpected error during update: {e}", projects_map[project_name], level="error")
+            outcomes[project_name] = (False, str(e))
+    return outcomes
+
+
+def build_report(results, started_at, finished_at, mode, workers) -> dict:
+    """
+    Machine-readable report of an update-all run, see 'reporanger.py update --report'.
+
+    Args:
+        results (list[ProjectUpdateResult]): Results of run_update_all or run_update_all_reactor.
+        started_at, finished_at (float): Wall-clock times (time.time()) of the run.
+        mode (str): "per-project" or "reactor".
+        workers (int): Concurrency limit of the run.
+    """
+    return {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(started_at)),
+        "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(finished_at)),
+        "duration": round(finished_at - started_at, 3),
+        "mode": mode,
+        "workers": workers,
+        "summary": summarize_results(results),
+        "projects": [
+            {
+                **{key: value for key, value in asdict(result).items() if key != "steps"},
+                "duration": round(result.duration, 3),
+                "steps": [{**asdict(step), "duration": round(step.duration, 3)} for step in result.steps],
+            }
+            for result in results
+        ],
+    }
+
+
+def summarize_results(results) -> dict[str, int]:
+    summary = {"success": 0, "failed": 0, "error": 0, "skipped": 0}
+    for result in results:
+        summary[result.status] = summary.get(result.status, 0) + 1
+    return summary
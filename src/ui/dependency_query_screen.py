@@ -0,0 +1,73 @@
+import threading
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Input, Static
+from textual.containers import Vertical, ScrollableContainer
+
+from src.core.dependency_index import dependency_index, format_usages
+
+
+class DependencyQueryScreen(Screen):
+
+    CSS_PATH = "styles/style.tcss"
+
+    BINDINGS = [
+        ("escape", "back", "Back"),
+    ]
+
+    def __init__(self, projects_map: dict[str, str], **kwargs):
+        super().__init__(**kwargs)
+        self.projects_map = projects_map
+        self.index_ready = threading.Event()
+        self.index_error = None
+
+    def compose(self):
+        yield Header()
+        with Vertical():
+            self.query_input = Input(
+                placeholder="Dependency query, e.g. spring-boot-starter-parent:3.1 or jackson-databind<2.15",
+                id="dependency-query",
+            )
+            yield self.query_input
+            self.results_container = ScrollableContainer(Static("Indexing project dependencies...", id="log-panel"))
+            yield self.results_container
+        yield Footer()
+
+    def on_mount(self):
+        self.query_input.focus()
+        threading.Thread(target=self._refresh_index, daemon=True).start()
+
+    def _refresh_index(self):
+        try:
+            changed = dependency_index.refresh(self.projects_map)
+            text = f"Dependency index ready for {len(self.projects_map)} projects ({changed} reindexed)."
+        except Exception as e:
+            self.index_error = f"❌ Dependency index could not be built: {e}"
+            text = self.index_error
+        finally:
+            # Waiting queries are released either way, they show the error instead of blocking
+            self.index_ready.set()
+        self.app.call_from_thread(self._show, text)
+
+    def on_input_submitted(self, event: Input.Submitted):
+        query = event.value.strip()
+        if not query:
+            return
+
+        def _query():
+            self.index_ready.wait()
+            if self.index_error:
+                text = self.index_error
+            else:
+                try:
+                    text = format_usages(dependency_index.query(query))
+                except ValueError as e:
+                    text = str(e)
+            self.app.call_from_thread(self._show, text)
+
+        threading.Thread(target=_query, daemon=True).start()
+
+    def _show(self, text):
+        self.results_container.query_one(Static).update(text)
+
+    def action_back(self):
+        self.app.pop_screen()
@@ -33,11 +33,32 @@ class HelpScreen(Screen):
                     [A] Update All
                     - Updates all projects
 
+                    [P] Plan Update / Plan All
+                    - Lists available release upgrades without changing anything
+                    - Uses the metadata cached in the local Maven repository
+
+                    [F] Find Dependency
+                    - Lists projects declaring a dependency, e.g. jackson-databind<2.15
+                    - Also available as: python reporanger.py deps QUERY
+
                     [S] Start
-                    - Starts the selected project
+                    - Starts the selected project, next to the ones already running
+                    - Its output streams into the detail panel while it is selected
+                    - Ready once "Started ... in X seconds" is logged and its port answers
 
                     [X] Stop
-                    - Stops the selected project
+                    - Stops the selected project and the processes it started
+
+                    [Shift+S] Services
+                    - Lists the started projects with status, pid, uptime and restarts
+                    - With CPU, RSS, thread and file descriptor history of their process trees
+
+                    [Shift+M] Export Metrics
+                    - Writes the sampled service metrics to logs/ as CSV and JSON
+
+                    [Shift+B] Benchmark Start
+                    - Starts the selected project several times, reports median and p95 startup time
+                    - Also available as: python reporanger.py benchmark-start PROJECT --runs 5
 
                     [O] Open
                     - Opens the selected project in the configured editor
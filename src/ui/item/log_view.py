@@ -0,0 +1,66 @@
+from rich.cells import cell_len
+from rich.segment import Segment
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from src.utils.log_reader import LogRingBuffer
+
+
+class LogView(ScrollView):
+    """
+    Scrollable log backed by a LogRingBuffer. Only the lines in the visible window are
+    rendered, so the cost of a frame does not depend on how many lines are buffered.
+    """
+
+    DEFAULT_CSS = """
+    LogView {
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, capacity, **kwargs):
+        super().__init__(**kwargs)
+        self.buffer = LogRingBuffer(capacity)
+        self.max_width = 0
+
+    def on_mount(self):
+        # Anchored: stays at the bottom while lines arrive, until the user scrolls up
+        self.anchor()
+
+    def reset(self, lines):
+        self.buffer.reset(lines)
+        self.max_width = max((cell_len(text) for _, text in lines), default=0)
+        self._update_size()
+        self.anchor()
+
+    def append_lines(self, lines):
+        at_bottom = self.scroll_offset.y >= self.max_scroll_y
+        dropped = self.buffer.append(lines)
+        if not self.buffer.at_tail:
+            return
+        self.max_width = max(self.max_width, max((cell_len(text) for _, text in lines), default=0))
+        self._update_size()
+        if dropped and not at_bottom:
+            # Keep the lines the user is reading in place while the front is trimmed
+            self.scroll_to(y=max(0, self.scroll_offset.y - dropped), animate=False, immediate=True)
+        self.refresh()
+
+    def prepend_lines(self, lines):
+        added = self.buffer.prepend(lines)
+        self.max_width = max(self.max_width, max((cell_len(text) for _, text in lines), default=0))
+        self.release_anchor()
+        self._update_size()
+        self.scroll_to(y=self.scroll_offset.y + added, animate=False, immediate=True)
+        self.refresh()
+
+    def _update_size(self):
+        self.virtual_size = Size(self.max_width, len(self.buffer))
+
+    def render_line(self, y) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.scrollable_content_region.width
+        if index >= len(self.buffer):
+            return Strip.blank(width, self.rich_style)
+        return Strip([Segment(self.buffer[index])]).crop_extend(scroll_x, scroll_x + width, self.rich_style)
@@ -1,12 +1,21 @@
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Static
-from textual.containers import Vertical, ScrollableContainer
+from textual.widgets import Header, Footer, Input, Static
+from textual.containers import Vertical
 import threading
 import time
 import os
 
+from src.config.settings_reader import get_config
+from src.core.log_search import log_files, log_search_index
+from src.ui.item.log_view import LogView
+from src.utils.log_reader import read_lines_before, read_tail
+from src.utils.log_tail import log_tail_service
 from src.utils.logger_setup import get_log_file, global_logger as logger
 
+# Lines appended by the reader thread are handed to the view at most this often
+FLUSH_INTERVAL = 1 / 30
+
+
 class LogScreen(Screen):
 
     CSS_PATH = "styles/style.tcss"
@@ -14,49 +23,181 @@ class LogScreen(Screen):
     BINDINGS = [
         ("b", "back", "Back"),
         ("q", "quit", "Quit"),
+        ("p", "page_back", "Older Lines"),
+        ("t", "tail", "Follow Tail"),
+        ("/", "search", "Search"),
+        ("escape", "clear_search", "Clear Search"),
     ]
 
     def __init__(self, project_name, **kwargs):
         super().__init__(**kwargs)
         self.project_name = project_name
         self.stop_event = threading.Event()
+        self.max_lines = int(get_config("log_view_max_lines", 10000))
+        self.page_lines = int(get_config("log_view_page_lines", 1000))
+        self.subscription = None
+        self.generation = 0
+        self.search_query = None
+        self.log_file_path = get_log_file(project_name)
 
     def compose(self):
         yield Header()
         yield Footer()
         with Vertical():
-            self.log_panel = ScrollableContainer(Static(f"Loading logs for {self.project_name} ...", id="log-panel"))
-            yield self.log_panel
+            self.search_input = Input(placeholder="Search this project's logs, Enter to search, Esc to clear", id="log-search")
+            self.search_input.display = False
+            yield self.search_input
+            self.status = Static(f"Loading logs for {self.project_name} ...", id="log-status")
+            yield self.status
+            self.log_view = LogView(self.max_lines, id="log-view")
+            yield self.log_view
 
     def on_mount(self):
-        self.log_widget = self.query_one("#log-panel", Static)
+        self.log_view.focus()
+        self.set_interval(FLUSH_INTERVAL, self.flush_pending_lines)
         self.read_logs()
 
     def read_logs(self):
-        log_file_path = get_log_file(self.project_name)
-        self.update_log_panel(f"Log file path: {log_file_path}")
         def read_log_file():
-            with open(log_file_path, "r") as log_file:
-                while not self.stop_event.is_set():
-                    line = log_file.readline()
-                    if not line:
-                        time.sleep(0.1)
-                        log_file.seek(0, os.SEEK_CUR)  # Ensure the file pointer is at the current position
-                        continue
-                    #logger.debug(f"Read line: {line.strip()}")
-                    self.app.call_from_thread(self.update_log_panel, line.strip())
-        
+            while not os.path.exists(self.log_file_path):
+                if self.stop_event.wait(0.5):
+                    return
+            # Start from the tail, older lines are paged in on demand
+            lines, offset = read_tail(self.log_file_path, min(self.page_lines, self.max_lines))
+            # New lines come from the shared tail service, queued up to max_lines
+            subscription = log_tail_service.subscribe(self.log_file_path, offset, max_pending=self.max_lines)
+            if self.stop_event.is_set():
+                subscription.close()
+                return
+            self.app.call_from_thread(self._load_tail, lines, subscription)
+
         self.log_thread = threading.Thread(target=read_log_file, daemon=True)
         self.log_thread.start()
 
-    def update_log_panel(self, line):
-        #logger.debug(f"Updating log panel with line: {line}")
-        self.log_widget.update(self.log_widget.renderable + "\n" + line)
+    def flush_pending_lines(self):
+        if not self.subscription:
+            return
+        lines = self.subscription.drain()
+        if not lines:
+            return
+        if self.search_query:
+            # Filtering: only new lines containing the query are added below the search results
+            needle = self.search_query.lower()
+            matching = [(offset, text) for offset, text, _ in lines if needle in text.lower()]
+            if matching:
+                self.log_view.append_lines(matching)
+                self._update_status()
+            self.generation = lines[-1][2]
+            return
+        # Offsets before a rotation or truncation belong to another file, start over after it
+        rotated_at = next((i for i in range(len(lines) - 1, -1, -1) if lines[i][2] != self.generation), None)
+        if rotated_at is not None:
+            self.generation = lines[rotated_at][2]
+            start = next(i for i, line in enumerate(lines) if line[2] == self.generation)
+            self.log_view.reset([(offset, text) for offset, text, _ in lines[start:]])
+        else:
+            self.log_view.append_lines([(offset, text) for offset, text, _ in lines])
+        self._update_status()
 
-    def action_back(self):
+    def _load_tail(self, lines, subscription):
+        self.subscription = subscription
+        self.generation = 0
+        if not self.search_query:
+            self.log_view.reset(lines)
+            self._update_status()
+
+    def _stop_reading(self):
         self.stop_event.set()
+        if self.subscription:
+            self.subscription.close()
+            self.subscription = None
+
+    def _update_status(self):
+        if self.search_query:
+            self.status.update(
+                f"{len(self.log_view.buffer)} lines matching {self.search_query!r} in the {self.project_name} logs"
+                " | Esc to clear"
+            )
+            return
+        state = "following" if self.log_view.buffer.at_tail else "paused, press t to follow"
+        self.status.update(
+            f"{self.log_file_path} | {len(self.log_view.buffer)} lines from byte "
+            f"{self.log_view.buffer.start_offset} | {state}"
+        )
+
+    def on_input_submitted(self, event: Input.Submitted):
+        query = event.value.strip()
+        if not query:
+            self.action_clear_search()
+            return
+        self.search_query = query
+        self.status.update(f"Searching the {self.project_name} logs for {query!r} ...")
+        paths = log_files(os.path.dirname(self.log_file_path), self.project_name)
+
+        def _search():
+            try:
+                matches = log_search_index.search(query, paths, ignore_case=True, max_results=self.max_lines)
+            except OSError as e:
+                logger.warning(f"Log search failed: {e}")
+                matches = []
+            self.app.call_from_thread(self._show_matches, query, matches)
+
+        threading.Thread(target=_search, daemon=True).start()
+
+    def _show_matches(self, query, matches):
+        if query != self.search_query:
+            return  # Another search was started or the search was cleared meanwhile
+        self.log_view.reset([(match.offset, str(match)) for match in matches])
+        self._update_status()
+        self.log_view.focus()
+
+    def action_search(self):
+        self.search_input.display = True
+        self.search_input.focus()
+
+    def action_clear_search(self):
+        if not self.search_input.display and not self.search_query:
+            return
+        self.search_input.value = ""
+        self.search_input.display = False
+        if self.search_query:
+            self.search_query = None
+            self._reload_tail()
+
+    def action_page_back(self):
+        if self.search_query:
+            return
+        start_offset = self.log_view.buffer.start_offset
+        if start_offset <= 0:
+            return
+        try:
+            lines = read_lines_before(self.log_file_path, start_offset, self.page_lines)
+        except OSError as e:
+            logger.warning(f"Older log lines could not be read: {e}")
+            return
+        self.log_view.prepend_lines(lines)
+        self._update_status()
+
+    def action_tail(self):
+        if self.search_query:
+            self.action_clear_search()
+            return
+        if self.log_view.buffer.at_tail:
+            self.log_view.scroll_end(animate=False)
+            return
+        # Lines kept arriving while paging, reload the tail window the view dropped
+        self._reload_tail()
+
+    def _reload_tail(self):
+        self._stop_reading()
+        self.log_thread.join(timeout=1)
+        self.stop_event = threading.Event()
+        self.read_logs()
+
+    def action_back(self):
+        self._stop_reading()
         self.app.pop_screen()
 
     def action_quit(self):
-        self.stop_event.set()
-        self.app.exit()
\ No newline at end of file
+        self._stop_reading()
+        self.app.exit()
@@ -1,23 +1,27 @@
 from textual.app import App
-from src.ui.overview_screen import OverviewScreen
-from src.ui.settings_screen import SettingsScreen
 from src.config.settings_reader import get_config
-import os
-from src.utils.logger_setup import global_logger as logger
+from src.utils.logger_setup import logger_setup
+
+# Files in logs/ that survive the cleanup on startup
+KEPT_LOG_FILES = ("app.log",)
+KEPT_LOG_PREFIXES = ("service_metrics-",)
+
 
 class Main(App):
 
     def on_mount(self):
+        # The screens pull in textual widgets, git and the project index, imported only when shown
         base_path = get_config("base_path", None)
         if not base_path or base_path.strip() == "":
+            from src.ui.settings_screen import SettingsScreen
             self.push_screen(SettingsScreen())
         else:
+            from src.ui.overview_screen import OverviewScreen
             self.push_screen(OverviewScreen())
-        self.delete_log_files()
+        # Deleting hundreds of old project logs must not delay the first frame, the log
+        # listener thread deletes them in order with the records
+        logger_setup.delete_log_files(self.keep_log_file)
 
-    def delete_log_files(self):
-        log_dir = os.path.join(os.path.dirname(__file__), "..", "..", "logs")
-        for log_file in os.listdir(log_dir):
-            if log_file != "app.log":
-                os.remove(os.path.join(log_dir, log_file))
-                logger.info(f"{log_file} is deleted")
\ No newline at end of file
+    @staticmethod
+    def keep_log_file(log_name) -> bool:
+        return log_name in KEPT_LOG_FILES or log_name.startswith(KEPT_LOG_PREFIXES)
@@ -2,6 +2,7 @@ import os
 import threading
 import signal
 import time
+from rich.text import Text
 from textual.screen import Screen
 from textual.containers import Horizontal, ScrollableContainer
 from textual.widgets import Header, Footer, ListView, Static
@@ -10,14 +11,19 @@ from src.utils.logger_setup import global_logger as logger
 from src.utils.logger_setup import log_with_project as project_logger
 
 from src.utils.logger_setup import get_log_file
-from src.core.project_scanner import find_spring_projects
-from src.integration.maven.maven_client import mvn_springboot_start
-from src.processor.process import quick_update_flow
+from src.core.project_index import project_index
+from src.core.workspace_watcher import WorkspaceWatcher
+from src.integration.git import git_refs
+from src.integration.service_supervisor import service_supervisor
 from src.ui.item.project_list_item import ProjectListItem
-from src.ui.update_secreen import UpdateProjectsScreen
-from src.ui.help_screen import HelpScreen
-from src.processor.project_operations import open_project_in_vscode, kill_process
-from src.ui.log_screen import LogScreen
+
+# Maven, the update flows, the metrics sampler and the other screens are imported by the
+# actions that use them, so the first frame does not wait for them
+
+# The detail panel shows the last lines of the selected service, refreshed this often
+SERVICE_OUTPUT_INTERVAL = 0.25
+SERVICE_OUTPUT_LINES = 200
+
 
 class OverviewScreen(Screen):
 
@@ -27,8 +33,14 @@ class OverviewScreen(Screen):
         ("u", "quick_update", "Quick Update"),
         ("U", "full_update", "Full Update"),
         ("A", "update_all", "Update All"),
+        ("p", "plan_update", "Plan Update"),
+        ("P", "plan_all", "Plan All"),
+        ("f", "find_dependency", "Find Dependency"),
         ("s", "start", "Start"),
         ("x", "stop", "Stop"),
+        ("S", "services", "Services"),
+        ("M", "export_metrics", "Export Metrics"),
+        ("B", "benchmark_start", "Benchmark Start"),
         ("d", "display_pom", "Display POM"),
         ("o", "open", "Open"),
         ("q", "quit", "Quit"),
@@ -50,28 +62,66 @@ class OverviewScreen(Screen):
     def on_mount(self):
         self.projects_map = self.load_projects_into_list_view(self.project_list)
         self.project_list.focus()
-        self.running_projects = {}
+        # Name of the service whose output the detail panel streams, and how many lines it showed
+        self.streamed_service = None
+        self.streamed_state = None
+        self.set_interval(SERVICE_OUTPUT_INTERVAL, self._stream_service_output)
         self.log_monitor_thread = None
         self.log_monitor_running = False
         self.last_positions = {}  # Dictionary to store last read positions for each project
+        if not self.projects_map:
+            self._update_detail_panel("Scanning projects...")
+        # The first watcher check validates the cached index, later ones follow workspace changes
+        self.workspace_watcher = WorkspaceWatcher(
+            lambda events: self.app.call_from_thread(self._apply_project_events, events)
+        )
+        self.workspace_watcher.start()
+
+    def on_unmount(self):
+        self.workspace_watcher.stop()
 
     def load_projects_into_list_view(self, list_view_widget):
-        projects_map = find_spring_projects()
+        # Populated from the persisted index, the workspace watcher validates it afterwards
+        projects_map = project_index.load()
+        self.project_items = {}
         for folder_name in projects_map:
             item = ProjectListItem(folder_name)
+            self.project_items[folder_name] = item
             list_view_widget.append(item)
         return projects_map
 
+    def _apply_project_events(self, events):
+        for event in events:
+            if event.kind == "removed":
+                self.projects_map.pop(event.name, None)
+                item = self.project_items.pop(event.name, None)
+                if item:
+                    item.remove()
+            elif event.kind == "added":
+                self.projects_map[event.name] = event.path
+                item = ProjectListItem(event.name)
+                self.project_items[event.name] = item
+                self.project_list.append(item)
+            elif event.kind == "modified" and event.name == getattr(self, "selected_project_name", None):
+                self._update_detail_panel(f"Selected project: {event.name}\npom.xml changed on disk.")
+
+        if not self.projects_map:
+            self._update_detail_panel("No projects found.")
+
     def on_list_view_selected(self, event: ListView.Selected):
         proj_name = event.item.folder_name
         self.selected_project_name = proj_name
-        self._update_detail_panel(f"Selected project: {proj_name}")
+        self._update_detail_panel(self._project_summary(proj_name))
+        self._follow_service(proj_name)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted):
+        if event.item is None:
+            return
         proj_name = event.item.folder_name
         self.selected_project_name = proj_name
-        self._update_detail_panel(f"Selected project: {proj_name}")
-    
+        self._update_detail_panel(self._project_summary(proj_name))
+        self._follow_service(proj_name)
+
 
     # ------------------ Action methods ------------------
     def action_quick_update(self):
@@ -83,6 +133,7 @@ class OverviewScreen(Screen):
             self._update_detail_panel("No project selected.")
             return
 
+        from src.processor.process import quick_update_flow
         thread = threading.Thread(
             target=quick_update_flow,
             args=(project_path,),
@@ -96,23 +147,49 @@ class OverviewScreen(Screen):
         )
         
     def action_start(self):
-        self._update_detail_panel("Start command triggered!\n")
-
         project_path = self._get_selected_project_path()
         if not project_path:
             return
 
-        thread = threading.Thread(
-            target=mvn_springboot_start,
-            args=(self, project_path),
-            daemon=True
-        )
-        thread.start()
-
+        from src.integration.maven.maven_client import mvn_springboot_start
+        from src.integration.service_metrics import service_metrics
+        service = mvn_springboot_start(project_path)
+        service_metrics.start()
         self._update_detail_panel("Spring Boot is starting... Logs will appear below.\n")
+        self._follow_service(service.name)
     
     def action_update_all(self):
-        self.app.push_screen(UpdateProjectsScreen(self.projects_map))
+        from src.ui.update_secreen import UpdateProjectsScreen
+        self.app.push_screen(UpdateProjectsScreen(dict(self.projects_map)))
+
+    def action_plan_update(self):
+        project_path = self._get_selected_project_path()
+        if not project_path:
+            return
+        project_name = self.selected_project_name
+        self._update_detail_panel(f"Planning updates for {project_name}...")
+
+        def _plan():
+            from src.integration.maven.update_planner import format_update_plan, plan_project_updates
+            plan = {project_name: plan_project_updates(project_name, project_path)}
+            self.app.call_from_thread(self._update_detail_panel, format_update_plan(plan))
+
+        threading.Thread(target=_plan, daemon=True).start()
+
+    def action_plan_all(self):
+        projects_map = dict(self.projects_map)
+        self._update_detail_panel(f"Planning updates for {len(projects_map)} projects...")
+
+        def _plan():
+            from src.integration.maven.update_planner import format_update_plan, plan_workspace_updates
+            plans = plan_workspace_updates(projects_map)
+            self.app.call_from_thread(self._update_detail_panel, format_update_plan(plans))
+
+        threading.Thread(target=_plan, daemon=True).start()
+
+    def action_find_dependency(self):
+        from src.ui.dependency_query_screen import DependencyQueryScreen
+        self.app.push_screen(DependencyQueryScreen(dict(self.projects_map)))
 
     def action_display_pom(self):
         project_path = self._get_selected_project_path()
@@ -130,35 +207,123 @@ class OverviewScreen(Screen):
         self._update_detail_panel(pom_content)
 
     def action_stop(self):
-        if self.selected_project_name in self.running_projects:
-            pid = self.running_projects[self.selected_project_name]
-            process_killed = kill_process(pid, self.selected_project_name)
-            if process_killed:
-                del self.running_projects[self.selected_project_name]
-        else:
-            logger.warning(f"No running project found with name {self.selected_project_name}")
+        project_name = getattr(self, "selected_project_name", None)
+        service = service_supervisor.get(project_name) if project_name else None
+        if not service or not service.alive:
+            logger.warning(f"No running project found with name {project_name}")
+            return
+        # Waits for the process group to exit, up to service_stop_timeout seconds
+        threading.Thread(target=service_supervisor.stop, args=(project_name,), daemon=True).start()
+
+    def action_services(self):
+        from src.integration.service_metrics import service_metrics
+        self.streamed_service = None
+        lines = [service_supervisor.format_status()]
+        for service in service_supervisor.list():
+            summary = service_metrics.summary(service.name, width=20)
+            if summary and service.alive:
+                lines += ["", service.name, summary]
+        self._update_detail_panel("\n".join(lines))
+
+    def action_benchmark_start(self):
+        project_path = self._get_selected_project_path()
+        if not project_path:
+            return
+        project_name = self.selected_project_name
+        progress = [f"Benchmarking the startup of {project_name}..."]
+        self._update_detail_panel(progress[0])
+
+        def _report(message):
+            progress.append(message)
+            self.app.call_from_thread(self._update_detail_panel, "\n".join(progress))
+
+        def _benchmark():
+            from src.core.startup_history import format_startup_stats, startup_history
+            from src.processor.startup_benchmark import benchmark_start
+            try:
+                benchmark = benchmark_start(project_path, on_progress=_report)
+            except ValueError as e:
+                self.app.call_from_thread(self._update_detail_panel, str(e))
+                return
+            history = format_startup_stats(project_name, startup_history.stats(project_name))
+            self.app.call_from_thread(self._update_detail_panel, f"{benchmark.format()}\n\nAll recorded startups:\n{history}")
+
+        threading.Thread(target=_benchmark, daemon=True).start()
+
+    def action_export_metrics(self):
+        from src.integration.service_metrics import service_metrics
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        base_path = os.path.normpath(os.path.join(os.path.dirname(get_log_file("APP")), f"service_metrics-{timestamp}"))
+        try:
+            count = service_metrics.export(base_path + ".csv")
+            service_metrics.export(base_path + ".json")
+        except OSError as e:
+            self._update_detail_panel(f"Metrics could not be exported: {e}")
+            return
+        self._update_detail_panel(f"Exported {count} metric samples to\n{base_path}.csv\n{base_path}.json")
             
     def action_open(self):
+        from src.processor.project_operations import open_project_in_vscode
         project_path = self._get_selected_project_path()
         open_project_in_vscode(project_path)
         
     def action_quit(self):
+        from src.integration.service_metrics import service_metrics
         self.log_monitor_running = False
+        self.workspace_watcher.stop()
+        service_metrics.stop()
+        service_supervisor.stop_all()
         self.app.exit()
 
     def action_help(self):
+        from src.ui.help_screen import HelpScreen
         self.app.push_screen(HelpScreen())
     
     def action_show_logs(self):
         if not hasattr(self, "selected_project_name") or not self.selected_project_name:
             self._update_detail_panel("No Project selected")
             return
+        from src.ui.log_screen import LogScreen
         self.app.push_screen(LogScreen(self.selected_project_name))
     
     # ------------------ Helper methods ------------------
 
 
+    def _project_summary(self, project_name):
+        summary = f"Selected project: {project_name}"
+        project_path = self.projects_map.get(project_name)
+        if project_path:
+            try:
+                summary += f"\nBranch: {git_refs.current_branch(project_path)}"
+            except (git_refs.GitRefsUnavailable, OSError):
+                pass
+        return summary
+
+    def _follow_service(self, project_name):
+        """Streams the output of the project's service into the detail panel, if it has one."""
+        self.streamed_service = project_name if service_supervisor.get(project_name) else None
+        self.streamed_state = None
+
+    def _stream_service_output(self):
+        service = service_supervisor.get(self.streamed_service) if self.streamed_service else None
+        if not service:
+            return
+        from src.integration.service_metrics import service_metrics
+        samples = service_metrics.samples(service.name)
+        state = (service.output_seq, service.status, len(samples), samples[-1].timestamp if samples else None)
+        if state == self.streamed_state:
+            return
+        self.streamed_state = state
+        header = [service.status_line()]
+        summary = service_metrics.summary(service.name)
+        if summary and service.alive:
+            header.append(summary)
+        lines = service.tail(SERVICE_OUTPUT_LINES)
+        self.detail_panel_container.query_one(Static).update(Text("\n".join(header + [""] + lines)))
+        self.detail_panel_container.scroll_end(animate=False)
+
     def _update_detail_panel(self, text: str):
+        self.streamed_service = None
         detail_text_widget = self.detail_panel_container.query_one(Static)
         detail_text_widget.update(text)
 
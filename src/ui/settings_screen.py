@@ -20,6 +20,7 @@ class SettingsScreen(Screen):
         self.base_path = ""
         self.log_level = "DEBUG"
         self.max_projects = 50
+        self.max_parallel_updates = 4
         self.project_prefix = "web-toll"
         self.spring_profile = "local"
 
@@ -35,6 +36,8 @@ class SettingsScreen(Screen):
                 yield self.log_level_input
                 self.max_projects_input = Input(value=str(self.max_projects), placeholder="Max Projects", id="max-projects")
                 yield self.max_projects_input
+                self.max_parallel_updates_input = Input(value=str(self.max_parallel_updates), placeholder="Max Parallel Updates", id="max-parallel-updates")
+                yield self.max_parallel_updates_input
                 self.project_prefix_input = Input(value=self.project_prefix, placeholder="Project Prefix", id="project-prefix")
                 yield self.project_prefix_input
                 self.spring_profile_input = Input(value=self.spring_profile, placeholder="Spring Profile", id="spring-profile")
@@ -48,13 +51,16 @@ class SettingsScreen(Screen):
     def action_save(self):
         if not self.base_path_input.value.strip():
             return
-        settings = {
+        # Keep keys that are not editable on this screen (scan options, send_to_remote, ...)
+        settings = dict(reload_config())
+        settings.update({
             "base_path": self.base_path_input.value.strip(),
             "log_level": self.log_level_input.value.strip(),
             "max_projects": int(self.max_projects_input.value.strip()),
+            "max_parallel_updates": int(self.max_parallel_updates_input.value.strip()),
             "project_prefix": self.project_prefix_input.value.strip(),
             "spring_profile": self.spring_profile_input.value.strip(),
-        }
+        })
         with open(CONFIG_PATH, "w") as f:
             f.write(toml.dumps(settings))
 
@@ -1,10 +1,11 @@
 # update_projects_window.py
 
 import threading
-import time
 from textual.screen import Screen
 from textual.widgets import Static, Header, Footer
 from textual.containers import Vertical, ScrollableContainer
+from src.config.settings_reader import get_config
+from src.processor.update_all import ProjectUpdateResult, run_update_all, run_update_all_reactor, summarize_results
 from src.utils.logger_setup import global_logger as logger
 
 
@@ -35,26 +36,48 @@ class UpdateProjectsScreen(Screen):
 
     def run_updates(self):
         self.stop_event = threading.Event()
+        self.project_status = {project_name: "queued" for project_name in self.projects_map}
+
         def update_projects():
             logger.info("----------------------- Update all starts -------------------")
-            log_text = ""
-            for project_name, project_path in self.projects_map.items():
-                if self.stop_event.is_set():
-                    log_text += "\nUpdate stopped."
-                    self.log_widget.update(log_text)
-                    logger.info("Update stopped.")
-                    return
-                log_text += f"\n{project_name} ({project_path}) updating..."
-                logger.info(log_text)
-                self.log_widget.update(log_text)
-                time.sleep(1)  # Wait for simulation
-            log_text += "\n----------------------- Update all finished -------------------"
-            self.log_widget.update(log_text)
-            self.app.pop_screen()
+            update_all = run_update_all_reactor if get_config("maven_reactor_mode", False) else run_update_all
+            results = update_all(
+                self.projects_map,
+                stop_event=self.stop_event,
+                on_start=lambda name, path: self.app.call_from_thread(self._set_project_status, name, "updating..."),
+                on_result=lambda result: self.app.call_from_thread(self._on_project_finished, result),
+            )
+            summary = summarize_results(results)
+            logger.info(f"----------------------- Update all finished: {summary} -------------------")
+            self.app.call_from_thread(self._on_update_all_finished, summary)
 
         thread = threading.Thread(target=update_projects, daemon=True)
         thread.start()
 
+    def _on_project_finished(self, result: ProjectUpdateResult):
+        status = result.status
+        if result.status != "skipped":
+            status += f" in {result.duration:.1f}s"
+        if result.error:
+            status += f" ({result.error})"
+        self._set_project_status(result.project_name, status)
+
+    def _set_project_status(self, project_name, status):
+        self.project_status[project_name] = status
+        self._render_status()
+
+    def _on_update_all_finished(self, summary):
+        footer = "Update stopped." if self.stop_event.is_set() else "Update all finished."
+        counts = ", ".join(f"{status}: {count}" for status, count in summary.items())
+        self._render_status(f"\n----------------------- {footer} {counts} -------------------")
+
+    def _render_status(self, footer=""):
+        lines = [
+            f"{project_name} ({self.projects_map[project_name]}) {status}"
+            for project_name, status in self.project_status.items()
+        ]
+        self.log_widget.update("\n".join(lines) + footer)
+
     def action_back(self):
         self.stop_event.set()
         self.app.pop_screen()
@@ -0,0 +1,107 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_ONLYDIR = 0x01000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MODIFY | IN_ATTRIB | IN_CREATE | IN_DELETE
+    | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+# Events on a directory entry that change the tree itself
+TREE_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """Minimal ctypes binding for Linux inotify, watching a set of directories."""
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Self-pipe so that another thread can interrupt a blocking read_events
+        self.wake_read, self.wake_write = os.pipe()
+        os.set_blocking(self.wake_read, False)
+        self.watches = {}  # path -> watch descriptor
+        self.paths = {}  # watch descriptor -> path
+        self.closed = False
+
+    def sync_watches(self, paths):
+        paths = set(paths)
+        for path in list(self.watches):
+            if path not in paths:
+                wd = self.watches.pop(path)
+                self.paths.pop(wd, None)
+                self.libc.inotify_rm_watch(self.fd, wd)
+        for path in paths - self.watches.keys():
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                if errno == 28:  # ENOSPC, fs.inotify.max_user_watches reached
+                    raise OSError(errno, "inotify watch limit reached")
+                continue  # Folder vanished in the meantime, the next refresh picks it up
+            self.watches[path] = wd
+            self.paths[wd] = path
+
+    def read_events(self, timeout) -> list[tuple[str | None, int, str]]:
+        """
+        Blocks up to timeout seconds and returns the queued events as
+        (watched directory, mask, entry name). The directory is None for IN_Q_OVERFLOW.
+        """
+        readable, _, _ = select.select([self.fd, self.wake_read], [], [], timeout)
+        if self.wake_read in readable:
+            try:
+                os.read(self.wake_read, 4096)
+            except BlockingIOError:
+                pass
+        if self.fd not in readable:
+            return []
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                events.append((self.paths.get(wd), mask, os.fsdecode(name)))
+
+    def wait(self, timeout, is_relevant) -> bool:
+        """Blocks up to timeout seconds and returns True when is_relevant(mask, name) held for an event."""
+        return any(is_relevant(mask, name) for _, mask, name in self.read_events(timeout))
+
+    def interrupt(self):
+        """Makes a read_events blocking in another thread return early."""
+        if self.closed:
+            return
+        try:
+            os.write(self.wake_write, b"\0")
+        except OSError:
+            pass  # Closed in the meantime, nothing is blocking on it anymore
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for fd in (self.fd, self.wake_read, self.wake_write):
+            os.close(fd)
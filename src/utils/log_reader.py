@@ -0,0 +1,119 @@
+import os
+from collections import deque
+
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _decode(raw) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+def read_lines_before(path, offset, max_lines, block_size=BLOCK_SIZE) -> list[tuple[int, str]]:
+    """
+    Reads up to max_lines complete lines that end at or before byte offset, walking the
+    file backwards block by block. Only the requested lines are held in memory.
+
+    Returns:
+        list[tuple[int, str]]: (byte offset of the line, text), oldest first.
+    """
+    if offset <= 0 or max_lines <= 0:
+        return []
+    lines = []  # Newest first
+    with open(path, "rb") as f:
+        end = offset
+        carry = b""  # Start of a line that began before the current block, newline included
+        while end > 0 and len(lines) < max_lines:
+            start = max(0, end - block_size)
+            f.seek(start)
+            parts = (f.read(end - start) + carry).split(b"\n")[:-1]
+            offsets = []
+            position = start
+            for part in parts:
+                offsets.append(position)
+                position += len(part) + 1
+            if start > 0:
+                # The first part continues in the previous block
+                carry = parts[0] + b"\n" if parts else carry
+                parts, offsets = parts[1:], offsets[1:]
+            for line_offset, part in zip(reversed(offsets), reversed(parts)):
+                lines.append((line_offset, _decode(part)))
+                if len(lines) >= max_lines:
+                    break
+            end = start
+    lines.reverse()
+    return lines
+
+
+def read_tail(path, max_lines, block_size=BLOCK_SIZE) -> tuple[list[tuple[int, str]], int]:
+    """
+    Reads the last max_lines complete lines of a file.
+
+    Returns:
+        tuple: ((offset, text) lines oldest first, offset where following should continue).
+        A trailing line without newline is still being written and is left for the follower.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        end = size
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            data = f.read(end - start)
+            newline = data.rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+    return read_lines_before(path, end, max_lines, block_size), end
+
+
+class LogRingBuffer:
+    """
+    Bounded window of (offset, text) log lines.
+
+    New lines are appended at the end and push the oldest out. Older lines can be paged in
+    at the front; when that overflows the capacity the newest lines are dropped and the
+    buffer is detached from the tail until it is reloaded.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(1, capacity)
+        self.lines = deque()
+        self.at_tail = True
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __getitem__(self, index) -> str:
+        return self.lines[index][1]
+
+    @property
+    def start_offset(self) -> int:
+        return self.lines[0][0] if self.lines else 0
+
+    def reset(self, lines):
+        self.lines = deque(lines[-self.capacity:])
+        self.at_tail = True
+
+    def append(self, lines) -> int:
+        """Appends tail lines, returns how many old lines were dropped at the front."""
+        if not self.at_tail:
+            return 0
+        self.lines.extend(lines)
+        dropped = max(0, len(self.lines) - self.capacity)
+        for _ in range(dropped):
+            self.lines.popleft()
+        return dropped
+
+    def prepend(self, lines) -> int:
+        """Prepends older lines, returns how many were added."""
+        lines = lines[-self.capacity:]
+        self.lines.extendleft(reversed(lines))
+        overflow = len(self.lines) - self.capacity
+        if overflow > 0:
+            for _ in range(overflow):
+                self.lines.pop()
+            self.at_tail = False
+        return len(lines)
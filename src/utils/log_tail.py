@@ -0,0 +1,298 @@
+import os
+import sys
+import threading
+from collections import deque
+
+from src.utils.inotify import IN_Q_OVERFLOW, Inotify
+
+
+DEFAULT_MAX_PENDING = 10000
+READ_CHUNK = 1024 * 1024
+POLL_INTERVAL = 0.25
+# With inotify every file is still checked this often, in case an event was missed
+INOTIFY_SAFETY_INTERVAL = 5.0
+
+
+def _decode(raw) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+class TailSubscription:
+    """
+    Lines of one tailed file for one consumer, as (offset, text, generation) tuples.
+
+    generation increases when the file is rotated or truncated, offsets of different
+    generations refer to different files. Backpressure is per subscription: at most
+    max_pending lines are queued, a consumer that falls behind loses its oldest lines
+    (counted in dropped) and never slows down the reader or other subscribers.
+    """
+
+    def __init__(self, service, path, max_pending):
+        self.service = service
+        self.path = path
+        self.max_pending = max(1, max_pending)
+        self.pending = deque()
+        self.dropped = 0
+        # Lines of generation min_generation before min_offset were already seen by the consumer
+        self.min_offset = 0
+        self.min_generation = 0
+        self.condition = threading.Condition()
+
+    def _deliver(self, lines, generation):
+        with self.condition:
+            for offset, text in lines:
+                if offset >= self.min_offset or generation != self.min_generation:
+                    self.pending.append((offset, text, generation))
+            overflow = len(self.pending) - self.max_pending
+            for _ in range(max(0, overflow)):
+                self.pending.popleft()
+            self.dropped += max(0, overflow)
+            self.condition.notify_all()
+
+    def drain(self) -> list[tuple[int, str, int]]:
+        with self.condition:
+            lines = list(self.pending)
+            self.pending.clear()
+            return lines
+
+    def wait(self, timeout=None) -> bool:
+        """Blocks until lines are pending or timeout passed, returns True when lines are pending."""
+        with self.condition:
+            if not self.pending:
+                self.condition.wait(timeout)
+            return bool(self.pending)
+
+    def close(self):
+        self.service.unsubscribe(self)
+
+
+class _TailedFile:
+    def __init__(self, path, offset):
+        self.path = path
+        self.offset = offset
+        self.handle = None
+        self.identity = None
+        self.generation = 0
+        self.subscribers = []
+
+    def open(self):
+        try:
+            handle = open(self.path, "rb")
+        except OSError:
+            return False
+        stat = os.fstat(handle.fileno())
+        self.handle, self.identity = handle, (stat.st_dev, stat.st_ino)
+        return True
+
+    def close(self):
+        if self.handle:
+            self.handle.close()
+        self.handle, self.identity = None, None
+
+    def read_lines(self, final=False) -> list[tuple[int, str]]:
+        """Reads the complete lines after offset, with final the unterminated last line too."""
+        lines = []
+        while True:
+            self.handle.seek(self.offset)
+            data = self.handle.read(READ_CHUNK)
+            if not data:
+                return lines
+            end = data.rfind(b"\n") + 1
+            if not end:
+                if len(data) < READ_CHUNK and not final:
+                    return lines  # Still being written
+                end = len(data)  # Unterminated last line, or a line longer than a chunk
+            position = self.offset
+            for raw in data[:end].splitlines(keepends=True):
+                lines.append((position, _decode(raw)))
+                position += len(raw)
+            self.offset += end
+
+    def read_range(self, start, end) -> list[tuple[int, str]]:
+        self.handle.seek(start)
+        data = self.handle.read(end - start)
+        lines, position = [], start
+        for raw in data.splitlines(keepends=True):
+            lines.append((position, _decode(raw)))
+            position += len(raw)
+        return lines
+
+
+class LogTailService:
+    """
+    One thread tailing any number of log files for any number of subscribers.
+
+    On Linux the directories of the tailed files are watched with inotify, so the thread
+    sleeps until a file changes; elsewhere the files are polled every poll_interval seconds.
+    Without subscriptions the thread blocks without waking up.
+
+    Rotation by RotatingFileHandler renames the file and creates a new one: the rest of the
+    renamed file is read through the open handle, then the new file is followed from the
+    start. A file that shrinks was truncated and is followed from the start as well.
+    """
+
+    def __init__(self, poll_interval=POLL_INTERVAL, use_inotify=True):
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self.lock = threading.Lock()
+        self.files = {}
+        self.wakeup = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.inotify = None
+        self.retired_inotify = []  # Closed by the tail thread only, it may be blocked on their fds
+
+    def subscribe(self, path, start_offset=None, max_pending=DEFAULT_MAX_PENDING) -> TailSubscription:
+        """
+        Subscribes to lines appended to path. With start_offset the subscription also gets
+        the lines after that offset that are already in the file, otherwise it starts at the end.
+        """
+        path = os.path.abspath(path)
+        subscription = TailSubscription(self, path, max_pending)
+        with self.lock:
+            tailed = self.files.get(path)
+            if tailed is None:
+                tailed = _TailedFile(path, start_offset or 0)
+                if tailed.open() and start_offset is None:
+                    tailed.offset = os.fstat(tailed.handle.fileno()).st_size
+                self.files[path] = tailed
+            elif start_offset is not None and tailed.handle and start_offset < tailed.offset:
+                # Catch up with the lines the shared reader already passed
+                subscription._deliver(tailed.read_range(start_offset, tailed.offset), tailed.generation)
+            if start_offset is not None and start_offset > tailed.offset:
+                subscription.min_offset, subscription.min_generation = start_offset, tailed.generation
+            tailed.subscribers.append(subscription)
+            self._sync_watches()
+        self._ensure_running()
+        self.wakeup.set()
+        self.check([path])
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            tailed = self.files.get(subscription.path)
+            if tailed and subscription in tailed.subscribers:
+                tailed.subscribers.remove(subscription)
+                if not tailed.subscribers:
+                    tailed.close()
+                    del self.files[subscription.path]
+                    self._sync_watches()
+
+    def stop(self):
+        # Taken under the lock: once stop_event is set, the tail thread closes its inotify on the way out
+        with self.lock:
+            if self.inotify:
+                self.inotify.interrupt()
+        self.stop_event.set()
+        self.wakeup.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+        with self.lock:
+            for tailed in self.files.values():
+                tailed.close()
+            self.files.clear()
+            # The stopped thread closed its inotify, one still running closes it when it returns
+            if self.inotify and not (self.thread and self.thread.is_alive()):
+                self.inotify.close()
+                self.inotify = None
+
+    def check(self, paths=None):
+        """Reads new lines of the given tailed files (all by default) and delivers them."""
+        with self.lock:
+            targets = [self.files[path] for path in (paths or list(self.files)) if path in self.files]
+            for tailed in targets:
+                try:
+                    self._check_file(tailed)
+                except OSError:
+                    tailed.close()  # Reopened on the next check once the file is back
+
+    # ------------------ Helper methods ------------------
+
+    def _check_file(self, tailed):
+        try:
+            stat = os.stat(tailed.path)
+        except FileNotFoundError:
+            stat = None
+
+        if tailed.handle is not None:
+            if stat is None or (stat.st_dev, stat.st_ino) != tailed.identity:
+                # Renamed away or deleted: finish the old file, then continue with the new one
+                self._deliver(tailed, tailed.read_lines(final=True))
+                tailed.close()
+                tailed.offset = 0
+                tailed.generation += 1
+            elif stat.st_size < tailed.offset:
+                tailed.offset = 0
+                tailed.generation += 1
+        if tailed.handle is None and (stat is None or not tailed.open()):
+            return
+        self._deliver(tailed, tailed.read_lines())
+
+    def _deliver(self, tailed, lines):
+        if lines:
+            for subscription in tailed.subscribers:
+                subscription._deliver(lines, tailed.generation)
+
+    def _ensure_running(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        if self.use_inotify and self.inotify is None:
+            try:
+                self.inotify = Inotify()
+                with self.lock:
+                    self._sync_watches()
+            except (OSError, AttributeError):
+                self.inotify, self.use_inotify = None, False
+        self.thread = threading.Thread(target=self._run, name="log-tail", daemon=True)
+        self.thread.start()
+
+    def _sync_watches(self):
+        if self.inotify:
+            try:
+                self.inotify.sync_watches({os.path.dirname(path) for path in self.files})
+            except OSError:
+                # Fall back to polling. Closing the fd here could close it under the select()
+                # of the tail thread, so that thread is woken up and closes it itself
+                self.retired_inotify.append(self.inotify)
+                self.inotify.interrupt()
+                self.inotify = None
+                self.wakeup.set()
+
+    def _close_retired_inotify(self):
+        with self.lock:
+            retired, self.retired_inotify = self.retired_inotify, []
+        for inotify in retired:
+            inotify.close()
+
+    def _run(self):
+        try:
+            while not self.stop_event.is_set():
+                self._close_retired_inotify()
+                with self.lock:
+                    idle = not self.files
+                if idle:
+                    self.wakeup.wait()
+                    self.wakeup.clear()
+                    continue
+
+                inotify = self.inotify
+                if inotify:
+                    events = inotify.read_events(INOTIFY_SAFETY_INTERVAL)
+                    if not events or any(mask & IN_Q_OVERFLOW for _, mask, _ in events):
+                        self.check()
+                    else:
+                        self.check({os.path.join(directory, name) for directory, _, name in events if directory})
+                else:
+                    self.wakeup.wait(self.poll_interval)
+                    self.wakeup.clear()
+                    self.check()
+        finally:
+            with self.lock:
+                if self.inotify:
+                    self.retired_inotify.append(self.inotify)
+                    self.inotify = None
+            self._close_retired_inotify()
+
+
+log_tail_service = LogTailService()
@@ -1,12 +1,145 @@
+import atexit
 import logging
 import os
-import time
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from src.config.settings_reader import get_config
 
+# Format of every log line, the log screens and the log search rely on it
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+
+class _BufferedFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that leaves flushing to the router, once per batch of records."""
+
+    def flush(self):
+        pass
+
+    def flush_buffer(self):
+        super().flush()
+
+
+class _LogFileRouter(logging.Handler):
+    """
+    Runs on the QueueListener thread and writes every record to app.log, or to the log
+    file of its project. At most max_open_files project files are kept open, the least
+    recently used one is closed when another project logs. Files are flushed when the
+    queue runs empty, so a burst of records costs one flush per file instead of one per line.
+    Old log files are deleted here too, between records, so a file opened in this run is never removed.
+    """
+
+    def __init__(self, log_queue, log_dir, app_handler, max_bytes, backup_count, max_open_files):
+        super().__init__()
+        self.queue = log_queue
+        self.log_dir = log_dir
+        self.app_handler = app_handler
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_open_files = max(1, max_open_files)
+        self.project_handlers = OrderedDict()
+        self.dirty = set()
+        self.opened_files = {os.path.basename(app_handler.baseFilename)}
+
+    def emit(self, record):
+        keep = getattr(record, "delete_log_files", None)
+        if keep:
+            self._delete_log_files(keep)
+        else:
+            project_name = getattr(record, "project", None)
+            handler = self._project_handler(project_name) if project_name else self.app_handler
+            handler.emit(record)
+            self.dirty.add(handler)
+        if self.queue.empty():
+            self.flush()
+
+    def flush(self):
+        for handler in self.dirty:
+            handler.flush_buffer()
+        self.dirty.clear()
+
+    def close_project(self, project_name):
+        handler = self.project_handlers.pop(project_name, None)
+        if handler:
+            self.dirty.discard(handler)
+            handler.close()
+
+    def close(self):
+        self.flush()
+        for project_name in list(self.project_handlers):
+            self.close_project(project_name)
+        self.app_handler.close()
+        super().close()
+
+    def _project_handler(self, project_name):
+        handler = self.project_handlers.get(project_name)
+        if handler:
+            self.project_handlers.move_to_end(project_name)
+            return handler
+        while len(self.project_handlers) >= self.max_open_files:
+            self.close_project(next(iter(self.project_handlers)))
+        log_file = os.path.join(self.log_dir, f"{project_name}.log")
+        self.opened_files.add(os.path.basename(log_file))
+        handler = _BufferedFileHandler(
+            log_file, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8", delay=True
+        )
+        handler.setFormatter(self.app_handler.formatter)
+        self.project_handlers[project_name] = handler
+        return handler
+
+    def _delete_log_files(self, keep):
+        try:
+            log_names = os.listdir(self.log_dir)
+        except FileNotFoundError:
+            return
+        for log_name in log_names:
+            if log_name in self.opened_files or keep(log_name):
+                continue
+            try:
+                os.remove(os.path.join(self.log_dir, log_name))
+            except OSError as e:
+                self._log_app(logging.WARNING, f"{log_name} could not be deleted: {e}")
+                continue
+            self._log_app(logging.INFO, f"{log_name} is deleted")
+
+    def _log_app(self, level, message):
+        record = logging.makeLogRecord({"msg": message, "levelno": level, "levelname": logging.getLevelName(level)})
+        self.app_handler.emit(record)
+        self.dirty.add(self.app_handler)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Enqueues records as they are; formatting happens on the listener thread, not the caller's.
+    The first record starts the logging pipeline.
+    """
+
+    def __init__(self, setup):
+        super().__init__(setup.queue)
+        self.setup = setup
+
+    def prepare(self, record):
+        return record
+
+    def emit(self, record):
+        if not self.setup.started:
+            self.setup.start()
+        if record.levelno >= self.setup.level:
+            super().emit(record)
+
+
 class LoggerSetup:
-    def __init__(self):
-        self.log_dir = os.path.join(
+    """
+    Logging of the application (app.log) and of every project (<project>.log).
+
+    Creating a LoggerSetup has no side effects: the log folder, the config values, the
+    app.log handler and the listener thread are set up by the first logged record, so
+    importing a module that logs costs nothing until it actually logs.
+    """
+
+    def __init__(self, log_dir=None, max_open_files=None):
+        self.log_dir = log_dir or os.path.join(
             os.path.dirname(__file__),
             "..",
             "..",
@@ -15,45 +148,96 @@ class LoggerSetup:
         self.log_file = os.path.join(self.log_dir, "app.log")
         self.max_bytes = 10 * 1024 * 1024  # 10MB
         self.backup_count = 5
-        self.project_loggers = {}
+        self.max_open_files = max_open_files
+        self.level = logging.DEBUG
+        self.started = False
+        self.stopped = False
+        self.exit_registered = False
+        self.start_lock = threading.Lock()
+        self.router = None
+        self.listener = None
 
-        os.makedirs(self.log_dir, exist_ok=True)
+        self.queue = queue.SimpleQueue()
+        self.logger = self._queue_logger(self.log_file)
+        self.project_logger = self._queue_logger(f"{self.log_file}:projects")
 
-        self.logger = self._setup_logging()
+    def start(self):
+        """Global Logger Kurulumu, runs once on the first record."""
+        with self.start_lock:
+            if self.started:
+                return
+            log_level_str = get_config("log_level", "INFO").upper()
+            self.level = getattr(logging, log_level_str, logging.INFO)
+            self.max_open_files = self.max_open_files or int(get_config("max_open_log_files", 64))
+            os.makedirs(self.log_dir, exist_ok=True)
 
-    def _setup_logging(self, log_file=None):
-        """Global Logger Kurulumu"""
-        log_file = log_file or self.log_file
+            app_handler = _BufferedFileHandler(
+                self.log_file,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                encoding="utf-8"
+            )
+            app_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            self.router = _LogFileRouter(
+                self.queue, self.log_dir, app_handler, self.max_bytes, self.backup_count, self.max_open_files
+            )
+            # Callers only enqueue records, a single listener thread does the file writes
+            self.listener = QueueListener(self.queue, self.router)
+            self.listener.start()
+            if not self.exit_registered:
+                atexit.register(self.stop)
+                self.exit_registered = True
+            for logger in (self.logger, self.project_logger):
+                logger.setLevel(self.level)
+            self.started = True
 
-        log_level_str = get_config("log_level", "INFO").upper()
-        log_level = getattr(logging, log_level_str, logging.INFO)
-
-        logger = logging.getLogger(log_file)
-        logger.setLevel(log_level)
+    def _queue_logger(self, name):
+        logger = logging.getLogger(name)
+        # The configured level is applied by start(), until then every record reaches the handler
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
 
         if logger.hasHandlers():
             logger.handlers.clear()
+        logger.addHandler(_RecordQueueHandler(self))
+        return logger
 
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=self.max_bytes,
-            backupCount=self.backup_count,
-            encoding="utf-8"
-        )
-        file_handler.setLevel(log_level)
-        file_format = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(message)s"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+    def stop(self):
+        """Writes the queued records and closes all log files."""
+        if not self.started or self.stopped:
+            return
+        self.stopped = True
+        self.listener.stop()
+        self.router.close()
 
-        return logger
+    def use_log_dir(self, log_dir) -> str:
+        """
+        Writes the logs to log_dir from the next record on, e.g. a test's or a benchmark's
+        temporary folder. The open log files are written out and closed first.
+
+        Returns:
+            str: The previous log folder, to switch back.
+        """
+        with self.start_lock:
+            previous = self.log_dir
+            self.stop()
+            self.log_dir = log_dir
+            self.log_file = os.path.join(log_dir, "app.log")
+            self.started = self.stopped = False
+            self.router = self.listener = None
+        return previous
 
-    def _get_project_logger(self, project_name):
-        if project_name not in self.project_loggers:
-            log_file = os.path.join(self.log_dir, f"{project_name}.log")
-            self.project_loggers[project_name] = self._setup_logging(log_file)
-        return self.project_loggers[project_name]
+    def delete_log_files(self, keep):
+        """
+        Deletes the log files of earlier runs without waiting for it. The listener thread
+        deletes them in order with the records, files this run already logged to are kept.
+
+        Args:
+            keep (callable): Called with a file name, True keeps the file.
+        """
+        if not self.started:
+            self.start()
+        self.queue.put(logging.makeLogRecord({"msg": "delete log files", "delete_log_files": keep}))
 
     def get_log_file_path(self, project_name):
         """Returns the log file path for the given project name."""
@@ -61,25 +245,25 @@ class LoggerSetup:
 
     def log_with_project(self, message, repo_path=None, level="info"):
         project_name = os.path.basename(repo_path) if repo_path else "APP"
-        logger = self._get_project_logger(project_name) if repo_path else self.logger
-        log_message = f"{project_name} | {message}"
+        logger = self.project_logger if repo_path else self.logger
         log_method = getattr(logger, level.lower(), logger.info)
-        log_method(log_message)
-
-    def read_log_continuously(self, callback, project_name=None):
-        log_path = self.log_file
-        with open(log_path, "r") as log_file:
-            # Dosyanın sonuna git
-            log_file.seek(0, os.SEEK_END)
-            while True:
-                line = log_file.readline()
-                if not line:
-                    time.sleep(0.1)  # Yeni satır gelene kadar bekle
-                    continue
-                self.logger.debug(f"Read line: {line.strip()}")
-                if project_name and f"{project_name} |" not in line:
+        log_method(f"{project_name} | {message}", extra={"project": project_name} if repo_path else None)
+
+    def read_log_continuously(self, callback, project_name=None, stop_event=None):
+        """Calls callback for every new line of app.log, through the shared log tail service."""
+        from src.utils.log_tail import log_tail_service
+
+        subscription = log_tail_service.subscribe(self.log_file)
+        try:
+            while not (stop_event and stop_event.is_set()):
+                if not subscription.wait(0.5):
                     continue
-                callback(line.strip())
+                for _, line, _ in subscription.drain():
+                    if project_name and f"{project_name} |" not in line:
+                        continue
+                    callback(line.strip())
+        finally:
+            subscription.close()
 
 logger_setup = LoggerSetup()
 global_logger = logger_setup.logger  # Klasik logger çağrılarını destekler
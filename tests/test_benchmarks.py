@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from benchmarks.run_benchmarks import BenchmarkResult, BenchmarkSuite, compare, load_baseline, save_baseline
+from benchmarks.synthetic_workspace import dependency_tree, generate_workspace, write_stub_mvn
+from src.core.project_scanner import scan_projects
+from src.utils.logger_setup import logger_setup
+
+class TestBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # The flows log per project, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_scanner_finds_every_generated_project(self):
+        workspace = generate_workspace(os.path.join(self.tmp.name, "ws"), projects=12, modules=2, depth=2, groups=3)
+        self.assertEqual(scan_projects(workspace.root), workspace.projects)
+        modules = scan_projects(workspace.root, stop_at_project_root=False)
+        self.assertEqual(len(modules), 12 * 7)  # project, 2 modules, 4 submodules
+        self.assertGreater(workspace.directories, len(modules))
+
+    def test_stub_mvn_writes_tree_and_touches_pom(self):
+        tree_file = os.path.join(self.tmp.name, "tree.json")
+        with open(tree_file, "w") as f:
+            json.dump(dependency_tree(breadth=2, depth=2), f)
+        stub = write_stub_mvn(os.path.join(self.tmp.name, "bin"), output_lines=3, tree_file=tree_file)
+        with open(os.path.join(self.tmp.name, "pom.xml"), "w") as f:
+            f.write("<project/>\n")
+        out_file = os.path.join(self.tmp.name, "out.json")
+        process = subprocess.run([stub, "versions:update-properties", f"-DoutputFile={out_file}"],
+                                 cwd=self.tmp.name, capture_output=True, text=True)
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(len(process.stdout.splitlines()), 4)
+        with open(out_file) as f:
+            self.assertEqual(json.load(f)["artifactId"], "svc")
+        with open(os.path.join(self.tmp.name, "pom.xml")) as f:
+            self.assertIn("stub mvn update", f.read())
+
+    def test_regressions_are_reported_against_the_baseline(self):
+        baseline_path = os.path.join(self.tmp.name, "baseline.json")
+        save_baseline([BenchmarkResult("scan", 3, 1.0, 1.2, 0.9, 1.2), BenchmarkResult("parse", 3, 2.0, 2.0, 2.0, 2.0)],
+                      "small", baseline_path)
+        save_baseline([BenchmarkResult("parse", 3, 2.5, 2.5, 2.5, 2.5)], "small", baseline_path)
+        baseline = load_baseline(baseline_path)["sizes"]["small"]["results"]
+        self.assertEqual(sorted(baseline), ["parse", "scan"])
+        results = [BenchmarkResult("scan", 3, 1.3, 1.3, 1.3, 1.3), BenchmarkResult("parse", 3, 2.6, 2.6, 2.6, 2.6)]
+        self.assertEqual([name for name, *_ in compare(results, baseline, tolerance=0.25)], ["scan"])
+
+    def test_small_suite_runs_every_benchmark(self):
+        suite = BenchmarkSuite(self.tmp.name, "small", runs=1)
+        results = suite.run()
+        self.assertEqual(sorted(result.name for result in results), sorted(BenchmarkSuite.benchmark_names()))
+        self.assertTrue(all(result.median > 0 for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
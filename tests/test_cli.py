@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs 'reporanger.py update' with the projects and git flow stubbed, reports whether Textual was imported.
+# The first argument is the folder the logs go to, the rest are the command line.
+UPDATE_SCRIPT = """
+import sys
+from unittest.mock import patch
+from src.cli import main
+from src.utils.logger_setup import logger_setup
+logger_setup.use_log_dir(sys.argv[1])
+projects = {"a": "/ws/a", "b": "/ws/b"}
+with patch("src.core.project_scanner.find_spring_projects", return_value=projects), \\
+        patch("src.processor.process.git_flow_start", side_effect=lambda path: path.endswith("a")), \\
+        patch("src.processor.process.mvn_quick_update_flow", return_value=True), \\
+        patch("src.processor.process.has_dependency_conflict", return_value=True), \\
+        patch("src.processor.process.git_flow_finish", return_value=True):
+    code = main(sys.argv[2:])
+print("textual imported:", "textual" in sys.modules)
+sys.exit(code)
+"""
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.log_dir.cleanup)
+
+    def run_update(self, *args):
+        return subprocess.run(
+            [sys.executable, "-c", UPDATE_SCRIPT, self.log_dir.name, "update", *args],
+            cwd=ROOT, capture_output=True, text=True, timeout=60,
+        )
+
+    def test_update_all_writes_report_without_textual(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = os.path.join(tmp, "out.json")
+            process = self.run_update("--all", "--jobs", "2", "--no-reactor", "--report", report_path)
+            self.assertEqual(process.returncode, 1, process.stderr)
+            self.assertIn("textual imported: False", process.stdout)
+            self.assertIn("1 success, 1 failed", process.stdout)
+            with open(report_path) as f:
+                report = json.load(f)
+        self.assertEqual((report["mode"], report["workers"]), ("per-project", 2))
+        self.assertEqual([p["status"] for p in report["projects"]], ["success", "failed"])
+        self.assertEqual(len(report["projects"][0]["steps"]), 4)
+        self.assertEqual(report["projects"][1]["steps"], [
+            {"name": "git_flow_start", "status": "failed", "duration": 0.0, "error": None}
+        ])
+
+    def test_update_selected_projects(self):
+        self.assertEqual(self.run_update("a", "--no-reactor").returncode, 0)
+        self.assertEqual(self.run_update("missing").returncode, 2)
+        self.assertEqual(self.run_update().returncode, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from src.integration.command_recorder import NOT_RECORDED_CODE, CommandRecorder, command_recorder
+from src.integration.command_runner import CommandResult
+from src.integration.git.git_client import run_git_command
+from src.utils.logger_setup import logger_setup
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+class TestCommandRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.trace = os.path.join(self.tmp.name, "trace.jsonl.gz")
+        self.recorder = CommandRecorder()
+
+    def tearDown(self):
+        self.recorder.stop()
+        command_recorder.stop()
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_git_commands_replay_without_the_repository(self):
+        repo = os.path.join(self.tmp.name, "repo")
+        _git(self.tmp.name, "init", "-q", "-b", "main", repo)
+        with open(os.path.join(repo, "pom.xml"), "w") as f:
+            f.write("<project/>\n")
+        command_recorder.record(self.trace)
+        recorded = [run_git_command(repo, "status --porcelain"), run_git_command(repo, "branch --show-current")]
+        command_recorder.stop()
+
+        shutil.rmtree(repo)
+        command_recorder.replay(self.trace, timing="none")
+        replayed = [run_git_command(repo, "status --porcelain"), run_git_command(repo, "branch --show-current")]
+        self.assertEqual(recorded, [(0, "?? pom.xml"), (0, "main")])
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(run_git_command(repo, "status --porcelain")[0], NOT_RECORDED_CODE)
+
+    def test_output_files_are_restored_at_the_new_path(self):
+        def runner(args, cwd=None):
+            with open(args[1].split("=", 1)[1], "w") as f:
+                f.write('{"artifactId": "svc"}')
+            return CommandResult(0, "BUILD SUCCESS", "", 0.01)
+
+        first = os.path.join(self.tmp.name, "first.json")
+        self.recorder.record(self.trace)
+        self.recorder.run(runner, ["mvn", f"-DoutputFile={first}"], "/ws/svc", output_files=[first])
+        self.recorder.stop()
+
+        second = os.path.join(self.tmp.name, "second.json")
+        self.recorder.replay(self.trace, timing="none")
+        result = self.recorder.run(None, ["mvn", f"-DoutputFile={second}"], "/ws/svc", output_files=[second])
+        self.assertEqual((result.returncode, result.stdout), (0, "BUILD SUCCESS"))
+        with open(second) as f:
+            self.assertEqual(f.read(), '{"artifactId": "svc"}')
+
+    def test_replay_matches_generated_arguments_and_keeps_timing(self):
+        self.recorder.record(self.trace)
+        for args, duration in ((["git", "status"], 0.0), (["git", "checkout", "-B", "update_10_00"], 0.3)):
+            self.recorder.run(lambda a, cwd=None, d=duration: CommandResult(0, " ".join(a), "", d), args, "/ws/svc")
+        self.recorder.stop()
+
+        self.recorder.replay(self.trace)
+        started = time.monotonic()
+        result = self.recorder.run(None, ["git", "checkout", "-B", "update_10_05"], "/ws/svc")
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        self.assertEqual(result.stdout, "git checkout -B update_10_00")
+        self.assertEqual(self.recorder.run(None, ["git", "status"], "/ws/svc/").stdout, "git status")
+        self.assertEqual(self.recorder.run(None, ["git", "status"], "/ws/other").returncode, NOT_RECORDED_CODE)
+
+if __name__ == '__main__':
+    unittest.main()
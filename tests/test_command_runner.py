@@ -0,0 +1,36 @@
+import asyncio
+import sys
+import time
+import unittest
+from src.integration.command_runner import CommandRunner
+
+class TestCommandRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = CommandRunner(max_concurrent=2)
+
+    def test_run_sync_captures_output_and_exit_code(self):
+        result = self.runner.run_sync([sys.executable, "-c", "import sys; print('out'); sys.stderr.write('err'); sys.exit(3)"])
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout.strip(), "out")
+        self.assertEqual(result.stderr, "err")
+
+    def test_run_async_respects_concurrency_limit(self):
+        sleep = [sys.executable, "-c", "import time; time.sleep(0.3)"]
+
+        async def run_all():
+            return await asyncio.gather(*(self.runner.run_async(sleep) for _ in range(4)))
+
+        started = time.monotonic()
+        results = asyncio.run(run_all())
+        elapsed = time.monotonic() - started
+        self.assertTrue(all(r.returncode == 0 for r in results))
+        self.assertGreaterEqual(elapsed, 0.6)
+
+    def test_run_sync_timeout_kills_process(self):
+        result = self.runner.run_sync([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.2)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("timed out", result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
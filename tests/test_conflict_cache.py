@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.integration.command_runner import CommandResult
+from src.integration.maven import maven_conflict_checker
+from src.integration.maven.conflict_cache import ConflictResultCache, project_pom_files
+from src.utils.logger_setup import logger_setup
+
+PARENT_POM = """<project><groupId>com.example</groupId><artifactId>corp-parent</artifactId><version>1</version>
+<packaging>pom</packaging></project>"""
+PROJECT_POM = """<project><parent><groupId>com.example</groupId><artifactId>corp-parent</artifactId><version>1</version></parent>
+<artifactId>svc</artifactId><packaging>pom</packaging><modules><module>core</module></modules></project>"""
+MODULE_POM = """<project><parent><groupId>com.example</groupId><artifactId>svc</artifactId><version>1</version></parent>
+<artifactId>svc-core</artifactId><version>{version}</version></project>"""
+
+class TestConflictCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # corp-parent/pom.xml is the local parent of svc through the default ../pom.xml
+        self.workspace = os.path.join(self.tmp.name, "corp-parent")
+        self.project = os.path.join(self.workspace, "svc")
+        self._write(os.path.join(self.workspace, "pom.xml"), PARENT_POM)
+        self._write(os.path.join(self.project, "pom.xml"), PROJECT_POM)
+        self._write(os.path.join(self.project, "core", "pom.xml"), MODULE_POM.format(version="1"))
+        self.cache = ConflictResultCache(os.path.join(self.tmp.name, "cache"), max_entries=2)
+        # The checks log as svc, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def _write(self, path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def test_pom_files_include_modules_and_local_parents(self):
+        self.assertEqual(project_pom_files(self.project), sorted([
+            os.path.join(self.workspace, "pom.xml"),
+            os.path.join(self.project, "pom.xml"),
+            os.path.join(self.project, "core", "pom.xml"),
+        ]))
+
+    def test_key_follows_pom_content_and_settings(self):
+        key = self.cache.key_for(self.project)
+        self.assertEqual(self.cache.key_for(self.project), key)
+
+        self._write(os.path.join(self.project, "core", "pom.xml"), MODULE_POM.format(version="2"))
+        module_key = self.cache.key_for(self.project)
+        self.assertNotEqual(module_key, key)
+
+        self._write(os.path.join(self.workspace, "pom.xml"), PARENT_POM.replace("<version>1", "<version>1 "))
+        parent_key = self.cache.key_for(self.project)
+        self.assertNotEqual(parent_key, module_key)
+
+        with patch("src.integration.maven.conflict_cache.get_config", return_value="offline"):
+            self.assertNotEqual(self.cache.key_for(self.project), parent_key)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("a", True)
+        self.cache.put("b", False)
+        os.utime(os.path.join(self.cache.cache_dir, "a.json"), (1, 1))
+        os.utime(os.path.join(self.cache.cache_dir, "b.json"), (2, 2))
+        self.assertTrue(self.cache.get("a"))  # Hit, "a" becomes the most recently used
+        self.cache.put("c", True)
+
+        self.assertTrue(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertTrue(self.cache.get("c"))
+
+    def test_unchanged_project_skips_maven(self):
+        def _maven(command_args, cwd=None):
+            output_file = next(arg.split("=", 1)[1] for arg in command_args if arg.startswith("-DoutputFile="))
+            with open(output_file, "w") as f:
+                json.dump({"groupId": "com.example", "artifactId": "svc", "version": "1", "children": []}, f)
+            return CommandResult(0, "", "")
+
+        with patch.object(maven_conflict_checker, "conflict_cache", self.cache), \
+             patch.object(maven_conflict_checker, "run_command_sync", side_effect=_maven) as run:
+            self.assertTrue(maven_conflict_checker.has_dependency_conflict(self.project))
+            self.assertTrue(maven_conflict_checker.has_dependency_conflict(self.project))
+            self.assertEqual(run.call_count, 1)
+
+            self._write(os.path.join(self.project, "core", "pom.xml"), MODULE_POM.format(version="2"))
+            self.assertTrue(maven_conflict_checker.has_dependency_conflict(self.project))
+            self.assertEqual(run.call_count, 2)
+
+    def test_failed_maven_run_is_not_cached(self):
+        with patch.object(maven_conflict_checker, "conflict_cache", self.cache), \
+             patch.object(maven_conflict_checker, "run_command_sync", return_value=CommandResult(1, "", "boom")) as run:
+            self.assertFalse(maven_conflict_checker.has_dependency_conflict(self.project))
+            self.assertFalse(maven_conflict_checker.has_dependency_conflict(self.project))
+            self.assertEqual(run.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from src import cli
+from src.core.dependency_index import DependencyIndex, parse_query
+from src.integration.maven.pom_reader import walk_project_poms
+from src.utils.logger_setup import logger_setup
+
+def _pom(artifact_id, parent_version, jackson_version, modules=()):
+    module_xml = "".join(f"<module>{m}</module>" for m in modules)
+    return f"""<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <parent>
+    <groupId>org.springframework.boot</groupId>
+    <artifactId>spring-boot-starter-parent</artifactId>
+    <version>{parent_version}</version>
+  </parent>
+  <groupId>com.example</groupId>
+  <artifactId>{artifact_id}</artifactId>
+  <version>1.0.0</version>
+  <properties><jackson.version>{jackson_version}</jackson.version></properties>
+  <modules>{module_xml}</modules>
+  <dependencies>
+    <dependency>
+      <groupId>com.fasterxml.jackson.core</groupId>
+      <artifactId>jackson-databind</artifactId>
+      <version>${{jackson.version}}</version>
+    </dependency>
+  </dependencies>
+</project>
+"""
+
+class TestDependencyIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.index_path = os.path.join(self.tmp.name, "cache", "dependency_index.json")
+        self.projects = {}
+        self._project("svc-a", _pom("svc-a", "3.1.5", "2.14.2"))
+        self._project("svc-b", _pom("svc-b", "3.2.0", "2.15.3"))
+        self._project("svc-c", _pom("svc-c", "3.10.0", "2.16.0", modules=["core"]))
+        self._write(os.path.join(self.projects["svc-c"], "core", "pom.xml"), _pom("svc-c-core", "3.10.0", "2.13.0"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def _project(self, name, content):
+        self.projects[name] = os.path.join(self.tmp.name, name)
+        self._write(os.path.join(self.projects[name], "pom.xml"), content)
+
+    def _write(self, path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def _names(self, usages):
+        return sorted((u.project_name, u.version) for u in usages)
+
+    def test_parse_query(self):
+        self.assertEqual(parse_query("jackson-databind<2.15"), ("jackson-databind", "<", "2.15"))
+        self.assertEqual(parse_query("a:b >= 1.0"), ("a:b", ">=", "1.0"))
+        self.assertEqual(parse_query("org.springframework.boot:spring-boot-starter-parent:3.1"),
+                         ("org.springframework.boot:spring-boot-starter-parent", "=", "3.1"))
+        self.assertEqual(parse_query("spring-boot-starter-parent:3.1"), ("spring-boot-starter-parent", "=", "3.1"))
+        self.assertEqual(parse_query("jackson-*"), ("jackson-*", None, None))
+
+    def test_queries(self):
+        index = DependencyIndex(self.index_path)
+        self.assertEqual(index.refresh(self.projects), 3)
+
+        # A version prefix does not match 3.10.0
+        self.assertEqual(self._names(index.query("spring-boot-starter-parent:3.1")), [("svc-a", "3.1.5")])
+        # Property versions are interpolated, modules are indexed
+        self.assertEqual(
+            self._names(index.query("com.fasterxml.jackson.core:jackson-databind<2.15")),
+            [("svc-a", "2.14.2"), ("svc-c", "2.13.0")],
+        )
+        self.assertEqual(len(index.query("jackson-*")), 4)
+
+    def test_incremental_refresh_and_persistence(self):
+        index = DependencyIndex(self.index_path)
+        index.refresh(self.projects)
+        self.assertEqual(index.refresh(self.projects), 0)
+
+        # Only the project whose module pom changed is parsed again
+        self._write(os.path.join(self.projects["svc-c"], "core", "pom.xml"), _pom("svc-c-core", "3.10.0", "2.17.0"))
+        with patch("src.core.dependency_index.walk_project_poms", wraps=walk_project_poms) as walk:
+            self.assertEqual(index.refresh(self.projects), 1)
+            walk.assert_called_once()
+
+        removed = dict(self.projects)
+        del removed["svc-a"]
+        self.assertEqual(index.refresh(removed), 1)
+
+        reloaded = DependencyIndex(self.index_path)
+        self.assertEqual(reloaded.refresh(removed), 0)
+        self.assertEqual(self._names(reloaded.query("jackson-databind>=2.17")), [("svc-c", "2.17.0")])
+
+    def test_cli_deps(self):
+        index = DependencyIndex(self.index_path)
+        with patch("src.core.project_index.project_index.refresh"), \
+             patch("src.core.project_index.project_index.load", return_value=self.projects), \
+             patch("src.core.dependency_index.dependency_index", index):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                self.assertEqual(cli.main(["deps", "spring-boot-starter-parent:3.2"]), 0)
+            self.assertIn("svc-b", output.getvalue())
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(cli.main(["deps", "unknown-artifact"]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.integration.maven import maven_conflict_checker
+from src.integration.maven.conflict_cache import ConflictResultCache
+from src.integration.maven.dependency_resolver import ArtifactNotAvailable, clear_model_cache, resolve_dependency_conflicts
+from src.utils.logger_setup import logger_setup
+
+def _dependency(coordinates, scope=None, optional=False, exclusions=(), type_=None):
+    group_id, artifact_id, *version = coordinates.split(":")
+    xml = f"<dependency><groupId>{group_id}</groupId><artifactId>{artifact_id}</artifactId>"
+    if version:
+        xml += f"<version>{version[0]}</version>"
+    if type_:
+        xml += f"<type>{type_}</type>"
+    if scope:
+        xml += f"<scope>{scope}</scope>"
+    if optional:
+        xml += "<optional>true</optional>"
+    if exclusions:
+        xml += "<exclusions>" + "".join(
+            f"<exclusion><groupId>{g}</groupId><artifactId>{a}</artifactId></exclusion>"
+            for g, a in (e.split(":") for e in exclusions)
+        ) + "</exclusions>"
+    return xml + "</dependency>"
+
+def _pom(coordinates, dependencies=(), managed=(), parent=None, properties=None, modules=(), packaging=None):
+    group_id, artifact_id, version = coordinates.split(":")
+    xml = '<project xmlns="http://maven.apache.org/POM/4.0.0"><modelVersion>4.0.0</modelVersion>'
+    if parent:
+        pg, pa, pv = parent.split(":")
+        xml += f"<parent><groupId>{pg}</groupId><artifactId>{pa}</artifactId><version>{pv}</version></parent>"
+    xml += f"<groupId>{group_id}</groupId><artifactId>{artifact_id}</artifactId><version>{version}</version>"
+    if packaging:
+        xml += f"<packaging>{packaging}</packaging>"
+    if properties:
+        xml += "<properties>" + "".join(f"<{k}>{v}</{k}>" for k, v in properties.items()) + "</properties>"
+    if modules:
+        xml += "<modules>" + "".join(f"<module>{m}</module>" for m in modules) + "</modules>"
+    if managed:
+        xml += "<dependencyManagement><dependencies>" + "".join(managed) + "</dependencies></dependencyManagement>"
+    if dependencies:
+        xml += "<dependencies>" + "".join(dependencies) + "</dependencies>"
+    return xml + "</project>"
+
+class TestDependencyResolver(unittest.TestCase):
+
+    def setUp(self):
+        clear_model_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.repository = os.path.join(self.tmp.name, "repository")
+        self.project = os.path.join(self.tmp.name, "svc")
+
+        # A BOM that manages org.lib:c, imported by the parent
+        self._publish("org.bom:bom:1.0", managed=[_dependency("org.lib:c:2.0")], packaging="pom")
+        self._publish("org.corp:parent:1.0", packaging="pom", properties={"lib.version": "1.0"}, managed=[
+            _dependency("org.bom:bom:1.0", scope="import", type_="pom"),
+            _dependency("org.lib:a:${lib.version}"),
+        ])
+        self._publish("org.lib:a:1.0", dependencies=[
+            _dependency("org.lib:c:1.0"),
+            _dependency("org.lib:junk:1.0", scope="test"),
+            _dependency("org.lib:opt:1.0", optional=True),
+            _dependency("org.lib:excluded:1.0"),
+        ])
+        self._publish("org.lib:b:1.0", dependencies=[_dependency("org.lib:d:1.0")])
+        self._publish("org.lib:c:1.0")
+        self._publish("org.lib:c:2.0")
+        self._publish("org.lib:d:1.0", dependencies=[_dependency("org.lib:a:9.9")])
+
+    def tearDown(self):
+        clear_model_cache()
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def _publish(self, coordinates, **kwargs):
+        group_id, artifact_id, version = coordinates.split(":")
+        directory = os.path.join(self.repository, *group_id.split("."), artifact_id, version)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{artifact_id}-{version}.pom"), "w") as f:
+            f.write(_pom(coordinates, **kwargs))
+
+    def _write_project(self, pom, directory=None):
+        directory = directory or self.project
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "pom.xml"), "w") as f:
+            f.write(pom)
+
+    def test_parent_bom_scopes_and_exclusions(self):
+        self._write_project(_pom("com.example:svc:1.0", parent="org.corp:parent:1.0", dependencies=[
+            _dependency("org.lib:a", exclusions=["org.lib:excluded"]),
+            _dependency("org.lib:b:1.0", scope="test"),
+        ]))
+        tree = resolve_dependency_conflicts(self.project, self.repository)
+
+        self.assertEqual(tree.conflicts(), {})
+        versions = {ga: list(v) for ga, v in tree.versions.items()}
+        self.assertEqual(versions, {
+            "org.lib:a": ["1.0"],  # Version from the parent's dependencyManagement
+            "org.lib:b": ["1.0"],
+            "org.lib:c": ["2.0"],  # Managed by the imported BOM
+            "org.lib:d": ["1.0"],  # org.lib:a:9.9 below it loses against the nearer a:1.0
+        })
+        self.assertEqual(
+            tree.versions["org.lib:c"]["2.0"],
+            ["com.example:svc:1.0 > org.lib:a:1.0 > org.lib:c:2.0"],
+        )
+
+    def test_modules_with_different_versions_conflict(self):
+        self._write_project(_pom("com.example:svc:1.0", packaging="pom", modules=["m1", "m2"]))
+        self._write_project(
+            _pom("com.example:m1:1.0", parent="com.example:svc:1.0", dependencies=[_dependency("org.lib:c:1.0")]),
+            os.path.join(self.project, "m1"),
+        )
+        self._write_project(
+            _pom("com.example:m2:1.0", parent="com.example:svc:1.0", dependencies=[
+                _dependency("com.example:m1:${project.version}"),
+                _dependency("org.lib:c:2.0"),
+            ]),
+            os.path.join(self.project, "m2"),
+        )
+        tree = resolve_dependency_conflicts(self.project, self.repository)
+        self.assertEqual(sorted(tree.conflicts()["org.lib:c"]), ["1.0", "2.0"])
+
+    def test_missing_artifact_raises(self):
+        self._write_project(_pom("com.example:svc:1.0", dependencies=[_dependency("org.missing:x:1.0")]))
+        with self.assertRaises(ArtifactNotAvailable):
+            resolve_dependency_conflicts(self.project, self.repository)
+
+    def test_checker_falls_back_to_maven(self):
+        self._write_project(_pom("com.example:svc:1.0", dependencies=[_dependency("org.missing:x:1.0")]))
+        settings = {"dependency_resolver": "offline", "maven_local_repository": self.repository}
+        with patch.object(maven_conflict_checker, "get_config", side_effect=lambda key, default=None: settings.get(key, default)), \
+             patch.object(maven_conflict_checker, "conflict_cache", ConflictResultCache(os.path.join(self.tmp.name, "cache"))), \
+             patch("src.integration.maven.dependency_resolver.local_repository_path", return_value=self.repository), \
+             patch.object(maven_conflict_checker, "run_command_sync", side_effect=FileNotFoundError("mvn")) as run:
+            self.assertFalse(maven_conflict_checker.has_dependency_conflict(self.project))
+            run.assert_called_once()
+
+            self._write_project(_pom("com.example:svc:1.0", dependencies=[_dependency("org.lib:c:1.0")]))
+            self.assertTrue(maven_conflict_checker.has_dependency_conflict(self.project))
+            run.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
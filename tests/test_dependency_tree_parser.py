@@ -0,0 +1,61 @@
+import io
+import json
+import unittest
+from src.integration.maven.dependency_tree_parser import find_dependency_conflicts
+from src.integration.maven.maven_conflict_checker import parse_dependency_tree
+
+def _node(group_id, artifact_id, version, children=()):
+    return {
+        "groupId": group_id,
+        "artifactId": artifact_id,
+        "version": version,
+        "type": "jar",
+        "scope": "compile",
+        "classifier": "",
+        "optional": "false",
+        "children": list(children),
+    }
+
+TREE = _node("com.example", "svc", "1.0", [
+    _node("org.lib", "a", "1.0", [_node("com.fasterxml.jackson.core", "jackson-databind", "2.14.0")]),
+    _node("org.lib", "b", "2.0", [
+        _node("org.lib", "c", "3.0", [_node("com.fasterxml.jackson.core", "jackson-databind", "2.15.2")]),
+    ]),
+    _node("org.lib", "d", "1.0"),
+])
+
+class TestDependencyTreeParser(unittest.TestCase):
+
+    def test_nested_conflicts_are_reported_with_paths(self):
+        tree = find_dependency_conflicts(io.StringIO(json.dumps(TREE, indent=2)), chunk_size=7)
+        self.assertEqual(tree.nodes, 7)
+        conflicts = tree.conflicts()
+        self.assertEqual(list(conflicts), ["com.fasterxml.jackson.core:jackson-databind"])
+        versions = conflicts["com.fasterxml.jackson.core:jackson-databind"]
+        self.assertEqual(sorted(versions), ["2.14.0", "2.15.2"])
+        self.assertEqual(
+            versions["2.15.2"],
+            ["com.example:svc:1.0 > org.lib:b:2.0 > org.lib:c:3.0 > com.fasterxml.jackson.core:jackson-databind:2.15.2"],
+        )
+
+    def test_appended_module_trees(self):
+        module_a = _node("com.example", "mod-a", "1.0", [_node("org.lib", "x", "1.0")])
+        module_b = _node("com.example", "mod-b", "1.0", [_node("org.lib", "x", "2.0")])
+        content = json.dumps(module_a) + "\n" + json.dumps(module_b) + "\n"
+        self.assertEqual(sorted(find_dependency_conflicts(io.StringIO(content)).conflicts()["org.lib:x"]), ["1.0", "2.0"])
+
+    def test_truncated_tree_raises(self):
+        with self.assertRaises(ValueError):
+            find_dependency_conflicts(io.StringIO(json.dumps(TREE)[:-5]))
+
+    def test_parse_dependency_tree_console_output(self):
+        output = "[INFO] Scanning for projects...\n" + "\n".join(
+            f"[INFO] {line}" for line in json.dumps(TREE, indent=2).splitlines()
+        ) + "\n[INFO] BUILD SUCCESS\n"
+        self.assertEqual(
+            parse_dependency_tree(output),
+            {"com.fasterxml.jackson.core:jackson-databind": {"2.14.0", "2.15.2"}},
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,20 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from src.integration.git.git_client import run_git_command, stash_uncommitted_changes, checkout_main_branch, create_and_checkout_new_branch, has_changes, git_add_and_commit, git_push_changes
+from src.utils.logger_setup import logger_setup
 
 class TestGitClient(unittest.TestCase):
 
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
     @patch('src.integration.git.git_client.run_git_command')
     def test_stash_uncommitted_changes(self, mock_run_git_command):
         mock_run_git_command.side_effect = [
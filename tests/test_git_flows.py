@@ -0,0 +1,72 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.integration.git.git_flows import git_flow_finish, git_flow_start
+from src.utils.logger_setup import logger_setup
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+class TestGitFlows(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        origin = os.path.join(self.tmp.name, "origin.git")
+        seed = os.path.join(self.tmp.name, "seed")
+        self.repo = os.path.join(self.tmp.name, "svc")
+        _git(self.tmp.name, "init", "-q", "--bare", "-b", "main", origin)
+        _git(self.tmp.name, "init", "-q", "-b", "main", seed)
+        _git(seed, "config", "user.email", "test@example.com")
+        _git(seed, "config", "user.name", "test")
+        with open(os.path.join(seed, "pom.xml"), "w") as f:
+            f.write("<project><version>1</version></project>\n")
+        _git(seed, "add", "pom.xml")
+        _git(seed, "commit", "-q", "-m", "init")
+        _git(seed, "push", "-q", origin, "main")
+        _git(self.tmp.name, "clone", "-q", origin, self.repo)
+        _git(self.repo, "config", "user.email", "test@example.com")
+        _git(self.repo, "config", "user.name", "test")
+        # The flows log as svc, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    @patch('src.integration.git.git_flows.get_config', return_value=True)
+    def test_quick_flow_git_command_plan(self, mock_get_config):
+        state = git_flow_start(self.repo)
+        self.assertIsNotNone(state)
+        self.assertEqual(state.main_branch, "main")
+        self.assertEqual(state.git_commands, 2)  # status, checkout -b
+        self.assertEqual(_git(self.repo, "rev-parse", "--abbrev-ref", "HEAD"), state.branch)
+
+        with open(os.path.join(self.repo, "pom.xml"), "w") as f:
+            f.write("<project><version>2</version></project>\n")
+        self.assertTrue(git_flow_finish(self.repo))
+        self.assertEqual(state.git_commands, 5)  # + status, commit -- pom.xml, push
+        self.assertEqual(_git(self.repo, "status", "--porcelain"), "")
+        self.assertEqual(_git(self.repo, "log", "-1", "--format=%s"), "automated_library_updating")
+        self.assertIn(state.branch, _git(self.repo, "ls-remote", "--heads", "origin"))
+
+    def test_flow_start_stashes_local_changes(self):
+        with open(os.path.join(self.repo, "pom.xml"), "a") as f:
+            f.write("<!-- local -->\n")
+        state = git_flow_start(self.repo)
+        self.assertEqual(state.git_commands, 3)  # status, stash, checkout -b
+        self.assertEqual(len(_git(self.repo, "stash", "list").splitlines()), 1)
+
+    def test_flow_start_does_not_reset_an_existing_branch(self):
+        _git(self.repo, "checkout", "-q", "-b", "update_taken")
+        _git(self.repo, "commit", "-q", "--allow-empty", "-m", "work on the branch")
+        head = _git(self.repo, "rev-parse", "update_taken")
+        _git(self.repo, "checkout", "-q", "main")
+        with patch("src.integration.git.git_flows.new_update_branch_name", return_value="update_taken"):
+            self.assertIsNone(git_flow_start(self.repo))
+        self.assertEqual(_git(self.repo, "rev-parse", "update_taken"), head)
+        self.assertEqual(_git(self.repo, "rev-parse", "--abbrev-ref", "HEAD"), "main")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from src.integration.git import git_refs
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+class TestGitRefs(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        origin = os.path.join(self.tmp.name, "origin.git")
+        self.repo = os.path.join(self.tmp.name, "svc")
+        _git(self.tmp.name, "init", "-q", "--bare", "-b", "master", origin)
+        _git(self.tmp.name, "init", "-q", "-b", "master", self.repo)
+        _git(self.repo, "config", "user.email", "test@example.com")
+        _git(self.repo, "config", "user.name", "test")
+        _git(self.repo, "commit", "-q", "--allow-empty", "-m", "init")
+        _git(self.repo, "remote", "add", "origin", origin)
+        _git(self.repo, "push", "-q", "origin", "master")
+        _git(self.repo, "fetch", "-q", "origin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_current_branch_matches_git(self):
+        _git(self.repo, "checkout", "-q", "-b", "feature/x")
+        self.assertEqual(git_refs.current_branch(self.repo), "feature/x")
+        _git(self.repo, "checkout", "-q", "--detach")
+        self.assertEqual(git_refs.current_branch(self.repo), _git(self.repo, "rev-parse", "--abbrev-ref", "HEAD"))
+
+    def test_remote_refs_loose_and_packed(self):
+        self.assertEqual(git_refs.default_branch(self.repo), ("master", True))
+        _git(self.repo, "pack-refs", "--all", "--prune")
+        self.assertFalse(os.path.exists(os.path.join(self.repo, ".git", "refs", "remotes", "origin", "master")))
+        self.assertTrue(git_refs.remote_ref_exists(self.repo, "master"))
+        self.assertFalse(git_refs.remote_ref_exists(self.repo, "main"))
+        self.assertEqual(git_refs.default_branch(self.repo), ("master", True))
+
+    def test_master_wins_over_the_remote_head(self):
+        _git(self.repo, "push", "-q", "origin", "master:main")
+        _git(self.repo, "fetch", "-q", "origin")
+        _git(self.repo, "remote", "set-head", "origin", "main")
+        self.assertEqual(git_refs.default_branch(self.repo), ("master", True))
+        _git(os.path.join(self.tmp.name, "origin.git"), "symbolic-ref", "HEAD", "refs/heads/main")
+        _git(self.repo, "push", "-q", "origin", "--delete", "master")
+        _git(self.repo, "fetch", "-q", "--prune", "origin")
+        self.assertEqual(git_refs.default_branch(self.repo), ("main", True))
+
+    def test_worktree_layout(self):
+        worktree = os.path.join(self.tmp.name, "wt")
+        _git(self.repo, "worktree", "add", "-q", "-b", "wt-branch", worktree)
+        self.assertEqual(git_refs.current_branch(worktree), "wt-branch")
+        self.assertTrue(git_refs.remote_ref_exists(worktree, "master"))
+
+    def test_missing_repository(self):
+        with self.assertRaises(git_refs.GitRefsUnavailable):
+            git_refs.current_branch(self.tmp.name)
+
+if __name__ == '__main__':
+    unittest.main()
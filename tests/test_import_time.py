@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Self time in ms the repo's own modules may add on top of Textual and the standard library.
+# They take a few ms today, the budget leaves room for slow CI machines.
+SRC_IMPORT_BUDGET_MS = 60
+
+
+def import_times(statement):
+    """
+    Runs statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple: ({module: (self_us, cumulative_us)}, stdout of the statement)
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    if process.returncode:
+        raise AssertionError(process.stderr)
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules, process.stdout
+
+
+def src_self_ms(modules):
+    return sum(self_us for name, (self_us, _) in modules.items() if name.split(".")[0] == "src") / 1000
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_main_app_defers_screens_integrations_and_logging(self):
+        modules, stdout = import_times(
+            "import src.ui.main_app\n"
+            "from src.utils.logger_setup import logger_setup\n"
+            "print(logger_setup.started)"
+        )
+        self.assertIn("src.ui.main_app", modules)
+        self.assertEqual(stdout.strip(), "False")
+        for name in modules:
+            self.assertFalse(name.startswith(("src.ui.overview_screen", "src.ui.settings_screen", "src.integration")), name)
+        self.assertLess(src_self_ms(modules), SRC_IMPORT_BUDGET_MS)
+
+    def test_overview_screen_defers_maven_and_update_flows(self):
+        modules, _ = import_times("import src.ui.overview_screen")
+        for name in ("src.integration.maven.maven_client", "src.processor.process",
+                     "src.integration.service_metrics", "src.ui.log_screen", "psutil"):
+            self.assertNotIn(name, modules)
+        self.assertLess(src_self_ms(modules), SRC_IMPORT_BUDGET_MS)
+
+    def test_cli_imports_without_textual(self):
+        modules, _ = import_times("import src.cli")
+        self.assertNotIn("textual", modules)
+        self.assertLess(src_self_ms(modules), SRC_IMPORT_BUDGET_MS)
+
+if __name__ == '__main__':
+    unittest.main()
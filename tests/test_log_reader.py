@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from src.utils.log_reader import LogRingBuffer, read_lines_before, read_tail
+
+class TestLogReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "svc.log")
+        self.lines = [f"line {i} " + "x" * (i % 37) for i in range(500)]
+        with open(self.path, "w") as f:
+            f.write("\n".join(self.lines) + "\npartial")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_read_tail_skips_incomplete_last_line(self):
+        for block_size in (5, 64, 1 << 20):
+            lines, offset = read_tail(self.path, 10, block_size)
+            self.assertEqual([text for _, text in lines], self.lines[-10:])
+            self.assertEqual(offset, os.path.getsize(self.path) - len("partial"))
+
+    def test_read_lines_before_pages_backwards(self):
+        with open(self.path, "rb") as f:
+            content = f.read()
+        tail, _ = read_tail(self.path, 10)
+        for block_size in (5, 64, 1 << 20):
+            older = read_lines_before(self.path, tail[0][0], 20, block_size)
+            self.assertEqual([text for _, text in older], self.lines[-30:-10])
+            for offset, text in older:
+                self.assertEqual(content[offset:offset + len(text)].decode(), text)
+            self.assertEqual(read_lines_before(self.path, tail[0][0], 10_000, block_size)[0], (0, "line 0 "))
+        self.assertEqual(read_lines_before(self.path, 0, 10), [])
+
+    def test_ring_buffer_is_bounded(self):
+        buffer = LogRingBuffer(3)
+        buffer.reset([(0, "a"), (2, "b")])
+        self.assertEqual(buffer.append([(4, "c"), (6, "d")]), 1)
+        self.assertEqual([buffer[i] for i in range(len(buffer))], ["b", "c", "d"])
+        self.assertEqual(buffer.start_offset, 2)
+
+        # Paging in older lines drops the newest and detaches the buffer from the tail
+        self.assertEqual(buffer.prepend([(0, "a")]), 1)
+        self.assertEqual([buffer[i] for i in range(len(buffer))], ["a", "b", "c"])
+        self.assertFalse(buffer.at_tail)
+        self.assertEqual(buffer.append([(8, "e")]), 0)
+        self.assertEqual(len(buffer), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.core import log_search
+from src.core.log_search import LogSearchIndex, log_files
+
+class TestLogSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_dir = os.path.join(self.tmp.name, "logs")
+        os.makedirs(self.log_dir)
+        self.index = LogSearchIndex(os.path.join(self.tmp.name, "log_index.json"))
+        self.write("alpha.log.1", ["old Command failed: mvn install"], level="ERROR")
+        self.write("alpha.log", [f"step {i}" for i in range(300)])
+        self.write("alpha.log", ["Command failed: git pull"], level="ERROR")
+        with open(os.path.join(self.log_dir, "alpha.log"), "a") as f:
+            f.write("Traceback (most recent call last):\n  Command failed inside\n")
+        self.write("alpha.log", ["Command failed later"], level="DEBUG")
+        self.write("beta.log", ["Command failed: mvn test"], level="WARNING")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, messages, level="INFO"):
+        with open(os.path.join(self.log_dir, name), "a") as f:
+            for message in messages:
+                f.write(f"2024-05-01 10:00:00,000 [{level}] {message}\n")
+
+    def search(self, query, **kwargs):
+        return self.index.search(query, log_files(self.log_dir), **kwargs)
+
+    def test_log_files_lists_rotated_files_oldest_first(self):
+        names = [os.path.basename(path) for path in log_files(self.log_dir)]
+        self.assertEqual(names, ["alpha.log.1", "alpha.log", "beta.log"])
+        self.assertEqual(len(log_files(self.log_dir, "beta")), 1)
+
+    def test_search_returns_lines_in_order_with_numbers(self):
+        matches = self.search("Command failed")
+        self.assertEqual([(os.path.basename(m.path), m.line_number, m.level) for m in matches], [
+            ("alpha.log.1", 1, "ERROR"), ("alpha.log", 301, "ERROR"), ("alpha.log", 303, "ERROR"),
+            ("alpha.log", 304, "DEBUG"), ("beta.log", 1, "WARNING"),
+        ])
+        with open(matches[1].path, "rb") as f:
+            f.seek(matches[1].offset)
+            self.assertEqual(f.readline().decode().rstrip("\n"), matches[1].text)
+
+    def test_level_filter_includes_continuation_lines(self):
+        matches = self.search("command FAILED", level="ERROR", ignore_case=True)
+        self.assertEqual([m.text.split("] ")[-1].strip() for m in matches],
+                         ["old Command failed: mvn install", "Command failed: git pull", "Command failed inside"])
+        self.assertEqual(len(self.search("Command", level="warning")), 4)
+        with self.assertRaises(ValueError):
+            self.search("x", level="LOUD")
+
+    def test_index_is_extended_and_rebuilt_after_rotation(self):
+        with patch.object(log_search, "INDEX_BLOCK_SIZE", 256):
+            self.assertGreater(self.index.refresh(log_files(self.log_dir)), 0)
+            self.assertEqual(self.index.refresh(log_files(self.log_dir)), 0)
+            entry = self.index.files[os.path.abspath(os.path.join(self.log_dir, "alpha.log"))]
+            self.assertGreater(len(entry["blocks"]), 10)
+            self.write("alpha.log", ["Command failed again"], level="ERROR")
+            self.assertEqual(len(self.search("failed", level="ERROR", regex=True)), 4)
+            self.assertEqual(self.search(r"^\S+ \S+ \[ERROR\] Command failed again$", regex=True)[0].line_number, 305)
+
+        # Rotation: the old file is renamed away and a new one created
+        alpha = os.path.join(self.log_dir, "alpha.log")
+        os.replace(alpha, alpha + ".1")
+        self.write("alpha.log", ["fresh start"])
+        self.assertEqual([m.line_number for m in self.search("fresh start")], [1])
+        self.assertEqual(len(self.search("Command failed", max_results=2)), 2)
+
+        # The persisted index is picked up by a new instance
+        reloaded = LogSearchIndex(self.index.index_path)
+        self.assertEqual(reloaded.refresh(log_files(self.log_dir)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from src.utils.log_tail import LogTailService
+
+class TestLogTail(unittest.TestCase):
+
+    use_inotify = False
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "svc.log")
+        self.write("old 1\nold 2\n", "w")
+        self.service = LogTailService(poll_interval=0.01, use_inotify=self.use_inotify)
+
+    def tearDown(self):
+        self.service.stop()
+        self.tmp.cleanup()
+
+    def write(self, text, mode="a"):
+        with open(self.path, mode) as f:
+            f.write(text)
+
+    def collect(self, subscription, count, timeout=3):
+        lines = []
+        deadline = time.monotonic() + timeout
+        while len(lines) < count and time.monotonic() < deadline:
+            subscription.wait(0.05)
+            lines.extend(subscription.drain())
+        return lines
+
+    def test_appended_lines_reach_every_subscriber(self):
+        first = self.service.subscribe(self.path)
+        second = self.service.subscribe(self.path)
+        self.write("new 1\nnew 2\npart")
+        for subscription in (first, second):
+            self.assertEqual([text for _, text, _ in self.collect(subscription, 2)], ["new 1", "new 2"])
+        self.write("ial\n")
+        self.assertEqual(self.collect(first, 1), [(24, "partial", 0)])
+
+    def test_subscribe_with_offset_catches_up(self):
+        follower = self.service.subscribe(self.path)
+        self.write("new 1\n")
+        self.collect(follower, 1)
+        late = self.service.subscribe(self.path, start_offset=6)
+        self.assertEqual([text for _, text, _ in self.collect(late, 2)], ["old 2", "new 1"])
+
+    def test_rotation_by_rename_continues_with_new_file(self):
+        subscription = self.service.subscribe(self.path)
+        self.write("last before rotation\n")
+        os.rename(self.path, self.path + ".1")
+        self.write("first after rotation\n", "w")
+        lines = self.collect(subscription, 2)
+        self.assertEqual(lines, [(12, "last before rotation", 0), (0, "first after rotation", 1)])
+
+    def test_truncation_restarts_from_the_start(self):
+        subscription = self.service.subscribe(self.path)
+        self.write("", "w")
+        self.service.check()
+        self.write("fresh\n")
+        self.assertEqual(self.collect(subscription, 1), [(0, "fresh", 1)])
+
+    def test_slow_subscriber_loses_oldest_lines_only(self):
+        slow = self.service.subscribe(self.path, max_pending=2)
+        fast = self.service.subscribe(self.path)
+        self.write("".join(f"line {i}\n" for i in range(5)))
+        self.assertEqual(len(self.collect(fast, 5)), 5)
+        self.assertEqual([text for _, text, _ in slow.drain()], ["line 3", "line 4"])
+        self.assertEqual(slow.dropped, 3)
+
+    def test_unsubscribe_closes_the_file(self):
+        subscription = self.service.subscribe(self.path)
+        subscription.close()
+        self.assertEqual(self.service.files, {})
+
+class TestLogTailInotify(TestLogTail):
+
+    use_inotify = True
+
+    def test_failed_watch_update_closes_inotify_on_the_tail_thread(self):
+        self.service.subscribe(self.path)
+        inotify = self.service.inotify
+        closed_by = []
+        close = inotify.close
+        inotify.close = lambda: (closed_by.append(threading.current_thread().name), close())
+        inotify.sync_watches = Mock(side_effect=OSError(28, "inotify watch limit reached"))
+
+        other = os.path.join(self.tmp.name, "other", "svc.log")
+        os.makedirs(os.path.dirname(other))
+        subscription = self.service.subscribe(other)
+        self.assertIsNone(self.service.inotify)
+        deadline = time.monotonic() + 3
+        while not closed_by and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(closed_by, ["log-tail"])
+
+        # Polling takes over
+        with open(other, "a") as f:
+            f.write("polled\n")
+        self.assertEqual([text for _, text, _ in self.collect(subscription, 1)], ["polled"])
+
+    def test_stop_when_the_idle_thread_already_closed_inotify(self):
+        subscription = self.service.subscribe(self.path)
+        inotify = self.service.inotify
+        subscription.close()
+        for _ in range(20):
+            self.service.stop()
+            self.service.subscribe(self.path).close()
+        self.service.stop()
+        self.assertTrue(inotify.closed)
+        inotify.interrupt()
+        inotify.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from src.utils.logger_setup import LoggerSetup
+
+class TestLoggerSetup(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.setup = LoggerSetup(log_dir=self.tmp.name, max_open_files=3)
+
+    def tearDown(self):
+        self.setup.stop()
+        self.tmp.cleanup()
+
+    def read(self, name):
+        with open(os.path.join(self.tmp.name, name), encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_project_lines_go_to_their_own_file(self):
+        self.setup.log_with_project("hello", "/work/alpha")
+        self.setup.log_with_project("global", None, level="warning")
+        self.setup.stop()
+        self.assertTrue(self.read("alpha.log")[0].endswith("[INFO] alpha | hello"))
+        self.assertTrue(self.read("app.log")[0].endswith("[WARNING] APP | global"))
+
+    def test_nothing_is_set_up_before_the_first_record(self):
+        log_dir = os.path.join(self.tmp.name, "later")
+        setup = LoggerSetup(log_dir=log_dir)
+        self.assertFalse(os.path.exists(log_dir))
+        self.assertIsNone(setup.listener)
+        setup.logger.warning("first")
+        setup.stop()
+        self.assertTrue(setup.started)
+        with open(os.path.join(log_dir, "app.log"), encoding="utf-8") as f:
+            self.assertTrue(f.read().rstrip().endswith("[WARNING] first"))
+
+    def test_use_log_dir_switches_after_start(self):
+        self.setup.log_with_project("before", "/work/alpha")
+        other = os.path.join(self.tmp.name, "other")
+        previous = self.setup.use_log_dir(other)
+        self.assertEqual(previous, self.tmp.name)
+        self.setup.log_with_project("after", "/work/alpha")
+        self.setup.stop()
+        self.assertEqual([line.rsplit("| ", 1)[1] for line in self.read("alpha.log")], ["before"])
+        with open(os.path.join(other, "alpha.log"), encoding="utf-8") as f:
+            self.assertTrue(f.read().rstrip().endswith("| after"))
+
+    def test_delete_log_files_keeps_the_files_of_this_run(self):
+        for name in ("old.log", "alpha.log", "service_metrics-1.json"):
+            with open(os.path.join(self.tmp.name, name), "w", encoding="utf-8") as f:
+                f.write("earlier run\n")
+        self.setup.log_with_project("opened before the cleanup", "/work/alpha")
+        self.setup.delete_log_files(lambda name: name.startswith("service_metrics-"))
+        self.setup.log_with_project("after the cleanup", "/work/alpha")
+        self.setup.stop()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["alpha.log", "app.log", "service_metrics-1.json"])
+        self.assertEqual(len(self.read("alpha.log")), 3)
+        self.assertTrue(self.read("app.log")[0].endswith("[INFO] old.log is deleted"))
+
+    def test_open_project_files_are_capped(self):
+        for round_no in range(3):
+            for i in range(10):
+                self.setup.log_with_project(f"line {round_no}", f"/work/project{i}")
+        self.setup.listener.stop()
+        router = self.setup.router
+        self.assertLessEqual(len(router.project_handlers), 3)
+        self.assertEqual(sum(h.stream is not None for h in router.project_handlers.values()), 3)
+        self.setup.listener.start()
+        self.setup.stop()
+        for i in range(10):
+            self.assertEqual([line.rsplit("| ", 1)[1] for line in self.read(f"project{i}.log")],
+                             ["line 0", "line 1", "line 2"])
+
+if __name__ == '__main__':
+    unittest.main()
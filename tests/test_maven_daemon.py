@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from src.integration.command_runner import CommandResult
+from src.integration.maven.maven_client import maven_command_args
+from src.integration.maven.maven_daemon import MavenDaemonManager
+from src.utils.logger_setup import logger_setup
+
+SETTINGS = {"maven_mode": "mvnd", "mvnd_executable": "mvnd", "mvnd_max_builds": 2, "mvnd_max_rss_mb": 0}
+
+def fake_get_config(key, default=None):
+    return SETTINGS.get(key, default)
+
+class TestMavenDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    @patch('src.integration.maven.maven_daemon.get_config', side_effect=fake_get_config)
+    def test_maven_command_args_uses_daemon(self, mock_get_config):
+        self.assertEqual(
+            maven_command_args("mvn clean test"),
+            ["mvnd", "-Dmvnd.rawStreams=true", "clean", "test"],
+        )
+
+    @patch('src.integration.maven.maven_daemon.run_command_sync', return_value=CommandResult(0, "", ""))
+    @patch('src.integration.maven.maven_daemon.get_config', side_effect=fake_get_config)
+    def test_daemons_recycled_after_max_builds_when_idle(self, mock_get_config, mock_run):
+        manager = MavenDaemonManager()
+        with manager.build():
+            with manager.build():
+                pass
+            # Limit reached while another build is still running, recycling waits
+            mock_run.assert_not_called()
+        mock_run.assert_called_once_with(["mvnd", "--stop"], cwd=None)
+        self.assertEqual(manager.builds, 0)
+
+    @patch('src.integration.maven.maven_daemon.get_config', side_effect=fake_get_config)
+    def test_builds_wait_while_daemons_are_recycled(self, mock_get_config):
+        manager = MavenDaemonManager()
+        stopping, release, events = threading.Event(), threading.Event(), []
+
+        def slow_stop(args, cwd=None):
+            stopping.set()
+            release.wait(5)
+            events.append("stopped")
+            return CommandResult(0, "", "")
+
+        def second_build():
+            stopping.wait(5)
+            with manager.build():
+                events.append("build")
+
+        def recycling_build():
+            with manager.build():
+                pass
+
+        with patch('src.integration.maven.maven_daemon.run_command_sync', side_effect=slow_stop):
+            manager.builds = 1  # The next finished build reaches mvnd_max_builds
+            threads = [threading.Thread(target=recycling_build), threading.Thread(target=second_build)]
+            for thread in threads:
+                thread.start()
+            self.assertTrue(stopping.wait(5))
+            time.sleep(0.1)
+            self.assertEqual(events, [])  # 'mvnd --stop' is running, the second build has to wait
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        self.assertEqual(events, ["stopped", "build"])
+
+    @patch('src.integration.maven.maven_daemon.run_command_sync', return_value=CommandResult(0, "", ""))
+    @patch('src.integration.maven.maven_daemon.get_config', side_effect=fake_get_config)
+    def test_pending_recycle_holds_new_builds_until_running_ones_drained(self, mock_get_config, mock_run):
+        manager = MavenDaemonManager()
+        events = []
+        started = threading.Event()
+        manager.builds = 1  # The next finished build reaches mvnd_max_builds
+
+        def late_build():
+            started.set()
+            with manager.build():
+                events.append(("build", mock_run.call_count))
+
+        with manager.build():
+            with manager.build():
+                pass
+            # mvnd_max_builds reached, a build arriving now waits for the recycle
+            thread = threading.Thread(target=late_build)
+            thread.start()
+            started.wait(5)
+            time.sleep(0.1)
+            self.assertEqual(events, [])
+        thread.join(5)
+        self.assertEqual(events, [("build", 1)])
+
+    @patch('src.integration.maven.maven_daemon.run_command_sync', return_value=CommandResult(0, "", ""))
+    def test_daemon_rss_is_checked_at_most_every_interval(self, mock_run):
+        settings = dict(SETTINGS, mvnd_max_builds=0, mvnd_max_rss_mb=100)
+        manager = MavenDaemonManager()
+        with patch('src.integration.maven.maven_daemon.get_config', side_effect=lambda key, default=None: settings.get(key, default)), \
+                patch.object(manager, "daemon_rss_mb", return_value=50) as rss:
+            for _ in range(5):
+                with manager.build():
+                    pass
+        rss.assert_called_once()
+        mock_run.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
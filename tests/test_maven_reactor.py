@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.integration.command_recorder import command_recorder
+from src.integration.command_runner import CommandResult
+from src.integration.maven.maven_reactor import DEPENDENCY_TREE_FILE, run_reactor, split_reactor_output, write_aggregator_pom
+from src.utils.logger_setup import logger_setup
+
+REACTOR_OUTPUT = """[INFO] Reactor Build Order:
+[INFO] --- versions:2.16.2:update-properties (default-cli) @ svc-a ---
+[INFO] Updated ${spring.version} from 3.1.0 to 3.2.1
+[INFO] --- versions:2.16.2:update-properties (default-cli) @ svc-b ---
+[ERROR] Could not resolve dependencies
+[INFO] ------------------------------------------------------------------------
+[INFO] Reactor Summary for reporanger-aggregator 1:
+[INFO]
+[INFO] Service A .......................................... SUCCESS [  1.234 s]
+[INFO] svc-b .............................................. FAILURE [  0.512 s]
+[INFO] reporanger-aggregator 1 ............................ SUCCESS [  0.001 s]
+"""
+
+# -T 2 with showThreadName: the two modules' lines interleave
+PARALLEL_OUTPUT = """[main] [INFO] Reactor Build Order:
+[BuilderThread 1] [INFO] --- versions:2.16.2:update-properties (default-cli) @ svc-a ---
+[BuilderThread 2] [INFO] --- versions:2.16.2:update-properties (default-cli) @ svc-b ---
+[BuilderThread 1] [INFO] Updated ${spring.version} from 3.1.0 to 3.2.1
+[BuilderThread 2] [ERROR] Could not resolve dependencies
+[svc-a] [INFO] Maven 4 style line of svc-a
+[main] [INFO] Reactor Summary for reporanger-aggregator 1:
+[main] [INFO] Service A .......................................... SUCCESS [  1.234 s]
+[main] [INFO] svc-b .............................................. FAILURE [  0.512 s]
+"""
+
+class TestMavenReactor(unittest.TestCase):
+
+    def test_write_aggregator_pom_lists_relative_modules(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            aggregator_dir = os.path.join(tmp, "agg")
+            os.makedirs(aggregator_dir)
+            pom_path = write_aggregator_pom([os.path.join(tmp, "ws", "svc-a")], aggregator_dir)
+            with open(pom_path) as f:
+                self.assertIn("<module>../ws/svc-a</module>", f.read())
+
+    def test_split_reactor_output(self):
+        names = {
+            "/ws/svc-a": {"artifactId": "svc-a", "name": "Service A"},
+            "/ws/svc-b": {"artifactId": "svc-b", "name": "svc-b"},
+            "/ws/svc-c": {"artifactId": "svc-c", "name": "svc-c"},
+        }
+        results = split_reactor_output(REACTOR_OUTPUT, names)
+        self.assertTrue(results["/ws/svc-a"].success)
+        self.assertIn("3.2.1", results["/ws/svc-a"].output)
+        self.assertEqual(results["/ws/svc-b"].status, "FAILURE")
+        self.assertIn("Could not resolve", results["/ws/svc-b"].output)
+        self.assertEqual(results["/ws/svc-c"].status, "UNKNOWN")
+
+    def test_split_parallel_reactor_output_by_thread(self):
+        names = {
+            "/ws/svc-a": {"artifactId": "svc-a", "name": "Service A"},
+            "/ws/svc-b": {"artifactId": "svc-b", "name": "svc-b"},
+        }
+        results = split_reactor_output(PARALLEL_OUTPUT, names)
+        self.assertEqual([results[path].status for path in names], ["SUCCESS", "FAILURE"])
+        self.assertIn("3.2.1", results["/ws/svc-a"].output)
+        self.assertIn("Maven 4 style", results["/ws/svc-a"].output)
+        self.assertNotIn("Could not resolve", results["/ws/svc-a"].output)
+        self.assertIn("Could not resolve", results["/ws/svc-b"].output)
+        self.assertNotIn("3.2.1", results["/ws/svc-b"].output)
+
+    def test_reactor_build_replays_from_a_trace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for artifact_id, name in (("svc-a", "Service A"), ("svc-b", "svc-b")):
+                paths.append(os.path.join(tmp, artifact_id))
+                os.makedirs(paths[-1])
+                with open(os.path.join(paths[-1], "pom.xml"), "w") as f:
+                    f.write(f"<project><groupId>g</groupId><artifactId>{artifact_id}</artifactId><version>1</version><name>{name}</name></project>")
+            tree_files = [os.path.join(path, DEPENDENCY_TREE_FILE) for path in paths]
+
+            def maven(args, cwd=None):
+                for tree_file in tree_files:
+                    os.makedirs(os.path.dirname(tree_file), exist_ok=True)
+                    with open(tree_file, "w") as f:
+                        f.write("{}")
+                return CommandResult(0, REACTOR_OUTPUT, "", 0.01)
+
+            trace = os.path.join(tmp, "trace.jsonl.gz")
+            previous_log_dir = logger_setup.use_log_dir(os.path.join(tmp, "logs"))
+            try:
+                command_recorder.record(trace)
+                with patch("src.integration.maven.maven_reactor.run_command_sync", side_effect=maven):
+                    recorded = run_reactor(paths, "dependency:tree", threads=1, output_files=tree_files)
+                command_recorder.stop()
+                for path in paths:
+                    shutil.rmtree(os.path.join(path, "target"))
+
+                # The replay runs in another temporary aggregator folder and does not start Maven
+                command_recorder.replay(trace, timing="none")
+                with patch("src.integration.maven.maven_reactor.run_command_sync", side_effect=AssertionError) as run:
+                    replayed = run_reactor(paths, "dependency:tree", threads=1, output_files=tree_files)
+                run.assert_not_called()
+            finally:
+                command_recorder.stop()
+                logger_setup.use_log_dir(previous_log_dir)
+            self.assertEqual(replayed, recorded)
+            self.assertEqual([replayed[path].status for path in paths], ["SUCCESS", "FAILURE"])
+            self.assertTrue(all(os.path.exists(tree_file) for tree_file in tree_files))
+
+    def test_split_reactor_output_without_summary(self):
+        self.assertIsNone(split_reactor_output("[ERROR] Project 'x:y' is duplicated in the reactor", {}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,21 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
+from src.integration.git.git_flows import GitFlowState, _active_flows, get_flow_state
 from src.processor.process import quick_update_flow
+from src.utils.logger_setup import logger_setup
 
 class TestProcessFlows(unittest.TestCase):
 
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
     @patch('src.processor.process.git_flow_start')
     @patch('src.processor.process.git_flow_finish')
     @patch('src.processor.process.mvn_quick_update_flow')
@@ -27,5 +39,23 @@ class TestProcessFlows(unittest.TestCase):
         self.assertEqual(mock_mvn_quick_update_flow.call_count, 2)
         self.assertEqual(mock_git_flow_finish.call_count, 1)
 
+        # A failed Maven update fails the flow before the dependency check
+        mock_mvn_quick_update_flow.return_value = False
+        self.assertFalse(quick_update_flow(project_path))
+        self.assertEqual(mock_has_dependency_conflict.call_count, 2)
+        mock_mvn_quick_update_flow.return_value = True
+
+        # A flow that stops after git_flow_start leaves no state behind
+        mock_git_flow_start.side_effect = lambda path: _active_flows.setdefault(path, GitFlowState(path))
+        mock_has_dependency_conflict.return_value = False
+        self.assertFalse(quick_update_flow(project_path))
+        self.assertIsNone(get_flow_state(project_path))
+        mock_git_flow_start.side_effect = None
+
+        # A failed commit or push fails the flow
+        mock_has_dependency_conflict.return_value = True
+        mock_git_flow_finish.return_value = False
+        self.assertFalse(quick_update_flow(project_path))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.core.project_index import ProjectIndex
+from src.core.project_scanner import scan_subtree
+from src.utils.logger_setup import logger_setup
+
+def _write_pom(path, content="<project/>"):
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "pom.xml"), "w") as f:
+        f.write(content)
+
+def _set_mtime(path, seconds_ago):
+    # Freshly written folders are "racy" for the index, so tests move mtimes into the past
+    mtime_ns = time.time_ns() - seconds_ago * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def _age_tree(path):
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            _set_mtime(os.path.join(root, name), 10)
+        _set_mtime(root, 10)
+
+class TestProjectIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.base = os.path.join(self.tmp.name, "ws")
+        self.index_path = os.path.join(self.tmp.name, "cache", "project_index.json")
+        self.options = {
+            "base_path": self.base,
+            "prefix": "",
+            "exclude": [".*", "target"],
+            "max_depth": 0,
+            "stop_at_project_root": True,
+        }
+        _write_pom(os.path.join(self.base, "svc-a"))
+        _write_pom(os.path.join(self.base, "group", "svc-b"))
+        _age_tree(self.base)
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_refresh_builds_and_persists_index(self):
+        index = ProjectIndex(self.index_path)
+        self.assertTrue(index.refresh(self.options))
+        self.assertEqual(sorted(index.load(self.options)), ["svc-a", "svc-b"])
+
+        reloaded = ProjectIndex(self.index_path)
+        projects = reloaded.load(self.options)
+        self.assertEqual(projects["svc-b"], os.path.join(self.base, "group", "svc-b"))
+        self.assertIsNotNone(reloaded.projects["svc-a"]["pom_hash"])
+        self.assertEqual(reloaded.load(dict(self.options, prefix="x")), {})
+
+    def test_refresh_rescans_only_changed_subtrees(self):
+        index = ProjectIndex(self.index_path)
+        index.refresh(self.options)
+        self.assertFalse(index.refresh(self.options))
+
+        group = os.path.join(self.base, "group")
+        _write_pom(os.path.join(group, "svc-c"))
+        _set_mtime(group, 5)
+        with patch("src.core.project_index.scan_subtree", wraps=scan_subtree) as scan:
+            self.assertTrue(index.refresh(self.options))
+        self.assertEqual(scan.call_count, 1)
+        self.assertEqual(scan.call_args.args[0], group)
+        self.assertEqual(sorted(index.load(self.options)), ["svc-a", "svc-b", "svc-c"])
+
+    def test_refresh_rescans_nested_changes_once(self):
+        group = os.path.join(self.base, "group")
+        _write_pom(os.path.join(group, "nested", "svc-d"))
+        _write_pom(os.path.join(self.base, "group-c", "svc-e"))
+        _age_tree(self.base)
+        index = ProjectIndex(self.index_path)
+        index.refresh(self.options)
+
+        # "group-c" sorts between "group" and "group/nested"
+        for path in (group, os.path.join(self.base, "group-c"), os.path.join(group, "nested")):
+            _set_mtime(path, 5)
+        with patch("src.core.project_index.scan_subtree", wraps=scan_subtree) as scan:
+            self.assertFalse(index.refresh(self.options))
+        self.assertEqual(sorted(call.args[0] for call in scan.call_args_list), [group, os.path.join(self.base, "group-c")])
+        self.assertEqual(sorted(index.load(self.options)), ["svc-a", "svc-b", "svc-d", "svc-e"])
+
+    def test_refresh_detects_pom_changes(self):
+        index = ProjectIndex(self.index_path)
+        index.refresh(self.options)
+        old_hash = index.projects["svc-a"]["pom_hash"]
+
+        pom_path = os.path.join(self.base, "svc-a", "pom.xml")
+        _write_pom(os.path.join(self.base, "svc-a"), "<project><version>2</version></project>")
+        _set_mtime(pom_path, 5)
+        self.assertTrue(index.refresh(self.options))
+        self.assertNotEqual(index.projects["svc-a"]["pom_hash"], old_hash)
+
+if __name__ == '__main__':
+    unittest.main()
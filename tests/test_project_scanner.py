@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from src.core.project_scanner import scan_projects
+
+class TestProjectScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+        for rel in [
+            "svc-a",
+            "svc-a/module-1",
+            "svc-a/target/classes",
+            "group/svc-b",
+            "node_modules/svc-c",
+            ".git/svc-d",
+            "deep/one/two/svc-e",
+        ]:
+            os.makedirs(os.path.join(self.base, rel))
+            open(os.path.join(self.base, rel, "pom.xml"), "w").close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_scan_projects_skips_excluded_and_stops_at_root(self):
+        projects = scan_projects(self.base)
+        self.assertEqual(sorted(projects), ["svc-a", "svc-b", "svc-e"])
+        self.assertEqual(projects["svc-b"], os.path.join(self.base, "group", "svc-b"))
+
+    def test_scan_projects_descends_into_modules_when_requested(self):
+        projects = scan_projects(self.base, stop_at_project_root=False)
+        self.assertIn("module-1", projects)
+        self.assertNotIn("classes", projects)
+
+    def test_scan_projects_max_depth_and_prefix(self):
+        self.assertEqual(sorted(scan_projects(self.base, max_depth=2)), ["svc-a", "svc-b"])
+        self.assertEqual(sorted(scan_projects(self.base, prefix="svc-b")), ["svc-b"])
+
+    def test_scan_projects_custom_exclude(self):
+        projects = scan_projects(self.base, exclude=["group", "deep/*"])
+        self.assertEqual(sorted(projects), ["svc-a", "svc-c", "svc-d"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from src.integration.service_metrics import ServiceMetricsSampler, sparkline
+from src.integration.service_supervisor import ServiceSupervisor
+from src.utils.logger_setup import logger_setup
+
+class TestServiceMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.supervisor = ServiceSupervisor()
+        self.sampler = ServiceMetricsSampler(self.supervisor, interval=60, history_samples=3)
+
+    def tearDown(self):
+        self.supervisor.stop_all(timeout=2)
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_sparkline_scales_between_min_and_max(self):
+        self.assertEqual(sparkline([0, 7, 14]), "▁▅█")
+        self.assertEqual(sparkline([5, 5]), "▅▅")
+        self.assertEqual(sparkline(range(100), width=4), "▁▃▆█")
+        self.assertEqual(sparkline([]), "")
+
+    @unittest.skipUnless(ServiceMetricsSampler().available, "psutil is not installed")
+    def test_samples_cover_the_process_tree_and_export(self):
+        code = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            "print('started', flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        service = self.supervisor.start("app", self.tmp.name, [sys.executable, "-c", code])
+        deadline = time.monotonic() + 10
+        while service.output_seq < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        for _ in range(4):
+            samples = self.sampler.sample()
+        self.assertEqual(len(samples), 1)
+        self.assertEqual((samples[0].service, samples[0].processes), ("app", 2))
+        self.assertGreater(samples[0].rss_bytes, 0)
+        self.assertGreaterEqual(samples[0].threads, 2)
+        self.assertEqual(len(self.sampler.samples("app")), 3)
+        self.assertIn("Processes 2", self.sampler.summary("app"))
+
+        csv_path = os.path.join(self.tmp.name, "out", "metrics.csv")
+        self.assertEqual(self.sampler.export(csv_path), 3)
+        with open(csv_path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["service"] for row in rows], ["app"] * 3)
+        json_path = os.path.join(self.tmp.name, "metrics.json")
+        self.sampler.export(json_path)
+        with open(json_path) as f:
+            self.assertEqual(json.load(f)[0]["processes"], 2)
+
+        self.supervisor.stop("app", timeout=2)
+        self.assertEqual(self.sampler.sample(), [])
+
+if __name__ == '__main__':
+    unittest.main()
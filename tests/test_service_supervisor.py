@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.integration.service_supervisor import ServiceSupervisor
+from src.utils.logger_setup import logger_setup
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+class TestServiceSupervisor(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # Services log under the temp folder's name, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.supervisor = ServiceSupervisor(restart_delay=0.01)
+
+    def tearDown(self):
+        self.supervisor.stop_all(timeout=2)
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def wait_for(self, condition, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Condition not reached in time")
+            time.sleep(0.02)
+
+    def test_services_run_side_by_side_with_bounded_output(self):
+        with patch("src.integration.service_supervisor.get_config", lambda key, default: 5 if key == "service_output_lines" else default):
+            first = self.supervisor.start("first", self.tmp.name, python("for i in range(20): print('first', i)"))
+        second = self.supervisor.start("second", self.tmp.name, python("import time; print('up', flush=True); time.sleep(30)"))
+        self.wait_for(lambda: first.status == "exited")
+        self.assertEqual(first.tail(2), ["first 19", "--- Process finished with exit code 0 ---"])
+        self.assertEqual(len(first.tail(100)), 5)
+        self.assertEqual(first.output_since(18), (["first 18", "first 19", "--- Process finished with exit code 0 ---"], 21))
+
+        self.wait_for(lambda: second.output_seq == 1)
+        self.assertEqual(second.status, "running")
+        self.assertIs(self.supervisor.start("second", self.tmp.name, ["ignored"]), second)
+        self.assertIn("1 of 2 service(s) running", self.supervisor.format_status())
+
+    def test_on_failure_policy_gives_up_after_max_restarts(self):
+        service = self.supervisor.start("flaky", self.tmp.name, python("import sys; sys.exit(3)"), "on-failure", 2)
+        self.wait_for(lambda: not service.alive)
+        self.assertEqual((service.status, service.exit_code, service.restarts), ("failed", 3, 2))
+
+        clean = self.supervisor.start("clean", self.tmp.name, python("pass"), "on-failure", 2)
+        self.wait_for(lambda: not clean.alive)
+        self.assertEqual((clean.status, clean.restarts), ("exited", 0))
+        with self.assertRaises(ValueError):
+            self.supervisor.start("bad", self.tmp.name, python("pass"), "sometimes")
+
+    @unittest.skipUnless(os.name == "posix", "process groups are POSIX only")
+    def test_stop_terminates_the_process_group(self):
+        pid_file = os.path.join(self.tmp.name, "child.pid")
+        # Like mvn spring-boot:run, the command forks the process that does the work
+        code = (
+            "import subprocess, sys, time\n"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+            f"open({pid_file!r}, 'w').write(str(child.pid))\n"
+            "print('started', flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        service = self.supervisor.start("stack", self.tmp.name, python(code), "always")
+        self.wait_for(lambda: service.output_seq >= 1)
+        with open(pid_file) as f:
+            child_pid = int(f.read())
+        self.assertTrue(self.supervisor.stop("stack", timeout=5))
+        self.assertEqual(service.status, "stopped")
+        self.assertEqual(service.restarts, 0)
+        self.wait_for(lambda: not _alive(child_pid))
+        self.assertFalse(self.supervisor.stop("stack"))
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A zombie child is reaped by init once its parent is gone
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+if __name__ == '__main__':
+    unittest.main()
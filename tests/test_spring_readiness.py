@@ -0,0 +1,61 @@
+import http.server
+import json
+import socket
+import threading
+import unittest
+from src.integration.maven.spring_readiness import SpringBootReadiness
+
+class HealthHandler(http.server.BaseHTTPRequestHandler):
+    status = "DOWN"
+
+    def do_GET(self):
+        code = 200 if HealthHandler.status == "UP" else 503
+        body = json.dumps({"status": HealthHandler.status}).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestSpringReadiness(unittest.TestCase):
+
+    def test_feed_detects_startup_and_port(self):
+        readiness = SpringBootReadiness(probe="none")
+        self.assertFalse(readiness.feed("2024-05-01 INFO o.s.b.w.e.tomcat.TomcatWebServer : Tomcat started on port(s): 8081 (http) with context path ''"))
+        self.assertTrue(readiness.feed("INFO c.e.DemoApplication : Started DemoApplication in 4.321 seconds (process running for 5.1)"))
+        self.assertEqual((readiness.port, readiness.application, readiness.reported_seconds), (8081, "DemoApplication", 4.321))
+        readiness.reset()
+        self.assertIsNone(readiness.port)
+        readiness.feed("Netty started on port 9090 (http)")
+        self.assertEqual(readiness.port, 9090)
+        with self.assertRaises(ValueError):
+            SpringBootReadiness(probe="ping")
+
+    def test_port_probe(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        readiness = SpringBootReadiness(probe="port", timeout=0.5)
+        readiness.feed(f"Tomcat started on port {port} (http)")
+        self.assertTrue(readiness.confirm())
+        server.close()
+        self.assertFalse(readiness.confirm())
+
+    def test_actuator_probe_waits_for_up(self):
+        server = http.server.HTTPServer(("127.0.0.1", 0), HealthHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            readiness = SpringBootReadiness(probe="actuator", port=server.server_address[1], timeout=0.3)
+            HealthHandler.status = "DOWN"
+            self.assertFalse(readiness.confirm())
+            HealthHandler.status = "UP"
+            self.assertTrue(readiness.confirm())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
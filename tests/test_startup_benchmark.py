@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.core.startup_history import StartupHistory, startup_stats
+from src.processor import startup_benchmark
+from src.processor.startup_benchmark import benchmark_start
+from src.utils.logger_setup import logger_setup
+
+# Stands in for 'mvn spring-boot:run': serves a port, then logs like Spring Boot
+FAKE_APP = (
+    "import socket, sys, time\n"
+    "server = socket.socket(); server.bind(('127.0.0.1', 0)); server.listen()\n"
+    "print('Tomcat started on port %d (http)' % server.getsockname()[1], flush=True)\n"
+    "print('Started FakeApplication in 0.05 seconds (process running for 0.1)', flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+class TestStartupBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project_path = os.path.join(self.tmp.name, "fake-service")
+        os.makedirs(self.project_path)
+        self.history = StartupHistory(os.path.join(self.tmp.name, "startup_history.json"))
+        # The benchmark logs as fake-service, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        patches = [
+            patch("src.integration.maven.maven_client.springboot_run_command", lambda: [sys.executable, "-c", FAKE_APP]),
+            patch("src.integration.maven.maven_client.startup_history", self.history),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_startup_stats(self):
+        stats = startup_stats([5.0, 1.0, 3.0, 2.0, 4.0])
+        self.assertEqual((stats["median"], stats["p95"], stats["min"], stats["max"]), (3.0, 5.0, 1.0, 5.0))
+        self.assertEqual(startup_stats(range(1, 101))["p95"], 95)
+        self.assertIsNone(startup_stats([])["median"])
+
+    def test_benchmark_measures_every_run_and_records_history(self):
+        progress = []
+        benchmark = benchmark_start(self.project_path, runs=3, timeout=20, on_progress=progress.append)
+        self.assertEqual(len(benchmark.durations), 3, benchmark.failures)
+        self.assertEqual(benchmark.reported, [0.05] * 3)
+        self.assertEqual(len(progress), 3)
+        self.assertIn("median", benchmark.format())
+        self.assertFalse(startup_benchmark.service_supervisor.get("fake-service").alive)
+
+        runs = StartupHistory(self.history.history_path).runs("fake-service")
+        self.assertEqual([run["reported_seconds"] for run in runs], [0.05] * 3)
+        self.assertEqual(self.history.stats("fake-service", last=2)["count"], 2)
+
+    def test_benchmark_waits_for_the_history_write(self):
+        record_service = self.history.record_service
+
+        def slow_record(service):
+            time.sleep(0.3)
+            record_service(service)
+
+        with patch.object(self.history, "record_service", slow_record), \
+                patch("src.integration.maven.maven_client.startup_history", self.history):
+            benchmark = benchmark_start(self.project_path, runs=2, timeout=20)
+        self.assertEqual(len(benchmark.durations), 2, benchmark.failures)
+        self.assertEqual(self.history.stats("fake-service")["count"], 2)
+
+    def test_failed_start_is_reported(self):
+        with patch("src.integration.maven.maven_client.springboot_run_command",
+                   lambda: [sys.executable, "-c", "import sys; sys.exit(1)"]):
+            benchmark = benchmark_start(self.project_path, runs=1, timeout=20)
+        self.assertEqual(benchmark.failures, ["run 1: exited with code 1"])
+        self.assertEqual(self.history.runs("fake-service"), [])
+
+    def test_failed_readiness_probe_is_reported_at_once(self):
+        with patch("src.integration.maven.spring_readiness.SpringBootReadiness.confirm", return_value=False):
+            started = time.monotonic()
+            benchmark = benchmark_start(self.project_path, runs=1, timeout=20)
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(benchmark.failures, ["run 1: failed the readiness probe"])
+        self.assertEqual(self.history.runs("fake-service"), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from unittest.mock import patch
+from src.processor.update_all import build_report, run_update_all, run_update_all_reactor, summarize_results
+from src.utils.logger_setup import logger_setup
+
+class TestUpdateAll(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # The runs log as the projects under /ws, into the temp folder instead of the repository's logs/
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_run_update_all_collects_results_in_order(self):
+        projects_map = {"a": "/ws/a", "b": "/ws/b", "c": "/ws/c"}
+
+        def update_flow(project_path):
+            if project_path.endswith("c"):
+                raise RuntimeError("boom")
+            return project_path.endswith("a")
+
+        results = run_update_all(projects_map, max_workers=2, update_flow=update_flow)
+        self.assertEqual([r.project_name for r in results], ["a", "b", "c"])
+        self.assertEqual([r.status for r in results], ["success", "failed", "error"])
+        self.assertEqual(results[2].error, "boom")
+        self.assertEqual(summarize_results(results), {"success": 1, "failed": 1, "error": 1, "skipped": 0})
+
+    def test_run_update_all_respects_worker_limit(self):
+        projects_map = {f"p{i}": f"/ws/p{i}" for i in range(8)}
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def update_flow(project_path):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return True
+
+        results = run_update_all(projects_map, max_workers=3, update_flow=update_flow)
+        self.assertTrue(all(r.success for r in results))
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreater(peak[0], 1)
+
+    def test_run_update_all_skips_when_stopped(self):
+        stop_event = threading.Event()
+        stop_event.set()
+        results = run_update_all({"a": "/ws/a"}, max_workers=1, stop_event=stop_event, update_flow=lambda p: True)
+        self.assertEqual(results[0].status, "skipped")
+
+    def test_quick_update_steps_are_reported(self):
+        with patch("src.processor.process.git_flow_start", return_value=object()), \
+                patch("src.processor.process.mvn_quick_update_flow", return_value=True), \
+                patch("src.processor.process.has_dependency_conflict", side_effect=[True, False]), \
+                patch("src.processor.process.git_flow_finish", return_value=True):
+            results = run_update_all({"a": "/ws/a", "b": "/ws/b"}, max_workers=1)
+        self.assertEqual([step.name for step in results[0].steps],
+                         ["git_flow_start", "maven_update", "dependency_check", "git_flow_finish"])
+        self.assertEqual([(step.name, step.status) for step in results[1].steps][-1], ("dependency_check", "failed"))
+
+        report = build_report(results, 1000.0, 1012.5, "per-project", 1)
+        self.assertEqual(report["duration"], 12.5)
+        self.assertEqual(report["summary"]["failed"], 1)
+        self.assertEqual(report["projects"][0]["project_name"], "a")
+        self.assertEqual(report["projects"][1]["steps"][2]["status"], "failed")
+
+    def test_reactor_run_records_shared_steps(self):
+        class Outcome:
+            def __init__(self, success):
+                self.success, self.status, self.output = success, "ok" if success else "failed", ""
+
+        def run_reactor(paths, goals, output_files=()):
+            return {path: Outcome(not path.endswith("b")) for path in paths}
+
+        cache = unittest.mock.Mock()
+        cache.get.return_value = None
+        with patch("src.processor.update_all.git_flow_start", return_value=object()), \
+                patch("src.processor.update_all.run_reactor", side_effect=run_reactor), \
+                patch("src.processor.update_all.conflict_cache", cache), \
+                patch("src.processor.update_all.check_dependency_tree_file", return_value=True), \
+                patch("src.processor.update_all.git_flow_finish", return_value=True):
+            results = run_update_all_reactor({"a": "/ws/a", "b": "/ws/b"}, max_workers=2)
+        self.assertEqual([r.status for r in results], ["success", "failed"])
+        self.assertEqual([(step.name, step.status) for step in results[0].steps], [
+            ("git_flow_start", "success"), ("maven_update", "success"),
+            ("dependency_check", "success"), ("git_flow_finish", "success"),
+        ])
+        self.assertEqual([(step.name, step.status) for step in results[1].steps][-1], ("maven_update", "failed"))
+
+    def test_reactor_run_skips_the_remaining_phases_after_stop(self):
+        stop_event = threading.Event()
+        goals_run = []
+
+        def run_reactor(paths, goals, output_files=()):
+            if paths:  # Without projects run_reactor returns at once
+                goals_run.append(goals)
+            stop_event.set()  # Stop pressed during the versions update
+            return {path: unittest.mock.Mock(success=True, status="SUCCESS", output="") for path in paths}
+
+        with patch("src.processor.update_all.git_flow_start", return_value=object()), \
+                patch("src.processor.update_all.run_reactor", side_effect=run_reactor), \
+                patch("src.processor.update_all.git_flow_finish", return_value=True) as finish:
+            results = run_update_all_reactor({"a": "/ws/a", "b": "/ws/b"}, max_workers=2, stop_event=stop_event)
+        self.assertEqual([r.status for r in results], ["skipped", "skipped"])
+        self.assertEqual(len(goals_run), 1)
+        finish.assert_not_called()
+
+    def test_reactor_checks_the_tree_of_every_module(self):
+        def tree(artifact_id, lib_version):
+            return json.dumps({"groupId": "g", "artifactId": artifact_id, "version": "1", "children": [
+                {"groupId": "x", "artifactId": "lib", "version": lib_version, "children": []},
+            ]})
+
+        def run(written_versions, stale=False):
+            with tempfile.TemporaryDirectory() as tmp:
+                project = os.path.join(tmp, "svc")
+                for folder, modules in ((project, "<modules><module>core</module><module>api</module></modules>"),
+                                        (os.path.join(project, "core"), ""), (os.path.join(project, "api"), "")):
+                    os.makedirs(os.path.join(folder, "target"))
+                    with open(os.path.join(folder, "pom.xml"), "w") as f:
+                        f.write(f"<project><artifactId>{os.path.basename(folder)}</artifactId>{modules}</project>")
+                stale_tree = os.path.join(project, "api", "target", "reporanger-dependency-tree.json")
+                if stale:
+                    with open(stale_tree, "w") as f:
+                        f.write(tree("api", "1.0"))
+
+                def run_reactor(paths, goals, output_files=()):
+                    # Maven writes a tree per module, the ones without a version are skipped
+                    for tree_file, version in zip(output_files, written_versions):
+                        if version:
+                            with open(tree_file, "w") as f:
+                                f.write(tree("m", version))
+                    return {path: unittest.mock.Mock(success=True, status="SUCCESS", output="") for path in paths}
+
+                cache = unittest.mock.Mock()
+                cache.get.return_value = None
+                with patch("src.processor.update_all.git_flow_start", return_value=object()), \
+                        patch("src.processor.update_all.run_reactor", side_effect=run_reactor), \
+                        patch("src.processor.update_all.conflict_cache", cache), \
+                        patch("src.processor.update_all.git_flow_finish", return_value=True):
+                    status = run_update_all_reactor({"svc": project}, max_workers=1)[0].status
+                return status, os.path.exists(stale_tree)
+
+        self.assertEqual(run(["1.0", "1.0", "1.0"]), ("success", True))
+        # Only the api module pulls in another version
+        self.assertEqual(run(["1.0", "1.0", "2.0"]), ("failed", True))
+        # Maven skipped api: its tree of the earlier run is not parsed
+        self.assertEqual(run(["1.0", "1.0", None], stale=True), ("failed", False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from src.integration.maven.local_repository import available_versions, clear_versions_cache, compare_versions, newer_releases
+from src.integration.maven.update_planner import format_update_plan, plan_project_updates, plan_workspace_updates
+from src.utils.logger_setup import logger_setup
+
+POM = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <parent>
+    <groupId>org.springframework.boot</groupId>
+    <artifactId>spring-boot-starter-parent</artifactId>
+    <version>3.1.0</version>
+  </parent>
+  <artifactId>svc-a</artifactId>
+  <properties>
+    <jackson.version>2.15.0</jackson.version>
+  </properties>
+  <dependencyManagement>
+    <dependencies>
+      <dependency>
+        <groupId>com.fasterxml.jackson.core</groupId>
+        <artifactId>jackson-core</artifactId>
+        <version>${jackson.version}</version>
+      </dependency>
+      <dependency>
+        <groupId>com.fasterxml.jackson.core</groupId>
+        <artifactId>jackson-databind</artifactId>
+        <version>${jackson.version}</version>
+      </dependency>
+    </dependencies>
+  </dependencyManagement>
+  <dependencies>
+    <dependency>
+      <groupId>org.apache.commons</groupId>
+      <artifactId>commons-lang3</artifactId>
+      <version>3.12.0</version>
+    </dependency>
+    <dependency>
+      <groupId>com.google.guava</groupId>
+      <artifactId>guava</artifactId>
+      <version>[30,)</version>
+    </dependency>
+    <dependency>
+      <groupId>org.springframework.boot</groupId>
+      <artifactId>spring-boot-starter-web</artifactId>
+    </dependency>
+  </dependencies>
+</project>
+"""
+
+METADATA = """<?xml version="1.0" encoding="UTF-8"?>
+<metadata>
+  <versioning>
+    <versions>
+{versions}
+    </versions>
+  </versioning>
+</metadata>
+"""
+
+class TestUpdatePlanner(unittest.TestCase):
+
+    def setUp(self):
+        clear_versions_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+        self.repository = os.path.join(self.tmp.name, "repository")
+        self.project = os.path.join(self.tmp.name, "svc-a")
+        os.makedirs(self.project)
+        with open(os.path.join(self.project, "pom.xml"), "w") as f:
+            f.write(POM)
+
+        self._metadata("org.springframework.boot", "spring-boot-starter-parent", ["3.1.0", "3.1.5", "3.2.0-RC1", "3.2.0"])
+        self._metadata("com.fasterxml.jackson.core", "jackson-core", ["2.15.0", "2.15.2", "2.16.0"])
+        self._metadata("com.fasterxml.jackson.core", "jackson-databind", ["2.15.0", "2.15.2"])
+        self._metadata("org.apache.commons", "commons-lang3", ["3.12.0", "3.13.0", "3.14.0"])
+        self._metadata("com.google.guava", "guava", ["30.0-jre", "33.0.0-jre"])
+
+    def tearDown(self):
+        clear_versions_cache()
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def _metadata(self, group_id, artifact_id, versions, name="maven-metadata-central.xml"):
+        directory = os.path.join(self.repository, *group_id.split("."), artifact_id)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, name), "w") as f:
+            f.write(METADATA.format(versions="\n".join(f"      <version>{v}</version>" for v in versions)))
+
+    def test_compare_versions(self):
+        self.assertEqual(compare_versions("1.0", "1.0.0"), 0)
+        self.assertLess(compare_versions("1.0-RC1", "1.0"), 0)
+        self.assertLess(compare_versions("1.1-SNAPSHOT", "1.1"), 0)
+        self.assertLess(compare_versions("2.15.2", "2.15.10"), 0)
+        self.assertGreater(compare_versions("1.0-sp1", "1.0"), 0)
+        self.assertEqual(compare_versions("6.0.0.Final", "6.0.0"), 0)
+
+    def test_metadata_files_are_merged(self):
+        self._metadata("org.apache.commons", "commons-lang3", ["3.15.0"], name="maven-metadata-nexus.xml")
+        self.assertEqual(available_versions("org.apache.commons", "commons-lang3", self.repository),
+                         ["3.12.0", "3.13.0", "3.14.0", "3.15.0"])
+        self.assertEqual(newer_releases("org.springframework.boot", "spring-boot-starter-parent", "3.1.0", self.repository),
+                         ["3.1.5", "3.2.0"])
+
+    def test_plan_project_updates(self):
+        candidates = plan_project_updates("svc-a", self.project, self.repository)
+        by_kind = {(c.kind, c.property or c.artifact): c for c in candidates}
+
+        self.assertEqual(by_kind[("parent", "org.springframework.boot:spring-boot-starter-parent")].latest, "3.2.0")
+        self.assertEqual(by_kind[("dependency", "org.apache.commons:commons-lang3")].latest, "3.14.0")
+        # The shared property only moves to a version released for both artifacts
+        self.assertEqual(by_kind[("property", "jackson.version")].latest, "2.15.2")
+        # Ranges and versions managed elsewhere are not planned
+        self.assertEqual(len(candidates), 3)
+
+    def test_plan_does_not_modify_pom(self):
+        plan_project_updates("svc-a", self.project, self.repository)
+        with open(os.path.join(self.project, "pom.xml")) as f:
+            self.assertEqual(f.read(), POM)
+
+    def test_workspace_plan_summary(self):
+        plans = plan_workspace_updates({"svc-a": self.project, "missing": os.path.join(self.tmp.name, "missing")}, self.repository)
+        self.assertEqual(list(plans), ["svc-a", "missing"])
+        self.assertEqual(plans["missing"], [])
+        text = format_update_plan(plans)
+        self.assertIn("svc-a: 3 upgrade(s) available", text)
+        self.assertIn("Workspace: 3 upgrade(s) in 1 project(s)", text)
+
+if __name__ == '__main__':
+    unittest.main()
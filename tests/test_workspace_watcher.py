@@ -0,0 +1,57 @@
+import os
+import queue
+import tempfile
+import unittest
+from src.core.project_index import ProjectIndex
+from src.core.workspace_watcher import WorkspaceWatcher, diff_projects
+from src.utils.logger_setup import logger_setup
+
+class TestWorkspaceWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous_log_dir = logger_setup.use_log_dir(os.path.join(self.tmp.name, "logs"))
+
+    def tearDown(self):
+        logger_setup.use_log_dir(self.previous_log_dir)
+        self.tmp.cleanup()
+
+    def test_diff_projects(self):
+        old = {
+            "a": {"path": "/ws/a", "pom_hash": "1"},
+            "b": {"path": "/ws/b", "pom_hash": "1"},
+            "c": {"path": "/ws/c", "pom_hash": "1"},
+        }
+        new = {
+            "a": {"path": "/ws/a", "pom_hash": "1"},
+            "b": {"path": "/ws/b", "pom_hash": "2"},
+            "d": {"path": "/ws/d", "pom_hash": "1"},
+        }
+        events = [(e.kind, e.name) for e in diff_projects(old, new)]
+        self.assertEqual(events, [("removed", "c"), ("modified", "b"), ("added", "d")])
+
+    def test_watcher_reports_new_and_removed_projects(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, "ws")
+            os.makedirs(os.path.join(base, "svc-a"))
+            open(os.path.join(base, "svc-a", "pom.xml"), "w").close()
+            options = {"base_path": base, "prefix": "", "exclude": [".*"], "max_depth": 0, "stop_at_project_root": True}
+
+            events = queue.Queue()
+            watcher = WorkspaceWatcher(events.put, ProjectIndex(os.path.join(tmp, "index.json")),
+                                       options=options, poll_interval=0.1, debounce=0.05)
+            watcher.start()
+            try:
+                self.assertEqual([(e.kind, e.name) for e in events.get(timeout=5)], [("added", "svc-a")])
+
+                os.makedirs(os.path.join(base, "svc-b"))
+                open(os.path.join(base, "svc-b", "pom.xml"), "w").close()
+                self.assertEqual([(e.kind, e.name) for e in events.get(timeout=5)], [("added", "svc-b")])
+
+                os.remove(os.path.join(base, "svc-a", "pom.xml"))
+                self.assertEqual([(e.kind, e.name) for e in events.get(timeout=5)], [("removed", "svc-a")])
+            finally:
+                watcher.stop()
+
+if __name__ == '__main__':
+    unittest.main()